@@ -0,0 +1,186 @@
+"""
+Benchmark DataManager.replace_products_for_project on a synthetic job.
+
+Three comparisons are reported:
+  - pragmas: legacy SQLite settings (rollback journal, synchronous=FULL) against the
+    default pragma profile from Settings (WAL, synchronous=NORMAL, larger cache, mmap).
+  - write path: the previous per-row ORM add/flush implementation (kept here as a
+    reference) against the batched executemany path in DataManager.
+  - resave: saving the same job again with a single quantity edit; the differential
+    save only writes the changed row.
+
+Run from the repository root:
+    python -m benchmarks.bench_replace_products --products 10000 --repeat 3
+"""
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
+
+from mmx_engineering_spec_manager.data_manager import manager as manager_mod  # noqa: E402
+from mmx_engineering_spec_manager.data_manager.manager import DataManager  # noqa: E402
+from mmx_engineering_spec_manager.db_models.custom_field import CustomField  # noqa: E402
+from mmx_engineering_spec_manager.db_models.location import Location  # noqa: E402
+from mmx_engineering_spec_manager.db_models.product import Product  # noqa: E402
+from mmx_engineering_spec_manager.utilities.persistence import (  # noqa: E402
+    SqliteEngineRegistry,
+    SqlitePragmaProfile,
+    get_engine_and_sessionmaker_for_sqlite_path,
+    reset_sqlite_engine_registry,
+)
+
+LEGACY_PROFILE = SqlitePragmaProfile(
+    journal_mode="DELETE",
+    synchronous="FULL",
+    cache_size=-2000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout=0,
+)
+
+
+def make_products(n: int, locations: int = 20) -> List[dict]:
+    """Build n product dicts shaped like ProductsService/Innergy output."""
+    out: List[dict] = []
+    for i in range(n):
+        out.append({
+            "name": f"Base Cabinet {i}",
+            "quantity": 1 + i % 3,
+            "description": "Synthetic product",
+            "location": f"Room {i % locations}",
+            "width": 24.0 + (i % 12),
+            "height": 34.5,
+            "depth": 24.0,
+            "x_origin": float(i % 200) * 10.0,
+            "y_origin": 0.0,
+            "z_origin": 0.0,
+            "item_number": f"{i + 1}",
+            "comment": "ADA" if i % 50 == 0 else "",
+            "custom_fields": [
+                {"name": "Finish", "value": "PL1"},
+                {"name": "Hardware", "value": "HW-12"},
+            ],
+        })
+    return out
+
+
+def legacy_replace_products(db_path: str, project_id: int, products: List[dict]) -> bool:
+    """Reference copy of the pre-bulk implementation: one add + flush per product/location."""
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    sess = Session()
+    try:
+        prod_ids = [r[0] for r in sess.query(Product.id).filter_by(project_id=project_id).all()]
+        if prod_ids:
+            sess.query(CustomField).filter(CustomField.product_id.in_(prod_ids)).delete(synchronize_session=False)
+        sess.query(Product).filter_by(project_id=project_id).delete(synchronize_session=False)
+        name_to_loc = {(l.name or "").strip(): l for l in sess.query(Location).filter_by(project_id=project_id).all()}
+        for d in products:
+            prod = Product(name=d.get("name") or "", quantity=d.get("quantity"), project_id=project_id)
+            prod.width, prod.height, prod.depth = d.get("width"), d.get("height"), d.get("depth")
+            prod.x_origin_from_right = d.get("x_origin")
+            prod.y_origin_from_face = d.get("y_origin")
+            prod.z_origin_from_bottom = d.get("z_origin")
+            key = (d.get("location") or "").strip()
+            if key:
+                loc = name_to_loc.get(key)
+                if loc is None:
+                    loc = Location(name=key, project_id=project_id)
+                    sess.add(loc)
+                    sess.flush()
+                    name_to_loc[key] = loc
+                prod.location_id = loc.id
+            sess.add(prod)
+            sess.flush()
+            for cf in d.get("custom_fields") or []:
+                sess.add(CustomField(name=cf.get("name") or "", value=cf.get("value"), product_id=prod.id))
+            for name, key in (("ItemNumber", "item_number"), ("Comment", "comment")):
+                v = d.get(key)
+                if v is not None and v != "":
+                    sess.add(CustomField(name=name, value=v, product_id=prod.id))
+        sess.commit()
+        return True
+    finally:
+        sess.close()
+
+
+def _time(fn: Callable[[], object], repeat: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run(
+    n_products: int,
+    repeat: int,
+    profiles: Dict[str, SqlitePragmaProfile],
+    writer: Callable[[DataManager, str, List[dict]], object] | None = None,
+) -> Dict[str, List[float]]:
+    """Time a product save once per profile; writer defaults to DataManager.replace_products_for_project."""
+    products = make_products(n_products)
+    write = writer or (lambda dm, db_path, prods: dm.replace_products_for_project(1, prods))
+    results: Dict[str, List[float]] = {}
+    original_path_fn = manager_mod.project_sqlite_db_path
+    try:
+        for label, profile in profiles.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                db_path = os.path.join(tmp, "BENCH.db")
+                manager_mod.project_sqlite_db_path = lambda project, _p=db_path: _p
+                reset_sqlite_engine_registry(SqliteEngineRegistry(pragmas=profile))
+                dm = DataManager()
+                dm.prepare_project_db(type("_P", (), {"id": 1, "number": "BENCH"})())
+                results[label] = _time(lambda: write(dm, db_path, products), repeat)
+                reset_sqlite_engine_registry()
+    finally:
+        manager_mod.project_sqlite_db_path = original_path_fn
+    return results
+
+
+def _report(title: str, results: Dict[str, List[float]]) -> None:
+    print(title)
+    baseline = None
+    for label, samples in results.items():
+        best = min(samples)
+        med = statistics.median(samples)
+        baseline = baseline or best
+        print(f"  {label:<10} best {best * 1000:9.1f} ms  median {med * 1000:9.1f} ms  x{baseline / best:5.2f}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    profiles = {"legacy": LEGACY_PROFILE, "default": SqlitePragmaProfile()}
+    _report(f"pragmas: replace_products_for_project, {args.products} products", run(args.products, args.repeat, profiles))
+    default_only = {"default": SqlitePragmaProfile()}
+    by_path = {
+        "orm-rows": run(args.products, args.repeat, default_only, lambda dm, db, prods: legacy_replace_products(db, 1, prods))["default"],
+        "bulk": run(args.products, args.repeat, default_only)["default"],
+    }
+    _report(f"write path: {args.products} products", by_path)
+
+    def _resave_one_edit(dm: DataManager, db: str, prods: List[dict]) -> object:
+        dm.replace_products_for_project(1, prods)
+        edited = [dict(p) for p in prods]
+        edited[len(edited) // 2]["quantity"] = 99
+        t0 = time.perf_counter()
+        dm.replace_products_for_project(1, edited)
+        resave.append(time.perf_counter() - t0)
+
+    resave: List[float] = []
+    run(args.products, args.repeat, default_only, _resave_one_edit)
+    _report(f"resave: {args.products} products, one edit", {"full-save": by_path["bulk"], "diff": resave})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
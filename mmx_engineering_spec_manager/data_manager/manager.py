@@ -1,9 +1,12 @@
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
 
 from PySide6.QtCore import QStandardPaths
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, create_engine, func, insert, or_, select, update
+from sqlalchemy.orm import selectinload, sessionmaker
 
 from mmx_engineering_spec_manager.db_models.appliance_callout import \
     ApplianceCallout
@@ -21,37 +24,308 @@ from mmx_engineering_spec_manager.db_models.specification_group import Specifica
 from mmx_engineering_spec_manager.db_models.wall import Wall
 from mmx_engineering_spec_manager.db_models.wizard_prompts import WizardPrompts
 from mmx_engineering_spec_manager.db_models.location_table_callout import LocationTableCallout
+from mmx_engineering_spec_manager.dtos.product_batch import ProductBatch
+from mmx_engineering_spec_manager.dtos.product_save_dto import ProductSaveStats
+from mmx_engineering_spec_manager.dtos.project_snapshot import (
+    CustomFieldSnapshot,
+    LocationSnapshot,
+    ProductColumns,
+    ProductSnapshot,
+    ProjectSnapshot,
+    SpecificationGroupSnapshot,
+    WallSnapshot,
+)
 from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
-from mmx_engineering_spec_manager.mappers.innergy_mapper import map_project_payload_to_dto, map_products_payload_to_dtos
-from mmx_engineering_spec_manager.utilities.persistence import create_engine_and_sessionmaker, project_sqlite_db_path, create_engine_and_sessionmaker_for_sqlite_path
+from mmx_engineering_spec_manager.importers.innergy_client import InnergyHTTPError, prefetch
+from mmx_engineering_spec_manager.mappers.innergy_mapper import (
+    map_project_payload_to_dto,
+    parse_budget_products,
+)
+from mmx_engineering_spec_manager.utilities.persistence import create_engine_and_sessionmaker, project_sqlite_db_path, get_engine_and_sessionmaker_for_sqlite_path, get_sqlite_engine_registry
+from mmx_engineering_spec_manager.utilities.migrations import ensure_sqlite_schema
 from mmx_engineering_spec_manager.utilities import callout_import
 from mmx_engineering_spec_manager.utilities.settings import get_settings
 from mmx_engineering_spec_manager.utilities.logging_config import get_logger
+from mmx_engineering_spec_manager.utilities.product_fingerprint import values_digest
+from .search_index import (
+    ALL_KINDS as SEARCH_KINDS,
+    KIND_CALLOUT,
+    KIND_CUSTOM_FIELD,
+    KIND_PRODUCT,
+    KIND_PROJECT,
+    collect_project_documents,
+    ensure_search_index,
+    replace_project_documents,
+    search_documents,
+)
+
+
+# Product attributes without dedicated columns, persisted as product custom fields
+_PRODUCT_EXTRA_CUSTOM_FIELDS = (
+    ("ItemNumber", "item_number"),
+    ("Comment", "comment"),
+    ("Angle", "angle"),
+    ("FileName", "file_name"),
+    ("PictureName", "picture_name"),
+)
+
+
+# Product columns compared (and rewritten) by the differential save
+_PRODUCT_DIFF_COLUMNS = (
+    "name", "quantity", "width", "height", "depth",
+    "x_origin_from_right", "y_origin_from_face", "z_origin_from_bottom",
+    "specification_group_id", "wall_id", "location_id",
+)
+
+
+def _product_identity_keys(identities):
+    """Map (item_number, name, location) triples to stable match keys.
+
+    The Innergy item number identifies a product when present; otherwise name + location
+    is used. Repeated keys get an occurrence ordinal so duplicates pair up in order.
+    """
+    seen: dict[tuple, int] = {}
+    keys = []
+    for item_number, name, location in identities:
+        item = str(item_number).strip() if item_number not in (None, "") else ""
+        base = ("item", item) if item else ("name", name or "", (location or "").strip())
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        keys.append(base + (n,))
+    return keys
+
+
+def _values_equal(a, b) -> bool:
+    """Loose equality for DB vs incoming values (SQLite affinity may turn 2 into '2' or 2.0)."""
+    if a == b:
+        return True
+    if a is None or b is None:
+        return False
+    try:
+        return float(a) == float(b)
+    except (TypeError, ValueError):
+        return str(a) == str(b)
+
+
+def _normalized_cfs(cfs):
+    return sorted((n or "", None if v is None else str(v)) for n, v in cfs)
+
+
+def _chunks(ids, size: int = 500):
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def _full_project_load_options():
+    """Loader options that fetch a project's whole graph up front.
+
+    Each selectinload issues one "WHERE parent_id IN (...)" query per relationship, so a
+    project loads in a fixed number of SELECTs however many products it has, and every
+    attribute the views read is populated before the instance is detached.
+    """
+    products = selectinload(Project.products)
+    global_prompts = selectinload(Project.global_prompts)
+    wizard_prompts = selectinload(Project.wizard_prompts)
+    return (
+        selectinload(Project.locations).selectinload(Location.walls),
+        products.selectinload(Product.custom_fields),
+        products.selectinload(Product.prompts),
+        products.selectinload(Product.location),
+        products.selectinload(Product.wall),
+        products.selectinload(Product.specification_group),
+        selectinload(Project.walls),
+        selectinload(Project.custom_fields),
+        global_prompts.selectinload(GlobalPrompts.prompts),
+        global_prompts.selectinload(GlobalPrompts.specification_group),
+        wizard_prompts.selectinload(WizardPrompts.prompts),
+        wizard_prompts.selectinload(WizardPrompts.specification_group),
+    )
+
+
+# Incoming product attributes read by the differential save (ProductBatch column names)
+_INCOMING_PRODUCT_FIELDS = (
+    "name", "quantity", "location", "width", "height", "depth", "x_origin", "y_origin", "z_origin",
+    "link_id_specification_group", "link_id_wall",
+)
+
+
+def _iter_incoming_products(products):
+    """Yield (values per _INCOMING_PRODUCT_FIELDS, custom field pairs) for each product to save.
+
+    A ProductBatch is read straight from its columns; dicts and DTOs attribute by attribute.
+    The custom field pairs include the extra attributes persisted as custom fields.
+    """
+    if isinstance(products, ProductBatch):
+        columns = [getattr(products, f) for f in _INCOMING_PRODUCT_FIELDS]
+        extras = [(cf_name, getattr(products, key)) for cf_name, key in _PRODUCT_EXTRA_CUSTOM_FIELDS]
+        for i, values in enumerate(zip(*columns)):
+            cfs = [(n or "", v) for n, v in products.custom_fields_of(i)]
+            cfs.extend((cf_name, col[i]) for cf_name, col in extras if col[i] is not None and col[i] != "")
+            yield values, cfs
+        return
+    for d in products:
+        get = d.get if isinstance(d, dict) else (lambda key, _d=d: getattr(_d, key, None))
+        values = tuple(map(get, _INCOMING_PRODUCT_FIELDS))
+        # Custom fields (existing custom fields from payload)
+        cfs = []
+        for cf in (get('custom_fields') or []):
+            cf_name = getattr(cf, 'name', None) if not isinstance(cf, dict) else cf.get('name')
+            cf_val = getattr(cf, 'value', None) if not isinstance(cf, dict) else cf.get('value')
+            cfs.append((cf_name or "", cf_val))
+        # Persist extra attributes without dedicated columns as product custom fields
+        for cf_name, key in _PRODUCT_EXTRA_CUSTOM_FIELDS:
+            v = get(key)
+            if v is not None and v != "":
+                cfs.append((cf_name, v))
+        yield values, cfs
+
+
+def _int_or_none(value):
+    try:
+        return int(value) if value is not None else None
+    except Exception:
+        return None
+
+
+# Geometry columns the workspace editor may write
+_WORKSPACE_PRODUCT_COLUMNS = frozenset({"x_origin_from_right", "y_origin_from_face", "z_origin_from_bottom"})
+_WORKSPACE_WALL_COLUMNS = frozenset({
+    "width", "height", "depth", "x_origin", "y_origin", "z_origin", "angle", "thicknesses",
+})
+
+_WALL_SNAPSHOT_COLUMNS = (
+    Wall.id, Wall.link_id, Wall.location_id, Wall.width, Wall.height, Wall.depth,
+    Wall.x_origin, Wall.y_origin, Wall.z_origin, Wall.angle, Wall.thicknesses,
+)
+
+_PRODUCT_SNAPSHOT_COLUMNS = (
+    Product.id, Product.name, Product.quantity, Product.width, Product.height, Product.depth,
+    Product.x_origin_from_right, Product.y_origin_from_face, Product.z_origin_from_bottom,
+    Product.location_id, Product.wall_id, Product.specification_group_id,
+)
+
+
+def _load_project_snapshot(conn, project_id: int):
+    """Read a project's hierarchy with Core SELECTs into a ProjectSnapshot (None if missing).
+
+    Six queries regardless of size; rows go straight into tuples without creating ORM
+    instances or an identity map.
+    """
+    head = conn.execute(
+        select(Project.id, Project.number, Project.name, Project.job_description, Project.job_address)
+        .where(Project.id == project_id)
+    ).first()
+    if head is None:
+        return None
+    locations = tuple(
+        LocationSnapshot(r.id, r.name or "")
+        for r in conn.execute(select(Location.id, Location.name).where(Location.project_id == project_id).order_by(Location.id))
+    )
+    walls = tuple(
+        WallSnapshot(*r)
+        for r in conn.execute(select(*_WALL_SNAPSHOT_COLUMNS).where(Wall.project_id == project_id).order_by(Wall.id))
+    )
+    # Custom fields: product-level ones grouped by product, project-level ones kept apart
+    product_cfs: dict[int, list] = {}
+    project_cfs = []
+    cf_rows = conn.execute(
+        select(CustomField.product_id, CustomField.name, CustomField.value)
+        .where((CustomField.project_id == project_id) | CustomField.product_id.in_(
+            select(Product.id).where(Product.project_id == project_id).scalar_subquery()
+        ))
+        .order_by(CustomField.id)
+    )
+    for product_id, name, value in cf_rows:
+        cf = CustomFieldSnapshot(name or "", value)
+        if product_id is None:
+            project_cfs.append(cf)
+        else:
+            product_cfs.setdefault(product_id, []).append(cf)
+    prod_rows = conn.execute(
+        select(*_PRODUCT_SNAPSHOT_COLUMNS).where(Product.project_id == project_id).order_by(Product.id)
+    )
+    products = ProductColumns.from_rows(
+        tuple(r) + (tuple(product_cfs.get(r[0], ())),) for r in prod_rows
+    )
+    sg_ids = sorted({i for i in products.specification_group_id if i is not None})
+    groups = []
+    for chunk in _chunks(sg_ids):
+        groups.extend(
+            SpecificationGroupSnapshot(r.id, r.name or "")
+            for r in conn.execute(select(SpecificationGroup.id, SpecificationGroup.name).where(SpecificationGroup.id.in_(chunk)))
+        )
+    groups.sort(key=lambda g: (g.name.lower(), g.id))
+    return ProjectSnapshot(
+        id=head.id,
+        number=head.number,
+        name=head.name,
+        job_description=head.job_description,
+        job_address=head.job_address,
+        locations=locations,
+        walls=walls,
+        product_columns=products,
+        custom_fields=tuple(project_cfs),
+        specification_groups=tuple(groups),
+    )
+
+
+def _workspace_locations(conn, project_id: int):
+    """Root level of the lazy workspace tree: two grouped counts, no wall or product rows."""
+    head = conn.execute(
+        select(Project.id, Project.number, Project.name, Project.job_description, Project.job_address)
+        .where(Project.id == project_id)
+    ).first()
+    if head is None:
+        return None
+    wall_counts = dict(conn.execute(
+        select(Wall.location_id, func.count(Wall.id)).where(Wall.project_id == project_id).group_by(Wall.location_id)
+    ).all())
+    locations = [
+        (LocationSnapshot(r.id, r.name or ""), int(wall_counts.pop(r.id, 0)))
+        for r in conn.execute(select(Location.id, Location.name).where(Location.project_id == project_id).order_by(Location.id))
+    ]
+    # Whatever is left belongs to no (known) location
+    unplaced = int(sum(wall_counts.values()))
+    return ProjectSnapshot(*head), locations, unplaced
+
+
+def _workspace_walls(conn, project_id: int, location_id: Optional[int]):
+    """Walls of one location with their product counts (ix_walls_location_id, ix_products_wall_id)."""
+    product_count = (
+        select(func.count(Product.id)).where(Product.wall_id == Wall.id).correlate(Wall).scalar_subquery()
+    )
+    stmt = select(*_WALL_SNAPSHOT_COLUMNS, product_count).where(Wall.project_id == project_id)
+    if location_id is None:
+        known = select(Location.id).where(Location.project_id == project_id)
+        stmt = stmt.where(or_(Wall.location_id.is_(None), Wall.location_id.not_in(known)))
+    else:
+        stmt = stmt.where(Wall.location_id == location_id)
+    return [(WallSnapshot(*r[:-1]), int(r[-1] or 0)) for r in conn.execute(stmt.order_by(Wall.id))]
+
+
+def _workspace_products(conn, project_id: int, wall_id: int):
+    rows = conn.execute(
+        select(*_PRODUCT_SNAPSHOT_COLUMNS)
+        .where(Product.wall_id == wall_id, Product.project_id == project_id)
+        .order_by(Product.id)
+    )
+    return [ProductSnapshot(*r) for r in rows]
 
 
 class DataManager:
     def __init__(self):
         # Initialize DB engine/session using centralized persistence config (supports SQLite/Postgres)
         engine, Session = create_engine_and_sessionmaker()
-        # Ensure schema exists
-        Base.metadata.create_all(engine)
-        # Run lightweight SQLite migration to add any missing product columns (safe no-op otherwise)
+        # Ensure schema exists and is current; a stamped SQLite file skips all DDL
         try:
-            from mmx_engineering_spec_manager.utilities.migrations import (
-                migrate_sqlite_products_add_missing_columns,
-                migrate_sqlite_walls_add_missing_columns,
-                migrate_sqlite_global_prompts_add_missing_columns,
-                migrate_sqlite_wizard_prompts_add_missing_columns,
-            )
-            migrate_sqlite_products_add_missing_columns(engine)
-            migrate_sqlite_walls_add_missing_columns(engine)
-            migrate_sqlite_global_prompts_add_missing_columns(engine)
-            migrate_sqlite_wizard_prompts_add_missing_columns(engine)
+            ensure_sqlite_schema(engine, Base.metadata)
         except Exception:  # pragma: no cover
-            pass
+            Base.metadata.create_all(engine)
         self.session = Session()
         # Note: per-project databases are created on demand via prepare_project_db()
         self._logger = get_logger(__name__)
+        # None: not checked yet; False: global DB cannot host the FTS5 index
+        self._search_index_ready: Optional[bool] = None
 
     def save_project(self, raw_data, session=None):
         self.create_or_update_project(raw_data, session)
@@ -150,16 +424,26 @@ class DataManager:
         importer = InnergyImporter()
         logger.info("Starting Innergy projects sync from %s", settings.innergy_base_url)
         try:
-            projects_data = importer.get_projects()
             imported = 0
-            total = len(projects_data) if projects_data else 0
+            reported = 10
+            counts = {"inserted": 0, "updated": 0, "unchanged": 0}
             if progress:
                 try:
                     progress(10)
                 except Exception:
                     pass
-            if projects_data:
-                for idx, project_data in enumerate(projects_data, start=1):
+            # Existing projects in one query: number -> (id, name, job_description)
+            existing = {
+                number: (pid, name, job_desc)
+                for pid, number, name, job_desc in db_session.execute(
+                    select(Project.id, Project.number, Project.name, Project.job_description)
+                )
+            }
+            # Stream pages: the next page downloads on a worker thread while this one is written
+            for page in prefetch(importer.iter_project_pages()):
+                total = imported + len(page)
+                rows: dict = {}
+                for project_data in page:
                     # Adapt the Innergy data to the format expected by our database models
                     # Normalize address and description safely (avoid dicts in text fields)
                     addr = project_data.get("Address")
@@ -175,17 +459,25 @@ class DataManager:
                         "name": project_data.get("Name"),
                         "job_description": job_desc,
                     }
-                    self.create_or_update_project(formatted_data, db_session)
+                    # Last occurrence of a number wins, as with the former per-row upsert
+                    rows[formatted_data["number"]] = formatted_data
                     imported += 1
-                    if progress and total > 0:
-                        try:
-                            base = 10
-                            span = 85
-                            pct = base + int(span * (idx / total))
-                            progress(min(99, pct))
-                        except Exception:
-                            pass
+                self._apply_project_rows(db_session, existing, rows.values(), counts)
+                if progress and total > 0:
+                    try:
+                        # Later pages grow the total; never report going backwards
+                        pct = min(99, 10 + int(85 * (imported / total)))
+                        if pct > reported:
+                            reported = pct
+                            progress(pct)
+                    except Exception:
+                        pass
+            if imported:
                 db_session.commit()
+            logger.info(
+                "Innergy projects sync: %d inserted, %d updated, %d unchanged",
+                counts["inserted"], counts["updated"], counts["unchanged"],
+            )
             if progress:
                 try:
                     progress(100)
@@ -197,6 +489,33 @@ class DataManager:
             logger.exception("Innergy projects sync failed: %s", e)
             raise
 
+    @staticmethod
+    def _apply_project_rows(db_session, existing: dict, rows, counts: dict) -> None:
+        """Insert new and update changed global Project rows with executemany; skip unchanged ones.
+
+        `existing` (number -> (id, name, job_description)) is updated in place. Nothing is committed.
+        """
+        inserts, updates = [], []
+        for row in rows:
+            current = existing.get(row["number"])
+            if current is None:
+                inserts.append(row)
+            elif (current[1], current[2]) != (row["name"], row["job_description"]):
+                updates.append({"id": current[0], "name": row["name"], "job_description": row["job_description"]})
+                existing[row["number"]] = (current[0], row["name"], row["job_description"])
+            else:
+                counts["unchanged"] += 1
+        if updates:
+            db_session.execute(update(Project), updates)
+            counts["updated"] += len(updates)
+        if inserts:
+            res = db_session.execute(
+                insert(Project).returning(Project.id, sort_by_parameter_order=True), inserts
+            )
+            for row, pid in zip(inserts, res.scalars().all()):
+                existing[row["number"]] = (pid, row["name"], row["job_description"])
+            counts["inserted"] += len(inserts)
+
     def get_project_by_id(self, project_id, session=None):
         db_session = session if session is not None else self.session
         return db_session.query(Project).get(project_id)
@@ -208,23 +527,12 @@ class DataManager:
         """
         try:
             db_path = project_sqlite_db_path(project)
-            engine, Session = create_engine_and_sessionmaker_for_sqlite_path(db_path)
-            # Create schema
-            Base.metadata.create_all(engine)
-            # Attempt light migrations where applicable
-            try:
-                from mmx_engineering_spec_manager.utilities.migrations import (
-                    migrate_sqlite_products_add_missing_columns,
-                    migrate_sqlite_walls_add_missing_columns,
-                    migrate_sqlite_global_prompts_add_missing_columns,
-                    migrate_sqlite_wizard_prompts_add_missing_columns,
-                )
-                migrate_sqlite_products_add_missing_columns(engine)
-                migrate_sqlite_walls_add_missing_columns(engine)
-                migrate_sqlite_global_prompts_add_missing_columns(engine)
-                migrate_sqlite_wizard_prompts_add_missing_columns(engine)
-            except Exception:
-                pass
+            engine, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+            # Create/migrate schema only once per file per process (or when the stamp is stale)
+            registry = get_sqlite_engine_registry()
+            if not registry.is_schema_ready(db_path):
+                ensure_sqlite_schema(engine, Base.metadata)
+                registry.mark_schema_ready(db_path)
             # Ensure project row exists in this DB
             sess = Session()
             try:
@@ -301,7 +609,7 @@ class DataManager:
                     p = _Tmp()
                     setattr(p, 'id', project_id)
                 db_path = self.prepare_project_db(p)
-                engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+                engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
                 db_session = Session2()
             except Exception:
                 db_session = self.session
@@ -375,7 +683,7 @@ class DataManager:
                     setattr(p, 'id', project_id)
                 # Ensure DB exists and schema ready
                 db_path = self.prepare_project_db(p)
-                engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+                engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
                 db_session = Session2()
             except Exception:
                 # Fallback to global session if anything fails
@@ -410,6 +718,8 @@ class DataManager:
             add_many(ApplianceCallout, grouped.get("Appliances"))
             # Uncategorized are not persisted until categorized
             db_session.commit()
+            if session is None and 'Session2' in locals():
+                self.refresh_search_index(project_id, (KIND_CALLOUT,))
         finally:
             try:
                 # Close only if we created a separate session
@@ -423,16 +733,7 @@ class DataManager:
         map to DTOs, and persist the data into that project's specific SQLite DB.
         Returns True on success, False otherwise. Network/parse errors are swallowed with a warning.
         """
-        try:
-            settings = get_settings()
-        except Exception:
-            settings = None
-        # Avoid unexpected network during tests/dev when API key is not configured
-        if not settings or not getattr(settings, "innergy_api_key", None):
-            try:
-                self._logger.info("Skipping Innergy ingest: API key not configured.")
-            except Exception:
-                pass
+        if not self._innergy_configured("Skipping Innergy ingest: API key not configured."):
             return False
         try:
             importer = InnergyImporter()
@@ -444,8 +745,123 @@ class DataManager:
             except Exception:
                 pass
             return False
-        if not project_payload:
+        prepared = self._upsert_ingested_project(project_payload, products_payload)
+        if prepared is None:
             return False
+        ok = self._write_project_details(*prepared)
+        if ok:
+            self.refresh_search_index(prepared[0].id)
+        return ok
+
+    def ingest_many(self, project_numbers, max_workers: int | None = None, progress=None, on_job_done=None,
+                    importer=None) -> dict:
+        """
+        Ingest several projects' details from Innergy concurrently.
+
+        Job-details and products downloads for every job run on a shared thread pool; as soon
+        as both payloads of a job arrive, its global Project row is upserted (on the calling
+        thread, the global session is not thread-safe) and its per-project SQLite file is
+        written on a second pool, since the files are independent. Each written project is then
+        re-indexed for search on the calling thread.
+
+        progress(int) receives the percentage of finished jobs (FunctionWorker injects it);
+        on_job_done(project_number, ok) is called once per job. importer is an optional
+        ProjectImporter (fetch_project/fetch_products) used instead of the Innergy client.
+        Returns {project_number: ok}.
+        """
+        numbers = list(dict.fromkeys(str(n) for n in (project_numbers or []) if n not in (None, "")))
+        results = {n: False for n in numbers}
+        if not numbers:
+            return results
+        if importer is not None:
+            fetch_project, fetch_products = importer.fetch_project, importer.fetch_products
+        elif self._innergy_configured("Skipping Innergy batch ingest: API key not configured."):
+            innergy = InnergyImporter()
+            fetch_project, fetch_products = innergy.get_job_details, innergy.get_products
+        else:
+            return results
+        workers = max(1, int(max_workers or min(8, len(numbers))))
+        done = 0
+
+        def _finish(number: str, ok: bool) -> None:
+            nonlocal done
+            results[number] = bool(ok)
+            done += 1
+            for cb, args in ((progress, (int(100 * done / len(numbers)),)), (on_job_done, (number, bool(ok)))):
+                if cb:
+                    try:
+                        cb(*args)
+                    except Exception:
+                        pass
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="innergy-fetch") as http_pool, \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="project-db-write") as write_pool:
+            fetches = {}
+            for n in numbers:
+                fetches[http_pool.submit(fetch_project, n)] = (n, "details")
+                fetches[http_pool.submit(fetch_products, n)] = (n, "products")
+            payloads: dict = {n: {} for n in numbers}
+            writes = {}
+            # Downloads and writes are awaited together so finished jobs report progress while
+            # other downloads are still running
+            pending = set(fetches)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    if fut in writes:
+                        n, project_id = writes[fut]
+                        try:
+                            ok = fut.result()
+                        except Exception:  # pragma: no cover - _write_project_details swallows errors
+                            ok = False
+                        if ok:
+                            # The index lives in the global DB, so it is refreshed on this thread
+                            self.refresh_search_index(project_id)
+                        _finish(n, ok)
+                        continue
+                    n, kind = fetches[fut]
+                    try:
+                        payloads[n][kind] = fut.result()
+                    except Exception as e:
+                        try:
+                            self._logger.warning("Innergy fetch for %s (%s) failed: %s", n, kind, e)
+                        except Exception:
+                            pass
+                        payloads[n][kind] = None
+                    if len(payloads[n]) < 2:
+                        continue
+                    got = payloads.pop(n)
+                    prepared = self._upsert_ingested_project(got.get("details") or {}, got.get("products") or [])
+                    if prepared is None:
+                        _finish(n, False)
+                        continue
+                    write = write_pool.submit(self._write_project_details, *prepared)
+                    writes[write] = (n, prepared[0].id)
+                    pending.add(write)
+        try:
+            self._logger.info("Batch ingest finished: %d of %d projects", sum(results.values()), len(results))
+        except Exception:
+            pass
+        return results
+
+    def _innergy_configured(self, skip_message: str) -> bool:
+        try:
+            settings = get_settings()
+        except Exception:
+            settings = None
+        # Avoid unexpected network during tests/dev when API key is not configured
+        if not settings or not getattr(settings, "innergy_api_key", None):
+            try:
+                self._logger.info(skip_message)
+            except Exception:
+                pass
+            return False
+        return True
+
+    def _upsert_ingested_project(self, project_payload, products_payload):
+        """Map fetched payloads and upsert the global Project row. Returns (project, dto) or None."""
+        if not project_payload:
+            return None
         # Map payloads to our DTOs
         try:
             dto = map_project_payload_to_dto(project_payload, products_payload)
@@ -454,7 +870,7 @@ class DataManager:
                 self._logger.warning("Mapping project payload failed: %s", e)
             except Exception:
                 pass
-            return False
+            return None
         # Ensure a global Project exists (used to derive per-project DB path and id)
         project = self.create_or_update_project({
             "number": dto.number,
@@ -462,10 +878,26 @@ class DataManager:
             "job_description": dto.job_description,
             "job_address": dto.job_address,
         })
+        # Plain snapshot: the ORM instance is bound to the global session and must not be
+        # touched (lazy refresh after commit) from the per-project writer threads
+        snapshot = SimpleNamespace(
+            id=getattr(project, "id", None),
+            number=getattr(project, "number", None),
+            name=getattr(project, "name", None),
+            job_description=getattr(project, "job_description", None),
+        )
+        return snapshot, dto
+
+    def _write_project_details(self, project, dto) -> bool:
+        """Persist a mapped project into its own per-project SQLite file. Safe to run on a worker thread.
+
+        dto.products is the mapper's ProductBatch, so the product diff sees locations,
+        dimensions, origins and item numbers exactly as "Load products" does.
+        """
         # Prepare/open the per-project DB and persist collections there
         db_path = self.prepare_project_db(project)
         try:
-            engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+            engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
             sess2 = Session2()
         except Exception as e:  # pragma: no cover
             try:
@@ -496,41 +928,36 @@ class DataManager:
                 pr.job_description = dto.job_description
                 if hasattr(pr, "job_address"):
                     setattr(pr, "job_address", dto.job_address)
-            # Clear existing child rows for this project
-            prod_ids = [row[0] for row in sess2.query(Product.id).filter_by(project_id=pid).all()]
-            if prod_ids:
-                sess2.query(CustomField).filter(CustomField.product_id.in_(prod_ids)).delete(synchronize_session=False)
-            sess2.query(CustomField).filter_by(project_id=pid).delete(synchronize_session=False)
-            sess2.query(Product).filter_by(project_id=pid).delete(synchronize_session=False)
-            sess2.query(Location).filter_by(project_id=pid).delete(synchronize_session=False)
-            # Insert locations
-            name_to_loc_id: dict[str, int] = {}
+            # Upsert locations by name; existing rows keep their ids so product links stay valid
+            known_locs = {
+                (name or "").strip()
+                for (name,) in sess2.query(Location.name).filter_by(project_id=pid).all()
+            }
+            new_locs = []
             for loc_dto in dto.locations or []:
-                name = getattr(loc_dto, "name", None) or ""
-                if not name:
-                    continue
-                loc = Location(name=name, project_id=pid)
-                sess2.add(loc)
-                sess2.flush()
-                try:
-                    name_to_loc_id[name] = loc.id  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            # Insert products and their custom fields
-            for p_dto in dto.products or []:
-                prod = Product(
-                    name=getattr(p_dto, "name", ""),
-                    quantity=getattr(p_dto, "quantity", None),
-                    project_id=pid,
-                )
-                # If in future ProductDTO carries a location, we could map it here using name_to_loc_id
-                sess2.add(prod)
-                sess2.flush()
-                for cf in getattr(p_dto, "custom_fields", []) or []:
-                    sess2.add(CustomField(name=getattr(cf, "name", ""), value=getattr(cf, "value", None), product_id=prod.id))
+                name = (getattr(loc_dto, "name", None) or "").strip()
+                if name and name not in known_locs:
+                    known_locs.add(name)
+                    new_locs.append({"name": name, "project_id": pid})
+            if new_locs:
+                sess2.execute(insert(Location), new_locs)
+            # Diff products against the stored rows instead of wiping them
+            stats = self._save_products_diff(sess2, pid, dto.products or [])
             # Project-level custom fields
-            for cf in getattr(dto, "custom_fields", []) or []:
-                sess2.add(CustomField(name=getattr(cf, "name", ""), value=getattr(cf, "value", None), project_id=pid))
+            sess2.query(CustomField).filter_by(project_id=pid).delete(synchronize_session=False)
+            project_cfs = [
+                {"name": getattr(cf, "name", ""), "value": getattr(cf, "value", None), "project_id": pid}
+                for cf in getattr(dto, "custom_fields", []) or []
+            ]
+            if project_cfs:
+                sess2.execute(insert(CustomField), project_cfs)
+            try:
+                self._logger.info(
+                    "Ingested project %s products: %d inserted, %d updated, %d deleted, %d unchanged",
+                    dto.number, stats.inserted, stats.updated, stats.deleted, stats.unchanged,
+                )
+            except Exception:
+                pass
             sess2.commit()
             return True
         except Exception as e:  # pragma: no cover
@@ -549,9 +976,52 @@ class DataManager:
             except Exception:
                 pass
 
+    def _read_project_db(self, project_id: int, reader, default=None, what: str = "read"):
+        """Run reader(conn, project_id) on a connection to the project's DB; default on error."""
+        try:
+            db_path = self.prepare_project_db(SimpleNamespace(id=project_id))
+            engine2, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+            with engine2.connect() as conn:
+                return reader(conn, int(project_id))
+        except Exception as e:
+            try:
+                self._logger.warning("Project DB %s failed: %s", what, e)
+            except Exception:
+                pass
+            return default
+
+    def get_project_snapshot(self, project_id: int):
+        """Return an immutable ProjectSnapshot of the project's per-project DB, or None.
+
+        Preferred over get_full_project_from_project_db for display: no ORM state, safe to
+        pass between threads, and a fraction of the memory per product.
+        """
+        return self._read_project_db(project_id, _load_project_snapshot, None, "snapshot")
+
+    def get_workspace_locations(self, project_id: int):
+        """Project header plus (location, wall count) pairs for the top of the workspace tree.
+
+        Returns (ProjectSnapshot without collections, [(LocationSnapshot, n_walls)], n_unplaced)
+        where n_unplaced counts walls with no known location; None if the project is missing.
+        """
+        return self._read_project_db(project_id, _workspace_locations, None, "workspace locations")
+
+    def get_workspace_walls(self, project_id: int, location_id: Optional[int]):
+        """[(WallSnapshot, n_products)] for one location; location_id=None lists unplaced walls."""
+        return self._read_project_db(
+            project_id, lambda conn, pid: _workspace_walls(conn, pid, location_id), [], "workspace walls"
+        )
+
+    def get_workspace_products(self, project_id: int, wall_id: int):
+        """ProductSnapshots placed on one wall, in id order."""
+        return self._read_project_db(
+            project_id, lambda conn, pid: _workspace_products(conn, pid, wall_id), [], "workspace products"
+        )
+
     def get_full_project_from_project_db(self, project_id: int):
         """
         Return the Project ORM object (with relationships loaded) from the project's specific DB.
+        The graph is eager-loaded in a fixed number of queries (see _full_project_load_options).
         Returns None if not found or on error.
         """
         # Build a minimal object to derive DB path
@@ -561,7 +1031,7 @@ class DataManager:
         setattr(tmp, "id", project_id)
         try:
             db_path = self.prepare_project_db(tmp)
-            engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+            engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
             sess2 = Session2()
         except Exception as e:  # pragma: no cover
             try:
@@ -570,20 +1040,9 @@ class DataManager:
                 pass
             return None
         try:
-            pr = sess2.query(Project).get(project_id)
+            pr = sess2.get(Project, project_id, options=_full_project_load_options())
             if pr is None:
                 return None
-            # Force-load common relationships for display
-            try:
-                _ = list(getattr(pr, "locations", []) or [])
-                _ = list(getattr(pr, "products", []) or [])
-                _ = list(getattr(pr, "custom_fields", []) or [])
-                _ = list(getattr(pr, "walls", []) or [])
-                _ = list(getattr(pr, "specification_groups", []) or [])
-                _ = list(getattr(pr, "global_prompts", []) or [])
-                _ = list(getattr(pr, "wizard_prompts", []) or [])
-            except Exception:
-                pass
             # Detach so it can be used after session closes
             try:
                 sess2.expunge(pr)
@@ -596,11 +1055,109 @@ class DataManager:
             except Exception:
                 pass
 
+    # ---- Cross-project search index (global DB) ----
+    def _search_engine(self):
+        """Global DB engine with the FTS5 tables in place, or None when unavailable.
+
+        The index is read and written on its own connections, never through self.session, so
+        index maintenance cannot commit, roll back or expire unrelated work in the session.
+        """
+        if getattr(self, "_search_index_ready", None) is False:
+            return None
+        try:
+            engine = self.session.get_bind()
+            if engine.dialect.name != "sqlite":
+                self._search_index_ready = False
+                return None
+            if not self._search_index_ready:
+                with engine.begin() as conn:
+                    ensure_search_index(conn)
+                self._search_index_ready = True
+            return engine
+        except Exception as e:
+            try:
+                self._logger.warning("Search index unavailable: %s", e)
+            except Exception:
+                pass
+            # A busy database is worth retrying later; anything else (e.g. no FTS5) is not
+            if "locked" not in str(e):
+                self._search_index_ready = False
+            return None
+
+    def refresh_search_index(self, project_id: int, kinds=SEARCH_KINDS, product_ids=None):
+        """Re-index one project's documents of the given kinds from its per-project DB.
+
+        Called after each replace_* commit with the kinds that save touched, so only that
+        project's affected documents are rewritten. With product_ids (the products a save
+        inserted, updated or deleted) only those products' product and custom-field documents
+        are replaced; other kinds are still refreshed whole. Returns the number of documents
+        written, or False on failure (a failed refresh never fails the save that triggered it).
+        """
+        kinds = tuple(kinds)
+        ref_ids = None if product_ids is None else [int(i) for i in product_ids]
+        docs = self._read_project_db(
+            project_id, lambda conn, pid: collect_project_documents(conn, pid, kinds, ref_ids), None, "search index read"
+        )
+        if docs is None:
+            return False
+        engine = self._search_engine()
+        if engine is None:
+            return False
+        scoped = () if ref_ids is None else tuple(k for k in kinds if k in (KIND_PRODUCT, KIND_CUSTOM_FIELD))
+        whole = tuple(k for k in kinds if k not in scoped)
+        try:
+            with engine.begin() as conn:
+                written = 0
+                if whole:
+                    written += replace_project_documents(conn, int(project_id), whole, [d for d in docs if d[0] in whole])
+                if scoped:
+                    written += replace_project_documents(
+                        conn, int(project_id), scoped, [d for d in docs if d[0] in scoped], ref_ids
+                    )
+                return written
+        except Exception as e:
+            try:
+                self._logger.warning("Search index refresh for project %s failed: %s", project_id, e)
+            except Exception:
+                pass
+            return False
+
+    def rebuild_search_index(self, project_ids=None) -> int:
+        """Index every project (or project_ids) that has a per-project DB; returns projects indexed."""
+        if project_ids is None:
+            try:
+                project_ids = [pid for (pid,) in self.session.query(Project.id).all()]
+            except Exception:
+                project_ids = []
+        indexed = 0
+        for pid in project_ids:
+            # Do not create DB files for projects that were never opened or ingested
+            if not os.path.exists(project_sqlite_db_path(SimpleNamespace(id=pid))):
+                continue
+            if self.refresh_search_index(pid) is not False:
+                indexed += 1
+        return indexed
+
+    def search(self, query: str, limit: int = 50, kinds=None):
+        """Ranked SearchHits for query across all indexed projects ([] when unavailable)."""
+        engine = self._search_engine()
+        if engine is None:
+            return []
+        try:
+            with engine.connect() as conn:
+                return search_documents(conn, query, limit=limit, kinds=kinds)
+        except Exception as e:
+            try:
+                self._logger.warning("Search failed: %s", e)
+            except Exception:
+                pass
+            return []
+
     def fetch_products_from_innergy(self, project_number: str):
-        """Fetch budget products for a project number from Innergy and map to simple dicts.
-        Returns a list of dicts with keys like: name, quantity, description, custom_fields, location,
-        and extended attributes from ProductModel (width, height, depth, item_number, comment, angle,
-        x_origin, y_origin, z_origin, link_id_specification_group, link_id_location, link_id_wall,
+        """Fetch budget products for a project number from Innergy as a ProductBatch.
+        The batch reads as a list of dicts with keys like: name, quantity, description, custom_fields,
+        location, and extended attributes from ProductModel (width, height, depth, item_number, comment,
+        angle, x_origin, y_origin, z_origin, link_id_specification_group, link_id_location, link_id_wall,
         file_name, picture_name). Returns [] if API key not configured or on error.
         """
         try:
@@ -615,84 +1172,14 @@ class DataManager:
             return []
         try:
             importer = InnergyImporter()
-            # Fetch filtered products for essential fields and DTO mapping
-            products_payload = importer.get_products(project_number) or []
-            # Also fetch raw payload to extract location and extended attributes
-            raw_payload = None
+            # One download, parsed in a single pass into columns
+            return parse_budget_products(importer.iter_budget_products(project_number))
+        except InnergyHTTPError as e:
             try:
-                raw_payload = importer.get_products_raw(project_number)
+                self._logger.warning("Innergy get_products non-200: %s", e.status_code)
             except Exception:
-                raw_payload = None
-            raw_items = []
-            if isinstance(raw_payload, dict) and isinstance(raw_payload.get("Items"), list):
-                raw_items = raw_payload.get("Items")
-            elif isinstance(raw_payload, list):
-                raw_items = raw_payload
-            pdtos = map_products_payload_to_dtos(products_payload)
-            out = []
-            # Attempt to align locations and extended attributes from raw payload with mapped DTOs by index
-            for idx, p in enumerate(pdtos):
-                cfs = []
-                for cf in getattr(p, "custom_fields", []) or []:
-                    cfs.append({"name": getattr(cf, "name", ""), "value": getattr(cf, "value", None)})
-                # Defaults
-                location = None
-                width = height = depth = None
-                x_origin = y_origin = z_origin = None
-                item_number = comment = angle = None
-                link_sg = link_loc = link_wall = None
-                file_name = picture_name = None
-                try:
-                    src = raw_items[idx] if isinstance(raw_items, list) and idx < len(raw_items) else (
-                        products_payload[idx] if isinstance(products_payload, list) and idx < len(products_payload) else None
-                    )
-                    if isinstance(src, dict):
-                        # Location can be str or dict
-                        loc_val = src.get("Location") or src.get("location") or src.get("LocationName") or src.get("locationName")
-                        if isinstance(loc_val, dict):
-                            location = loc_val.get("Name") or loc_val.get("name") or loc_val.get("Title") or loc_val.get("title")
-                        elif isinstance(loc_val, str):
-                            location = loc_val
-                        # Extended numeric/string attributes
-                        width = src.get("Width")
-                        height = src.get("Height")
-                        depth = src.get("Depth")
-                        x_origin = src.get("XOrigin")
-                        y_origin = src.get("YOrigin")
-                        z_origin = src.get("ZOrigin")
-                        item_number = src.get("ItemNumber")
-                        comment = src.get("Comment")
-                        angle = src.get("Angle")
-                        link_sg = src.get("LinkIDSpecificationGroup")
-                        link_loc = src.get("LinkIDLocation")
-                        link_wall = src.get("LinkIDWall")
-                        file_name = src.get("FileName")
-                        picture_name = src.get("PictureName")
-                except Exception:
-                    pass
-                out.append({
-                    "name": getattr(p, "name", ""),
-                    "quantity": getattr(p, "quantity", None),
-                    "description": getattr(p, "description", ""),
-                    "custom_fields": cfs,
-                    "location": location,
-                    # Extended attributes (snake_case)
-                    "width": width,
-                    "height": height,
-                    "depth": depth,
-                    "x_origin": x_origin,
-                    "y_origin": y_origin,
-                    "z_origin": z_origin,
-                    "item_number": item_number,
-                    "comment": comment,
-                    "angle": angle,
-                    "link_id_specification_group": link_sg,
-                    "link_id_location": link_loc,
-                    "link_id_wall": link_wall,
-                    "file_name": file_name,
-                    "picture_name": picture_name,
-                })
-            return out
+                pass
+            return []
         except Exception as e:  # pragma: no cover
             try:
                 self._logger.warning("Fetching products from Innergy failed: %s", e)
@@ -709,7 +1196,7 @@ class DataManager:
             tmp = type("_Tmp", (), {})()
             setattr(tmp, "id", project_id)
             db_path = self.prepare_project_db(tmp)
-            engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+            engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
             sess2 = Session2()
         except Exception as e:  # pragma: no cover
             try:
@@ -775,13 +1262,18 @@ class DataManager:
         """Replace all products for a project in its per-project DB with provided products list.
         Each product can be a dict or DTO with attributes name, quantity, description, custom_fields,
         location, and extended attributes from ProductModel. Also upserts Location rows and links products.
+
+        The save is differential: products are matched to existing rows by a stable identity
+        (item number, else name + location + occurrence), and only inserted, changed or missing
+        rows are written. Matched products keep their ids. Returns ProductSaveStats (truthy) on
+        success, False on failure.
         """
         # Open per-project DB session
         try:
             tmp = type("_Tmp", (), {})()
             setattr(tmp, "id", project_id)
             db_path = self.prepare_project_db(tmp)
-            engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+            engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
             sess2 = Session2()
         except Exception as e:  # pragma: no cover
             try:
@@ -790,107 +1282,18 @@ class DataManager:
                 pass
             return False
         try:
-            # Delete existing products and their CFs
-            prod_ids = [row[0] for row in sess2.query(Product.id).filter_by(project_id=project_id).all()]
-            if prod_ids:
-                sess2.query(CustomField).filter(CustomField.product_id.in_(prod_ids)).delete(synchronize_session=False)
-            sess2.query(Product).filter_by(project_id=project_id).delete(synchronize_session=False)
-            # Preload locations mapping by name
-            existing_locs = sess2.query(Location).filter_by(project_id=project_id).all()
-            name_to_loc = { (getattr(l, 'name', '') or '').strip(): l for l in existing_locs }
-            # Insert new products
-            for d in (products or []):
-                is_dict = isinstance(d, dict)
-                name = getattr(d, 'name', None) if not is_dict else d.get('name')
-                qty = getattr(d, 'quantity', None) if not is_dict else d.get('quantity')
-                desc = getattr(d, 'description', None) if not is_dict else d.get('description')
-                width = getattr(d, 'width', None) if not is_dict else d.get('width')
-                height = getattr(d, 'height', None) if not is_dict else d.get('height')
-                depth = getattr(d, 'depth', None) if not is_dict else d.get('depth')
-                x_origin = getattr(d, 'x_origin', None) if not is_dict else d.get('x_origin')
-                y_origin = getattr(d, 'y_origin', None) if not is_dict else d.get('y_origin')
-                z_origin = getattr(d, 'z_origin', None) if not is_dict else d.get('z_origin')
-                link_sg = getattr(d, 'link_id_specification_group', None) if not is_dict else d.get('link_id_specification_group')
-                link_wall = getattr(d, 'link_id_wall', None) if not is_dict else d.get('link_id_wall')
-                # Create Product row
-                prod = Product(name=name or "", quantity=qty, project_id=project_id)
-                # Map columns present on model
-                if hasattr(prod, 'description'):
-                    setattr(prod, 'description', desc or "")
-                if hasattr(prod, 'width'):
-                    setattr(prod, 'width', width)
-                if hasattr(prod, 'height'):
-                    setattr(prod, 'height', height)
-                if hasattr(prod, 'depth'):
-                    setattr(prod, 'depth', depth)
-                if hasattr(prod, 'x_origin_from_right'):
-                    setattr(prod, 'x_origin_from_right', x_origin)
-                if hasattr(prod, 'y_origin_from_face'):
-                    setattr(prod, 'y_origin_from_face', y_origin)
-                if hasattr(prod, 'z_origin_from_bottom'):
-                    setattr(prod, 'z_origin_from_bottom', z_origin)
-                if hasattr(prod, 'specification_group_id'):
-                    try:
-                        setattr(prod, 'specification_group_id', int(link_sg) if link_sg is not None else None)
-                    except Exception:
-                        pass
-                if hasattr(prod, 'wall_id'):
-                    try:
-                        setattr(prod, 'wall_id', int(link_wall) if link_wall is not None else None)
-                    except Exception:
-                        pass
-                # Resolve/Upsert location by name if provided
-                loc_name = None
-                if is_dict:
-                    loc_name = d.get('location')
-                else:
-                    loc_name = getattr(d, 'location', None)
-                if isinstance(loc_name, str) and loc_name.strip():
-                    key = loc_name.strip()
-                    loc_obj = name_to_loc.get(key)
-                    if loc_obj is None:
-                        loc_obj = Location(name=key, project_id=project_id)
-                        sess2.add(loc_obj)
-                        sess2.flush()
-                        name_to_loc[key] = loc_obj
-                    try:
-                        prod.location_id = loc_obj.id
-                    except Exception:
-                        pass
-                # Persist product
-                sess2.add(prod)
-                sess2.flush()
-                # Custom fields (existing custom fields from payload)
-                cfs = getattr(d, 'custom_fields', None)
-                if is_dict:
-                    cfs = d.get('custom_fields')
-                for cf in (cfs or []):
-                    cf_name = getattr(cf, 'name', None) if not isinstance(cf, dict) else cf.get('name')
-                    cf_val = getattr(cf, 'value', None) if not isinstance(cf, dict) else cf.get('value')
-                    sess2.add(CustomField(name=cf_name or "", value=cf_val, product_id=prod.id))
-                # Persist extra attributes without dedicated columns as product custom fields
-                extras = {}
-                if is_dict:
-                    extras = {
-                        'ItemNumber': d.get('item_number'),
-                        'Comment': d.get('comment'),
-                        'Angle': d.get('angle'),
-                        'FileName': d.get('file_name'),
-                        'PictureName': d.get('picture_name'),
-                    }
-                else:
-                    extras = {
-                        'ItemNumber': getattr(d, 'item_number', None),
-                        'Comment': getattr(d, 'comment', None),
-                        'Angle': getattr(d, 'angle', None),
-                        'FileName': getattr(d, 'file_name', None),
-                        'PictureName': getattr(d, 'picture_name', None),
-                    }
-                for k, v in extras.items():
-                    if v is not None and v != "":
-                        sess2.add(CustomField(name=k, value=v, product_id=prod.id))
+            stats = self._save_products_diff(sess2, project_id, products or [])
             sess2.commit()
-            return True
+            if stats.changed:
+                self.refresh_search_index(project_id, (KIND_PROJECT, KIND_PRODUCT, KIND_CUSTOM_FIELD), product_ids=stats.changed_ids)
+            try:
+                self._logger.info(
+                    "Saved products for project %s: %d inserted, %d updated, %d deleted, %d unchanged",
+                    project_id, stats.inserted, stats.updated, stats.deleted, stats.unchanged,
+                )
+            except Exception:
+                pass
+            return stats
         except Exception as e:  # pragma: no cover
             try:
                 sess2.rollback()
@@ -908,6 +1311,213 @@ class DataManager:
                 pass
 
 
+    def apply_workspace_changes(self, project_id: int, product_changes: dict, wall_changes: dict):
+        """Write coalesced workspace geometry edits into the per-project DB in one transaction.
+
+        product_changes / wall_changes map row id -> {column: value} (only the final value per
+        column, see WorkspaceChangeJournal). Rows are grouped by the set of columns they touch
+        and each group is a single executemany UPDATE, so the cost depends on the number of
+        edited rows, not on how many drag events produced them. Rows outside the project are
+        left alone. Returns {"products": n, "walls": n} rows updated, or False on failure.
+        """
+        def _write(conn, pid):
+            counts = {"products": 0, "walls": 0}
+            for key, model, changes, allowed in (
+                ("products", Product, product_changes, _WORKSPACE_PRODUCT_COLUMNS),
+                ("walls", Wall, wall_changes, _WORKSPACE_WALL_COLUMNS),
+            ):
+                groups: dict[tuple, list] = {}
+                for row_id, fields in (changes or {}).items():
+                    cols = tuple(sorted(c for c in fields if c in allowed))
+                    if cols:
+                        groups.setdefault(cols, []).append({"b_id": int(row_id), **{f"b_{c}": fields[c] for c in cols}})
+                table = model.__table__
+                for cols, rows in groups.items():
+                    values = {c: bindparam(f"b_{c}") for c in cols}
+                    if model is Product:
+                        # The row no longer matches its last saved product: force a full compare
+                        values["content_digest"] = None
+                    stmt = (
+                        table.update()
+                        .where(table.c.id == bindparam("b_id"), table.c.project_id == pid)
+                        .values(values)
+                    )
+                    res = conn.execute(stmt, rows)
+                    counts[key] += max(0, res.rowcount or 0)
+            return counts
+
+        try:
+            db_path = self.prepare_project_db(SimpleNamespace(id=project_id))
+            engine2, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+            with engine2.begin() as conn:
+                counts = _write(conn, int(project_id))
+            try:
+                self._logger.info("Saved workspace for project %s: %d products, %d walls", project_id, counts["products"], counts["walls"])
+            except Exception:
+                pass
+            return counts
+        except Exception as e:
+            try:
+                self._logger.warning("apply_workspace_changes failed: %s", e)
+            except Exception:
+                pass
+            return False
+
+    def _save_products_diff(self, sess2, project_id: int, products) -> ProductSaveStats:
+        """Write products into an open per-project session by diffing against existing rows.
+
+        Does not commit. Each saved row keeps the digest of the incoming product it was written
+        from (products.content_digest), so a matched product whose digest is unchanged costs one
+        comparison; only rows with a different or missing digest are read back in full and
+        compared column by column. Changed rows are updated in one executemany, new rows are
+        inserted in RETURNING batches, and rows absent from `products` are deleted with their
+        custom fields.
+        """
+        # Existing state: locations, then per product only what identity and digest need
+        name_to_loc_id = {
+            (name or '').strip(): lid
+            for lid, name in sess2.query(Location.id, Location.name).filter_by(project_id=project_id).all()
+        }
+        loc_id_to_name = {lid: name for name, lid in name_to_loc_id.items()}
+        project_products = select(Product.id).where(Product.project_id == project_id)
+        existing_rows = sess2.execute(
+            select(Product.id, Product.name, Product.location_id, Product.content_digest)
+            .where(Product.project_id == project_id)
+            .order_by(Product.id)
+        ).all()
+        item_numbers: dict[int, object] = {}
+        for prod_id, value in sess2.execute(
+            select(CustomField.product_id, CustomField.value)
+            .where(CustomField.name == "ItemNumber", CustomField.product_id.in_(project_products))
+            .order_by(CustomField.id)
+        ):
+            item_numbers.setdefault(prod_id, value)
+        existing_keys = _product_identity_keys([
+            (item_numbers.get(prod_id), name, loc_id_to_name.get(loc_id))
+            for prod_id, name, loc_id, _ in existing_rows
+        ])
+        existing_by_key = {key: r for key, r in zip(existing_keys, existing_rows)}
+
+        # Incoming products: identity and digest for all, row dicts only for the ones to write
+        identities: list[tuple] = []
+        incoming: list[tuple] = []
+        for values, cfs in _iter_incoming_products(products):
+            name, loc_name = values[0], values[2]
+            loc_key = loc_name.strip() if isinstance(loc_name, str) and loc_name.strip() else None
+            identities.append((next((v for n, v in cfs if n == "ItemNumber"), None), name or "", loc_key))
+            incoming.append((values, cfs, loc_key, format(values_digest(values, cfs), "032x")))
+        inserts: list[tuple] = []
+        candidates: list[tuple] = []
+        unchanged = 0
+        for key, entry in zip(_product_identity_keys(identities), incoming):
+            current = existing_by_key.pop(key, None)
+            if current is None:
+                inserts.append(entry)
+            elif current.content_digest == entry[3]:
+                unchanged += 1
+            else:
+                candidates.append((current.id, entry))
+        deleted_ids = [r.id for r in existing_by_key.values()]
+
+        # Upsert locations used by rows about to be written, in one batch
+        new_loc_names = list(dict.fromkeys(
+            loc_key for _, _, loc_key, _ in inserts + [e for _, e in candidates]
+            if loc_key is not None and loc_key not in name_to_loc_id
+        ))
+        if new_loc_names:
+            res = sess2.execute(
+                insert(Location).returning(Location.id, sort_by_parameter_order=True),
+                [{"name": n, "project_id": project_id} for n in new_loc_names],
+            )
+            for n, lid in zip(new_loc_names, res.scalars().all()):
+                name_to_loc_id[n] = lid
+
+        def _row(values, loc_key, digest):
+            name, quantity, _, width, height, depth, xo, yo, zo, link_sg, link_wall = values
+            return {
+                "name": name or "",
+                "quantity": quantity,
+                "project_id": project_id,
+                "width": width,
+                "height": height,
+                "depth": depth,
+                "x_origin_from_right": xo,
+                "y_origin_from_face": yo,
+                "z_origin_from_bottom": zo,
+                "specification_group_id": _int_or_none(link_sg),
+                "wall_id": _int_or_none(link_wall),
+                "location_id": name_to_loc_id.get(loc_key) if loc_key is not None else None,
+                "content_digest": digest,
+            }
+
+        # Candidates (digest differs or was never stored): compare against the stored row
+        updates: list[dict] = []
+        digest_only: list[dict] = []
+        cf_replace_ids: list[int] = []
+        cf_replace_rows: list[dict] = []
+        cand_ids = [prod_id for prod_id, _ in candidates]
+        stored: dict[int, tuple] = {}
+        stored_cfs: dict[int, list[tuple]] = {}
+        for chunk in _chunks(cand_ids):
+            for r in sess2.execute(select(Product.id, *[getattr(Product, c) for c in _PRODUCT_DIFF_COLUMNS]).where(Product.id.in_(chunk))):
+                stored[r[0]] = r[1:]
+            for prod_id, cf_name, cf_val in sess2.execute(
+                select(CustomField.product_id, CustomField.name, CustomField.value)
+                .where(CustomField.product_id.in_(chunk))
+                .order_by(CustomField.id)
+            ):
+                stored_cfs.setdefault(prod_id, []).append((cf_name or "", cf_val))
+        for prod_id, (values, cfs, loc_key, digest) in candidates:
+            row = _row(values, loc_key, digest)
+            current = stored[prod_id]
+            row_changed = any(not _values_equal(current[i], row[c]) for i, c in enumerate(_PRODUCT_DIFF_COLUMNS))
+            cfs_changed = _normalized_cfs(stored_cfs.get(prod_id, [])) != _normalized_cfs(cfs)
+            if row_changed:
+                updates.append({"id": prod_id, **{c: row[c] for c in _PRODUCT_DIFF_COLUMNS}, "content_digest": digest})
+            else:
+                digest_only.append({"id": prod_id, "content_digest": digest})
+            if cfs_changed:
+                cf_replace_ids.append(prod_id)
+                cf_replace_rows.extend({"name": n, "value": v, "product_id": prod_id} for n, v in cfs)
+            if not row_changed and not cfs_changed:
+                unchanged += 1
+
+        # Apply: deletes, updates, then inserts
+        for chunk in _chunks(deleted_ids + cf_replace_ids):
+            sess2.query(CustomField).filter(CustomField.product_id.in_(chunk)).delete(synchronize_session=False)
+        for chunk in _chunks(deleted_ids):
+            sess2.query(Product).filter(Product.id.in_(chunk)).delete(synchronize_session=False)
+        if updates:
+            sess2.execute(update(Product), updates)
+        if digest_only:
+            sess2.execute(update(Product), digest_only)
+        if cf_replace_rows:
+            sess2.execute(insert(CustomField), cf_replace_rows)
+        new_ids: list[int] = []
+        if inserts:
+            res = sess2.execute(
+                insert(Product).returning(Product.id, sort_by_parameter_order=True),
+                [_row(values, loc_key, digest) for values, _, loc_key, digest in inserts],
+            )
+            new_ids = list(res.scalars().all())
+            cf_rows = [
+                {"name": n, "value": v, "product_id": new_id}
+                for new_id, (_, cfs, _, _) in zip(new_ids, inserts)
+                for n, v in cfs
+            ]
+            if cf_rows:
+                sess2.execute(insert(CustomField), cf_rows)
+        updated_ids = tuple(dict.fromkeys([u["id"] for u in updates] + cf_replace_ids))
+        return ProductSaveStats(
+            inserted=len(inserts),
+            updated=len(updated_ids),
+            deleted=len(deleted_ids),
+            unchanged=unchanged,
+            inserted_ids=tuple(new_ids),
+            updated_ids=updated_ids,
+            deleted_ids=tuple(deleted_ids),
+        )
+
     def get_location_tables_for_project(self, project_id: int, session=None) -> dict:
         """
         Load location table callouts for a project from its per-project SQLite DB.
@@ -923,7 +1533,7 @@ class DataManager:
                 tmp = type("_Tmp", (), {})()
                 setattr(tmp, "id", project_id)
                 db_path = self.prepare_project_db(tmp)
-                engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+                engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
                 db_session = Session2()
             except Exception:
                 db_session = self.session
@@ -972,7 +1582,7 @@ class DataManager:
                 tmp = type("_Tmp", (), {})()
                 setattr(tmp, "id", project_id)
                 db_path = self.prepare_project_db(tmp)
-                engine2, Session2 = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+                engine2, Session2 = get_engine_and_sessionmaker_for_sqlite_path(db_path)
                 db_session = Session2()
                 created_session = True
             except Exception:
@@ -1017,6 +1627,8 @@ class DataManager:
                     except Exception:
                         continue
             db_session.commit()
+            if created_session:
+                self.refresh_search_index(project_id, (KIND_CALLOUT,))
             return True
         except Exception as e:  # pragma: no cover
             try:
@@ -0,0 +1,221 @@
+"""Cross-project full-text search index (SQLite FTS5) kept in the global DB.
+
+Documents are extracted from each per-project DB and stored in two tables:
+
+- search_docs: one row per document with its project, kind, source row id and field,
+  indexed on (project_id, kind, ref_id) so a project's documents, or just those of a few
+  of its rows, can be replaced cheaply;
+- search_fts: an FTS5 table over (title, body) whose rowid is search_docs.id.
+
+Refreshing a project deletes and re-inserts only that project's documents of the given
+kinds; a product save narrows this further to the products it wrote, so the index follows
+each save without rebuilding the whole thing.
+"""
+from __future__ import annotations
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.engine import Connection
+
+from mmx_engineering_spec_manager.db_models.appliance_callout import ApplianceCallout
+from mmx_engineering_spec_manager.db_models.custom_field import CustomField
+from mmx_engineering_spec_manager.db_models.finish_callout import FinishCallout
+from mmx_engineering_spec_manager.db_models.hardware_callout import HardwareCallout
+from mmx_engineering_spec_manager.db_models.location_table_callout import LocationTableCallout
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.project import Project
+from mmx_engineering_spec_manager.db_models.sink_callout import SinkCallout
+from mmx_engineering_spec_manager.dtos.search_dto import SearchHit
+
+KIND_PROJECT = "project"
+KIND_PRODUCT = "product"
+KIND_CUSTOM_FIELD = "custom_field"
+KIND_CALLOUT = "callout"
+ALL_KINDS = (KIND_PROJECT, KIND_PRODUCT, KIND_CUSTOM_FIELD, KIND_CALLOUT)
+
+# Product custom field indexed as the product document's body rather than on its own
+_COMMENT_FIELD = "Comment"
+
+_CALLOUT_TABLES = (
+    ("Finish", FinishCallout),
+    ("Hardware", HardwareCallout),
+    ("Sink", SinkCallout),
+    ("Appliance", ApplianceCallout),
+    ("Location Table", LocationTableCallout),
+)
+
+# (kind, ref_id, field, title, body)
+Document = Tuple[str, Optional[int], Optional[str], str, str]
+
+_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS search_docs (
+        id INTEGER PRIMARY KEY,
+        project_id INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        ref_id INTEGER,
+        field TEXT
+    )
+    """,
+    # Superseded by the (project_id, kind, ref_id) index below
+    "DROP INDEX IF EXISTS ix_search_docs_project_kind",
+    "CREATE INDEX IF NOT EXISTS ix_search_docs_project_kind_ref ON search_docs (project_id, kind, ref_id)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(title, body, tokenize = 'unicode61')",
+)
+
+
+def ensure_search_index(conn: Connection) -> None:
+    """Create the index tables if missing (idempotent)."""
+    for stmt in _DDL:
+        conn.exec_driver_sql(stmt)
+
+
+def _s(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _chunks(ids: Sequence[int], size: int = 500):
+    for i in range(0, len(ids), size):
+        yield list(ids[i:i + size])
+
+
+def collect_project_documents(
+    conn: Connection,
+    project_id: int,
+    kinds: Iterable[str] = ALL_KINDS,
+    product_ids: Optional[Sequence[int]] = None,
+) -> List[Document]:
+    """Read the searchable text of one project from its per-project DB.
+
+    With product_ids, product and custom-field documents are read for those products only
+    (project-level custom fields are left out); other kinds are unaffected.
+    """
+    kinds = set(kinds)
+    docs: List[Document] = []
+    if KIND_PROJECT in kinds:
+        row = conn.execute(
+            select(Project.number, Project.name, Project.job_description, Project.job_address).where(Project.id == project_id)
+        ).first()
+        if row is not None:
+            docs.append((KIND_PROJECT, project_id, None, f"{_s(row[0])} {_s(row[1])}".strip(), f"{_s(row[2])} {_s(row[3])}".strip()))
+    if KIND_PRODUCT in kinds or KIND_CUSTOM_FIELD in kinds:
+        cf_cols = (CustomField.product_id, CustomField.id, CustomField.name, CustomField.value)
+        product_cols = (Product.id, Product.name)
+        if product_ids is None:
+            in_project = select(Product.id).where(Product.project_id == project_id)
+            cf_rows = conn.execute(
+                select(*cf_cols).where((CustomField.product_id.in_(in_project)) | (CustomField.project_id == project_id))
+            ).all()
+            product_rows = conn.execute(select(*product_cols).where(Product.project_id == project_id)).all()
+        else:
+            cf_rows, product_rows = [], []
+            for chunk in _chunks(list(product_ids)):
+                cf_rows.extend(conn.execute(select(*cf_cols).where(CustomField.product_id.in_(chunk))))
+                product_rows.extend(conn.execute(
+                    select(*product_cols).where(Product.project_id == project_id, Product.id.in_(chunk))
+                ))
+        comments = {}
+        for product_id, cf_id, name, value in cf_rows:
+            if product_id is not None and name == _COMMENT_FIELD:
+                comments[product_id] = f"{comments.get(product_id, '')} {_s(value)}".strip()
+            elif KIND_CUSTOM_FIELD in kinds and value not in (None, ""):
+                docs.append((KIND_CUSTOM_FIELD, product_id, _s(name), _s(name), _s(value)))
+        if KIND_PRODUCT in kinds:
+            for pid, name in product_rows:
+                docs.append((KIND_PRODUCT, pid, _COMMENT_FIELD if pid in comments else None, _s(name), comments.get(pid, "")))
+    if KIND_CALLOUT in kinds:
+        for label, model in _CALLOUT_TABLES:
+            stmt = select(model.id, model.tag, model.material, model.description).where(model.project_id == project_id)
+            for cid, tag, material, description in conn.execute(stmt):
+                docs.append((KIND_CALLOUT, cid, label, _s(tag), f"{_s(material)} {_s(description)}".strip()))
+    return docs
+
+
+_KINDS_PARAM = bindparam("kinds", expanding=True)
+_REFS_PARAM = bindparam("refs", expanding=True)
+
+
+def _delete_documents(conn: Connection, where: str, params: dict, *expanding) -> None:
+    conn.execute(
+        text(f"DELETE FROM search_fts WHERE rowid IN (SELECT id FROM search_docs WHERE {where})").bindparams(*expanding),
+        params,
+    )
+    conn.execute(text(f"DELETE FROM search_docs WHERE {where}").bindparams(*expanding), params)
+
+
+def replace_project_documents(
+    conn: Connection,
+    project_id: int,
+    kinds: Sequence[str],
+    docs: Sequence[Document],
+    ref_ids: Optional[Sequence[int]] = None,
+) -> int:
+    """Swap a project's documents of the given kinds for docs; returns the number written.
+
+    With ref_ids only the documents of those source rows are removed first (docs should be
+    the documents of the same rows, see collect_project_documents' product_ids).
+    """
+    params = {"pid": int(project_id), "kinds": list(kinds)}
+    where = "project_id = :pid AND kind IN :kinds"
+    if ref_ids is None:
+        _delete_documents(conn, where, params, _KINDS_PARAM)
+    else:
+        for chunk in _chunks(list(ref_ids)):
+            _delete_documents(conn, where + " AND ref_id IN :refs", {**params, "refs": chunk}, _KINDS_PARAM, _REFS_PARAM)
+    if not docs:
+        return 0
+    # Explicit ids so the FTS rowids can be written in the same executemany batch
+    start = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM search_docs")).scalar_one() + 1
+    conn.execute(
+        text("INSERT INTO search_docs (id, project_id, kind, ref_id, field) VALUES (:id, :pid, :kind, :ref, :field)"),
+        [
+            {"id": start + i, "pid": int(project_id), "kind": kind, "ref": ref, "field": field}
+            for i, (kind, ref, field, _, _) in enumerate(docs)
+        ],
+    )
+    conn.execute(
+        text("INSERT INTO search_fts (rowid, title, body) VALUES (:id, :title, :body)"),
+        [{"id": start + i, "title": title, "body": body} for i, (_, _, _, title, body) in enumerate(docs)],
+    )
+    return len(docs)
+
+
+def remove_project_documents(conn: Connection, project_id: int) -> None:
+    replace_project_documents(conn, project_id, ALL_KINDS, ())
+
+
+def build_match_query(query: str) -> str:
+    """FTS5 MATCH expression for free text: every term must match, each as a quoted prefix.
+
+    Quoting keeps user input such as HW-12 or "ADA" from being read as FTS5 syntax; within a
+    quoted term the tokenizer still splits on punctuation, so HW-12 matches the phrase "hw 12".
+    """
+    terms = re.findall(r"\S+", query or "")
+    return " ".join('"{}"*'.format(t.replace('"', '""')) for t in terms if re.search(r"\w", t))
+
+
+def search_documents(conn: Connection, query: str, limit: int = 50, kinds: Optional[Sequence[str]] = None) -> List[SearchHit]:
+    """Ranked hits for query across all indexed projects (best first)."""
+    match = build_match_query(query)
+    if not match:
+        return []
+    sql = (
+        "SELECT d.project_id, d.kind, d.ref_id, d.field, search_fts.title, "
+        "snippet(search_fts, -1, '[', ']', '...', 12), bm25(search_fts, 2.0, 1.0) AS rank, p.number, p.name "
+        "FROM search_fts JOIN search_docs d ON d.id = search_fts.rowid "
+        "LEFT JOIN projects p ON p.id = d.project_id "
+        "WHERE search_fts MATCH :match"
+    )
+    params = {"match": match, "limit": int(limit)}
+    stmt = text(sql + (" AND d.kind IN :kinds" if kinds else "") + " ORDER BY rank LIMIT :limit")
+    if kinds:
+        stmt = stmt.bindparams(_KINDS_PARAM)
+        params["kinds"] = list(kinds)
+    return [
+        SearchHit(
+            project_id=row[0], kind=row[1], ref_id=row[2], field=row[3], title=row[4] or "",
+            snippet=row[5] or "", rank=float(row[6]), project_number=row[7], project_name=row[8],
+        )
+        for row in conn.execute(stmt, params)
+    ]
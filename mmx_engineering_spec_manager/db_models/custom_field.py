@@ -11,8 +11,8 @@ class CustomField(Base, Parameter):
     __tablename__ = 'custom_fields'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    product_id = Column(Integer, ForeignKey('products.id'), nullable=True)
-    project_id = Column(Integer, ForeignKey('projects.id'), nullable=True)
+    product_id = Column(Integer, ForeignKey('products.id'), nullable=True, index=True)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=True, index=True)
 
     product = relationship("Product", back_populates="custom_fields")
     project = relationship("Project", back_populates="custom_fields")
\ No newline at end of file
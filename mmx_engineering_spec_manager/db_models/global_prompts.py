@@ -13,7 +13,7 @@ class GlobalPrompts(Base, PromptsMixin):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    project_id = Column(Integer, ForeignKey('projects.id'), nullable=True)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=True, index=True)
     specification_group_id = Column(Integer, ForeignKey('specification_groups.id'), nullable=True)
 
     project = relationship("Project", back_populates="global_prompts")
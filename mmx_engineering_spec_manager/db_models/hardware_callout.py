@@ -13,7 +13,7 @@ class HardwareCallout(Base, CalloutMixin):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    project_id = Column(Integer, ForeignKey('projects.id'))
+    project_id = Column(Integer, ForeignKey('projects.id'), index=True)
     specification_group_id = Column(Integer, ForeignKey('specification_groups.id'), nullable=True)
 
     project = relationship("Project", back_populates="hardware_callouts")
@@ -11,7 +11,7 @@ class Location(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String)
-    project_id = Column(Integer, ForeignKey('projects.id'))
+    project_id = Column(Integer, ForeignKey('projects.id'), index=True)
 
     project = relationship("Project", back_populates="locations")
     products = relationship("Product", back_populates="location")
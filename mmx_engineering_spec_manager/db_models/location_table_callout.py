@@ -14,8 +14,8 @@ class LocationTableCallout(Base, CalloutMixin):
     __tablename__ = 'location_table_callouts'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(Integer, ForeignKey('projects.id'))
-    location_id = Column(Integer, ForeignKey('locations.id'))
+    project_id = Column(Integer, ForeignKey('projects.id'), index=True)
+    location_id = Column(Integer, ForeignKey('locations.id'), index=True)
     # Explicit type for table rows (e.g., Finish/Hardware/Sink/Appliance/Uncategorized)
     type = Column(String)
 
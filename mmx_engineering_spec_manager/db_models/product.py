@@ -23,10 +23,13 @@ class Product(Base):
     y_origin_from_face = Column(Float, nullable=True)
     # ZOrigin: distance from bottom of wall (elevation y)
     z_origin_from_bottom = Column(Float, nullable=True)
+    # Digest of the incoming product last saved into this row (see DataManager._save_products_diff);
+    # cleared by writers that change the row any other way
+    content_digest = Column(String, nullable=True)
 
-    project_id = Column(Integer, ForeignKey('projects.id'))
-    location_id = Column(Integer, ForeignKey('locations.id'))
-    wall_id = Column(Integer, ForeignKey('walls.id'), nullable=True)
+    project_id = Column(Integer, ForeignKey('projects.id'), index=True)
+    location_id = Column(Integer, ForeignKey('locations.id'), index=True)
+    wall_id = Column(Integer, ForeignKey('walls.id'), nullable=True, index=True)
     specification_group_id = Column(Integer, ForeignKey('specification_groups.id'), nullable=True)
 
     project = relationship("Project", back_populates="products")
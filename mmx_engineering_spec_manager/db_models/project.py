@@ -10,7 +10,8 @@ class Project(Base):
     __tablename__ = 'projects'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    number = Column(String)
+    # Unique index: sync and ingest look projects up by Innergy number
+    number = Column(String, unique=True, index=True)
     name = Column(String)
     job_description = Column(String)
     job_address = Column(String)
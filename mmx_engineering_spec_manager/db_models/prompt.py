@@ -13,12 +13,12 @@ class Prompt(Base):
     name = Column(String)
     value = Column(String)
 
-    product_id = Column(Integer, ForeignKey('products.id'), nullable=True)
+    product_id = Column(Integer, ForeignKey('products.id'), nullable=True, index=True)
     specification_group_id = Column(Integer, ForeignKey('specification_groups.id'), nullable=True)
-    global_prompts_id = Column(Integer, ForeignKey('global_prompts.id'), nullable=True)
-    wizard_prompts_id = Column(Integer, ForeignKey('wizard_prompts.id'), nullable=True)
+    global_prompts_id = Column(Integer, ForeignKey('global_prompts.id'), nullable=True, index=True)
+    wizard_prompts_id = Column(Integer, ForeignKey('wizard_prompts.id'), nullable=True, index=True)
 
-    parent_id = Column(Integer, ForeignKey('prompts.id'), nullable=True)
+    parent_id = Column(Integer, ForeignKey('prompts.id'), nullable=True, index=True)
 
     product = relationship("Product", back_populates="prompts")
     specification_group = relationship("SpecificationGroup", back_populates="prompts")
@@ -21,8 +21,8 @@ class Wall(Base):
     angle = Column(Float)
     thicknesses = Column(Float)
 
-    project_id = Column(Integer, ForeignKey('projects.id'))
-    location_id = Column(Integer, ForeignKey('locations.id'))
+    project_id = Column(Integer, ForeignKey('projects.id'), index=True)
+    location_id = Column(Integer, ForeignKey('locations.id'), index=True)
 
     project = relationship("Project", back_populates="walls")
     location = relationship("Location", back_populates="walls")
@@ -1,6 +1,18 @@
 from .project_dto import ProjectDTO, LocationDTO, ProductDTO, CustomFieldDTO
 from .prompt_dto import PromptDTO
 from .ingest_dto import IngestProjectDTO
+from .product_save_dto import ProductSaveStats
+from .product_batch import ProductBatch
+from .search_dto import SearchHit
+from .project_snapshot import (
+    CustomFieldSnapshot,
+    LocationSnapshot,
+    ProductColumns,
+    ProductSnapshot,
+    ProjectSnapshot,
+    SpecificationGroupSnapshot,
+    WallSnapshot,
+)
 __all__ = [
     "ProjectDTO",
     "LocationDTO",
@@ -8,4 +20,14 @@ __all__ = [
     "CustomFieldDTO",
     "PromptDTO",
     "IngestProjectDTO",
+    "ProductSaveStats",
+    "ProductBatch",
+    "SearchHit",
+    "ProjectSnapshot",
+    "LocationSnapshot",
+    "WallSnapshot",
+    "ProductSnapshot",
+    "ProductColumns",
+    "CustomFieldSnapshot",
+    "SpecificationGroupSnapshot",
 ]
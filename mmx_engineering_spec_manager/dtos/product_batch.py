@@ -0,0 +1,92 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .project_dto import CustomFieldDTO, ProductDTO
+
+# Scalar columns of ProductBatch, in the key order of the product dicts it stands in for
+PRODUCT_BATCH_COLUMNS = (
+    "name", "quantity", "description", "location",
+    "width", "height", "depth", "x_origin", "y_origin", "z_origin",
+    "item_number", "comment", "angle",
+    "link_id_specification_group", "link_id_location", "link_id_wall",
+    "file_name", "picture_name",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ProductBatch(Sequence):
+    """Innergy budget products stored column-wise, as produced by parse_budget_products.
+
+    Every scalar attribute is one tuple aligned by row; location and specification group
+    names are interned so repeated values share one string. Custom fields are flattened
+    into cf_names / cf_values, and product i owns the slice cf_offsets[i]:cf_offsets[i + 1].
+
+    The batch is also a read-only sequence of product dicts (name, quantity, description,
+    custom_fields, location and the extended attributes), built on access, so code written
+    against the old list-of-dicts result keeps working.
+    """
+    name: Tuple[str, ...] = ()
+    quantity: Tuple[Any, ...] = ()
+    description: Tuple[str, ...] = ()
+    location: Tuple[Any, ...] = ()
+    width: Tuple[Any, ...] = ()
+    height: Tuple[Any, ...] = ()
+    depth: Tuple[Any, ...] = ()
+    x_origin: Tuple[Any, ...] = ()
+    y_origin: Tuple[Any, ...] = ()
+    z_origin: Tuple[Any, ...] = ()
+    item_number: Tuple[Any, ...] = ()
+    comment: Tuple[Any, ...] = ()
+    angle: Tuple[Any, ...] = ()
+    link_id_specification_group: Tuple[Any, ...] = ()
+    link_id_location: Tuple[Any, ...] = ()
+    link_id_wall: Tuple[Any, ...] = ()
+    file_name: Tuple[Any, ...] = ()
+    picture_name: Tuple[Any, ...] = ()
+    cf_offsets: Tuple[int, ...] = (0,)
+    cf_names: Tuple[str, ...] = ()
+    cf_values: Tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(len(self))[index]]
+        return self.row(index)
+
+    def custom_fields_of(self, index: int) -> List[Tuple[str, Any]]:
+        """(name, value) pairs of product index."""
+        start, end = self.cf_offsets[index], self.cf_offsets[index + 1]
+        return list(zip(self.cf_names[start:end], self.cf_values[start:end]))
+
+    def row(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("product index out of range")
+        out: Dict[str, Any] = {}
+        for c in PRODUCT_BATCH_COLUMNS:
+            out[c] = getattr(self, c)[index]
+        out["custom_fields"] = [{"name": n, "value": v} for n, v in self.custom_fields_of(index)]
+        return out
+
+    def group_by(self, column: str) -> Dict[Any, List[int]]:
+        """Row indices bucketed by a column value, in first-seen order."""
+        buckets: Dict[Any, List[int]] = {}
+        for i, v in enumerate(getattr(self, column)):
+            buckets.setdefault(v, []).append(i)
+        return buckets
+
+    def to_dtos(self) -> List[ProductDTO]:
+        return [
+            ProductDTO(
+                name=self.name[i],
+                quantity=self.quantity[i],
+                description=self.description[i],
+                custom_fields=[CustomFieldDTO(name=n, value=v) for n, v in self.custom_fields_of(i)],
+            )
+            for i in range(len(self))
+        ]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ProductSaveStats:
+    """Row counts from a differential product save into a per-project DB."""
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    # Row ids behind the counts (not part of equality, so tests can compare counts alone)
+    inserted_ids: Tuple[int, ...] = field(default=(), compare=False, repr=False)
+    updated_ids: Tuple[int, ...] = field(default=(), compare=False, repr=False)
+    deleted_ids: Tuple[int, ...] = field(default=(), compare=False, repr=False)
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    @property
+    def changed_ids(self) -> Tuple[int, ...]:
+        return self.inserted_ids + self.updated_ids + self.deleted_ids
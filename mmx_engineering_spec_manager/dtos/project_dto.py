@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -29,5 +29,6 @@ class ProjectDTO:
     job_description: str = ""
     job_address: str = ""
     locations: List[LocationDTO] = field(default_factory=list)
-    products: List[ProductDTO] = field(default_factory=list)
+    # ProductDTOs, or the ProductBatch produced by map_project_payload_to_dto
+    products: Sequence[Any] = field(default_factory=list)
     custom_fields: List[CustomFieldDTO] = field(default_factory=list)
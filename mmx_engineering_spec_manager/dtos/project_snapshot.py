@@ -0,0 +1,149 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class CustomFieldSnapshot:
+    name: str
+    value: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class SpecificationGroupSnapshot:
+    id: int
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class LocationSnapshot:
+    id: int
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class WallSnapshot:
+    id: int
+    link_id: Optional[str] = None
+    location_id: Optional[int] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    depth: Optional[float] = None
+    x_origin: Optional[float] = None
+    y_origin: Optional[float] = None
+    z_origin: Optional[float] = None
+    angle: Optional[float] = None
+    thicknesses: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSnapshot:
+    """One product row, materialized from ProductColumns on demand."""
+    id: int
+    name: str
+    quantity: Optional[int]
+    width: Optional[float]
+    height: Optional[float]
+    depth: Optional[float]
+    x_origin_from_right: Optional[float]
+    y_origin_from_face: Optional[float]
+    z_origin_from_bottom: Optional[float]
+    location_id: Optional[int]
+    wall_id: Optional[int]
+    specification_group_id: Optional[int]
+    custom_fields: Tuple[CustomFieldSnapshot, ...] = ()
+
+
+# Column order of ProductColumns, matching the ProductSnapshot fields
+PRODUCT_COLUMNS = (
+    "id", "name", "quantity", "width", "height", "depth",
+    "x_origin_from_right", "y_origin_from_face", "z_origin_from_bottom",
+    "location_id", "wall_id", "specification_group_id", "custom_fields",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ProductColumns:
+    """Products of a project stored column-wise: one tuple per attribute, aligned by row.
+
+    Far smaller than one object per product, and geometry code can read a whole column
+    (e.g. width) without touching the rest. Iterating yields ProductSnapshot rows.
+    """
+    id: Tuple[int, ...] = ()
+    name: Tuple[str, ...] = ()
+    quantity: Tuple[Optional[int], ...] = ()
+    width: Tuple[Optional[float], ...] = ()
+    height: Tuple[Optional[float], ...] = ()
+    depth: Tuple[Optional[float], ...] = ()
+    x_origin_from_right: Tuple[Optional[float], ...] = ()
+    y_origin_from_face: Tuple[Optional[float], ...] = ()
+    z_origin_from_bottom: Tuple[Optional[float], ...] = ()
+    location_id: Tuple[Optional[int], ...] = ()
+    wall_id: Tuple[Optional[int], ...] = ()
+    specification_group_id: Tuple[Optional[int], ...] = ()
+    custom_fields: Tuple[Tuple[CustomFieldSnapshot, ...], ...] = ()
+
+    @classmethod
+    def from_rows(cls, rows: Any) -> "ProductColumns":
+        """Build from row tuples laid out as PRODUCT_COLUMNS."""
+        rows = list(rows)
+        if not rows:
+            return cls()
+        return cls(*(tuple(col) for col in zip(*rows)))
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def row(self, index: int) -> ProductSnapshot:
+        return ProductSnapshot(*(getattr(self, c)[index] for c in PRODUCT_COLUMNS))
+
+    def __iter__(self) -> Iterator[ProductSnapshot]:
+        for values in zip(*(getattr(self, c) for c in PRODUCT_COLUMNS)):
+            yield ProductSnapshot(*values)
+
+    def rows_where(self, column: str, value: Any) -> Tuple[ProductSnapshot, ...]:
+        col = getattr(self, column)
+        return tuple(self.row(i) for i, v in enumerate(col) if v == value)
+
+    def group_by(self, column: str) -> Dict[Any, Tuple[ProductSnapshot, ...]]:
+        """Rows bucketed by a column value in one pass (e.g. wall_id -> products)."""
+        buckets: Dict[Any, list] = {}
+        for i, v in enumerate(getattr(self, column)):
+            buckets.setdefault(v, []).append(i)
+        return {k: tuple(self.row(i) for i in idx) for k, idx in buckets.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectSnapshot:
+    """Immutable, session-free view of a project's Location -> Wall -> Product hierarchy.
+
+    Built from Core SELECTs (DataManager.get_project_snapshot), so it carries no ORM state
+    and can be handed across threads. Attribute names mirror the ORM models so views that
+    read a Project with getattr work unchanged.
+    """
+    id: int
+    number: Optional[str] = None
+    name: Optional[str] = None
+    job_description: Optional[str] = None
+    job_address: Optional[str] = None
+    locations: Tuple[LocationSnapshot, ...] = ()
+    walls: Tuple[WallSnapshot, ...] = ()
+    product_columns: ProductColumns = ProductColumns()
+    custom_fields: Tuple[CustomFieldSnapshot, ...] = ()
+    specification_groups: Tuple[SpecificationGroupSnapshot, ...] = ()
+
+    @property
+    def products(self) -> Tuple[ProductSnapshot, ...]:
+        return tuple(self.product_columns)
+
+    def location_by_id(self) -> Dict[int, LocationSnapshot]:
+        return {loc.id: loc for loc in self.locations}
+
+    def walls_for_location(self, location_id: Optional[int]) -> Tuple[WallSnapshot, ...]:
+        return tuple(w for w in self.walls if w.location_id == location_id)
+
+    def products_for_location(self, location_id: Optional[int]) -> Tuple[ProductSnapshot, ...]:
+        return self.product_columns.rows_where("location_id", location_id)
+
+    def products_for_wall(self, wall_id: Optional[int]) -> Tuple[ProductSnapshot, ...]:
+        return self.product_columns.rows_where("wall_id", wall_id)
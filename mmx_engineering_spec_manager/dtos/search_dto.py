@@ -0,0 +1,21 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked full-text match from the cross-project search index.
+
+    kind is "project", "product", "custom_field" or "callout"; ref_id is the row id in the
+    project's own DB (product id for product fields). Lower rank is a better match (bm25).
+    """
+    project_id: int
+    kind: str
+    title: str
+    snippet: str = ""
+    ref_id: Optional[int] = None
+    field: Optional[str] = None
+    project_number: Optional[str] = None
+    project_name: Optional[str] = None
+    rank: float = 0.0
@@ -1,12 +1,136 @@
 from __future__ import annotations
+import os
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
 import xml.etree.ElementTree as ET
 
+from mmx_engineering_spec_manager.utilities.logging_config import get_logger
+
 from .contracts import ProjectExporter, ExportResult
 from .registry import register_exporter
 
 
+# progress(products_written, total_products)
+ProgressCallback = Callable[[int, int], None]
+
+# Same replacements, in the same order, as ElementTree's attribute serializer
+_ATTR_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
+_STREAM_BUFFER_SIZE = 1 << 16
+
+
+def _project_attrs(project: Any) -> Dict[str, str]:
+    return {
+        "number": str(getattr(project, "number", "")),
+        "name": str(getattr(project, "name", "")),
+        "job_description": str(getattr(project, "job_description", "")),
+    }
+
+
+def _product_attrs(p: Any) -> Dict[str, str]:
+    attrs: Dict[str, str] = {
+        "name": str(getattr(p, "name", "")),
+        "quantity": str(getattr(p, "quantity", "") or ""),
+        "width": str(getattr(p, "width", "") or ""),
+        "height": str(getattr(p, "height", "") or ""),
+        "depth": str(getattr(p, "depth", "") or ""),
+    }
+    # Microvellum origins if available
+    xori = getattr(p, "x_origin_from_right", None)
+    yori = getattr(p, "y_origin_from_face", None)
+    zori = getattr(p, "z_origin_from_bottom", None)
+    if xori is not None:
+        attrs["XOrigin"] = str(xori)
+    if yori is not None:
+        attrs["YOrigin"] = str(yori)
+    if zori is not None:
+        attrs["ZOrigin"] = str(zori)
+    return attrs
+
+
+def _iter_products(project: Any) -> Tuple[Iterable[Any], int]:
+    """Products to export and their count, without materializing a snapshot's rows."""
+    # ProjectSnapshot keeps products column-wise; iterating the columns yields one row at a time
+    columns = getattr(project, "product_columns", None)
+    if columns is not None:
+        return columns, len(columns)
+    products = getattr(project, "products", []) or []
+    try:
+        total = len(products)
+    except TypeError:
+        total = 0
+    return products, total
+
+
+@contextmanager
+def _replace_on_success(out_path: Path) -> Iterator[Path]:
+    """Yield a temporary path next to out_path and move it over out_path once the block succeeds.
+
+    Streaming writes can fail part-way through; a failed export removes its partial file and
+    leaves any previous export at out_path untouched.
+    """
+    tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+class _StreamingXmlWriter:
+    """Incremental writer producing the same text as ElementTree.write(xml_declaration=True).
+
+    Start tags are held back until the element's first child arrives, so an element that
+    ends up empty is written in ElementTree's short form (<Tag a="1" />).
+    """
+
+    def __init__(self, write: Callable[[str], Any]):
+        self._write = write
+        self._pending: Optional[Tuple[str, Dict[str, str]]] = None
+
+    @staticmethod
+    def _tag(tag: str, attrs: Dict[str, str]) -> str:
+        return tag + "".join(f' {k}="{escape(v, _ATTR_ENTITIES)}"' for k, v in attrs.items())
+
+    def _flush_pending(self) -> None:
+        if self._pending is not None:
+            tag, attrs = self._pending
+            self._write(f"<{self._tag(tag, attrs)}>")
+            self._pending = None
+
+    def declaration(self, encoding: str) -> None:
+        self._write(f"<?xml version='1.0' encoding='{encoding}'?>\n")
+
+    def start(self, tag: str, attrs: Optional[Dict[str, str]] = None) -> None:
+        self._flush_pending()
+        self._pending = (tag, attrs or {})
+
+    def end(self, tag: str) -> None:
+        if self._pending is not None:
+            self._write(f"<{self._tag(*self._pending)} />")
+            self._pending = None
+        else:
+            self._write(f"</{tag}>")
+
+    def empty(self, tag: str, attrs: Optional[Dict[str, str]] = None) -> None:
+        self._flush_pending()
+        self._write(f"<{self._tag(tag, attrs or {})} />")
+
+    def text(self, tag: str, value: Any) -> None:
+        """<tag>value</tag>; nothing is written when value is None."""
+        if value is None:
+            return
+        self._flush_pending()
+        self._write(f"<{tag}>{escape(str(value))}</{tag}>")
+
+
 class MicrovellumXmlExporter(ProjectExporter):
     """Minimal Microvellum-like XML exporter for MVP/testing.
 
@@ -17,6 +141,14 @@ class MicrovellumXmlExporter(ProjectExporter):
                  XOrigin="..." YOrigin="..." ZOrigin="..." />
       </Products>
     </Project>
+
+    Options:
+      filename: output file name (default "<number>.xml")
+      streaming: write elements to the file as they are produced instead of building an
+                 ElementTree first; memory stays flat regardless of product count and the
+                 bytes written are identical to the tree-based output
+      progress: callable(products_written, total_products), invoked every
+                progress_every products (default 1000) and once at the end
     """
 
     @property
@@ -30,46 +162,265 @@ class MicrovellumXmlExporter(ProjectExporter):
         out_path = target_dir / filename
 
         try:
-            root = ET.Element(
-                "Project",
-                attrib={
-                    "number": str(getattr(project, "number", "")),
-                    "name": str(getattr(project, "name", "")),
-                    "job_description": str(getattr(project, "job_description", "")),
-                },
-            )
-
-            products_parent = ET.SubElement(root, "Products")
-            products = getattr(project, "products", []) or []
+            with _replace_on_success(out_path) as tmp_path:
+                if options.get("streaming"):
+                    self._write_streaming(
+                        project,
+                        tmp_path,
+                        progress=options.get("progress"),
+                        progress_every=int(options.get("progress_every") or 1000),
+                    )
+                else:
+                    self._write_tree(project, tmp_path, progress=options.get("progress"))
+            return ExportResult(success=True, message="Exported Microvellum XML", output_paths=[out_path])
+        except Exception as e:
+            return ExportResult(success=False, message=f"XML export failed: {e}", output_paths=[])
+
+    def _write_tree(self, project: Any, out_path: Path, progress: Optional[ProgressCallback] = None) -> None:
+        root = ET.Element("Project", attrib=_project_attrs(project))
+        products_parent = ET.SubElement(root, "Products")
+        products, total = _iter_products(project)
+        count = 0
+        for p in products:
+            ET.SubElement(products_parent, "Product", attrib=_product_attrs(p))
+            count += 1
+
+        tree = ET.ElementTree(root)
+        # Write with XML declaration
+        tree.write(out_path, encoding="utf-8", xml_declaration=True)
+        if progress is not None:
+            progress(count, total or count)
+
+    def _write_streaming(
+        self,
+        project: Any,
+        out_path: Path,
+        progress: Optional[ProgressCallback] = None,
+        progress_every: int = 1000,
+    ) -> None:
+        products, total = _iter_products(project)
+        step = max(1, progress_every)
+        # Opened exactly as ElementTree.write opens a filename, so encoding/newlines match
+        with open(out_path, "w", encoding="utf-8", errors="xmlcharrefreplace", buffering=_STREAM_BUFFER_SIZE) as fh:
+            xml = _StreamingXmlWriter(fh.write)
+            xml.declaration("utf-8")
+            xml.start("Project", _project_attrs(project))
+            xml.start("Products")
+            count = 0
             for p in products:
-                attrs: Dict[str, str] = {
-                    "name": str(getattr(p, "name", "")),
-                    "quantity": str(getattr(p, "quantity", "") or ""),
-                    "width": str(getattr(p, "width", "") or ""),
-                    "height": str(getattr(p, "height", "") or ""),
-                    "depth": str(getattr(p, "depth", "") or ""),
-                }
-                # Microvellum origins if available
-                xori = getattr(p, "x_origin_from_right", None)
-                yori = getattr(p, "y_origin_from_face", None)
-                zori = getattr(p, "z_origin_from_bottom", None)
-                if xori is not None:
-                    attrs["XOrigin"] = str(xori)
-                if yori is not None:
-                    attrs["YOrigin"] = str(yori)
-                if zori is not None:
-                    attrs["ZOrigin"] = str(zori)
-
-                ET.SubElement(products_parent, "Product", attrib=attrs)
-
-            tree = ET.ElementTree(root)
-            # Write with XML declaration
-            tree.write(out_path, encoding="utf-8", xml_declaration=True)
+                xml.empty("Product", _product_attrs(p))
+                count += 1
+                if progress is not None and count % step == 0:
+                    progress(count, total or count)
+            xml.end("Products")
+            xml.end("Project")
+        if progress is not None and (count == 0 or count % step):
+            progress(count, total or count)
 
-            return ExportResult(success=True, message="Exported Microvellum XML", output_paths=[out_path])
+
+def _prompt_tree(prompts: Iterable[Any]) -> Tuple[List[Any], Dict[Any, List[Any]]]:
+    """Top-level prompts and a parent id -> children map, from a flat prompt list."""
+    prompts = list(prompts or [])
+    ids = {getattr(p, "id", None) for p in prompts}
+    roots: List[Any] = []
+    children: Dict[Any, List[Any]] = {}
+    for p in prompts:
+        parent_id = getattr(p, "parent_id", None)
+        if parent_id is not None and parent_id in ids:
+            children.setdefault(parent_id, []).append(p)
+        else:
+            roots.append(p)
+    return roots, children
+
+
+class _ProjectLookups:
+    """Name resolution for one export, built once from the pre-fetched project graph.
+
+    Products only carry location/wall/specification-group ids; every LinkID* element is a
+    dict lookup here instead of a relationship access per product.
+    """
+
+    def __init__(self, project: Any):
+        self.location_names: Dict[Any, str] = {}
+        for loc in getattr(project, "locations", None) or []:
+            self.location_names[getattr(loc, "id", None)] = str(getattr(loc, "name", "") or "")
+        self.wall_link_ids: Dict[Any, str] = {}
+        for w in getattr(project, "walls", None) or []:
+            wid = getattr(w, "id", None)
+            self.wall_link_ids[wid] = str(getattr(w, "link_id", None) or f"Wall {wid}")
+        self.spec_group_names: Dict[Any, str] = {}
+        for sg in getattr(project, "specification_groups", None) or []:
+            self.spec_group_names[getattr(sg, "id", None)] = str(getattr(sg, "name", "") or "")
+        # Global/Wizard prompt sets grouped by owning specification group (None = no group, not exported)
+        self.globals_by_group: Dict[Any, List[Any]] = {}
+        self.wizards_by_group: Dict[Any, List[Any]] = {}
+        for attr, bucket in (("global_prompts", self.globals_by_group), ("wizard_prompts", self.wizards_by_group)):
+            for ps in getattr(project, attr, None) or []:
+                sg_id = getattr(ps, "specification_group_id", None)
+                bucket.setdefault(sg_id, []).append(ps)
+                sg = getattr(ps, "specification_group", None)
+                if sg_id is not None and sg_id not in self.spec_group_names:
+                    self.spec_group_names[sg_id] = str(getattr(sg, "name", "") or "") if sg is not None else f"Specification Group {sg_id}"
+
+
+class MicrovellumProjectXmlExporter(ProjectExporter):
+    """Full Microvellum project XML, following the import samples in example_data/microvellum/xml:
+
+    <Root Application="Microvellum" ApplicationVersion="7.0">
+      <Project Name="...">
+        <JobNumber/> <JobDescription/> <JobAddress/>
+        <SpecificationGroups> SpecificationGroup > Global/Wizard > Prompts </SpecificationGroups>
+        <Locations/> <Walls/>
+        <Products> Product > dimensions, origins, LinkID* names, Prompts </Products>
+      </Project>
+    </Root>
+
+    Expects a fully loaded project graph (DataManager.get_full_project_from_project_db). Location,
+    wall and specification group names are resolved through maps built once per export, and the
+    file is written incrementally, so export time and memory stay linear in the job size.
+    Accepts the same filename/progress/progress_every options as MicrovellumXmlExporter.
+    """
+
+    application_version = "7.0"
+
+    @property
+    def name(self) -> str:
+        return "microvellum_project_xml"
+
+    def export(self, project: Any, target_dir: Path, options: Dict[str, Any] | None = None) -> ExportResult:
+        options = options or {}
+        target_dir.mkdir(parents=True, exist_ok=True)
+        filename = options.get("filename") or f"{getattr(project, 'number', 'project')}.xml"
+        out_path = target_dir / filename
+
+        try:
+            with _replace_on_success(out_path) as tmp_path:
+                self._write(
+                    project,
+                    tmp_path,
+                    progress=options.get("progress"),
+                    progress_every=int(options.get("progress_every") or 1000),
+                )
+            return ExportResult(success=True, message="Exported Microvellum project XML", output_paths=[out_path])
         except Exception as e:
             return ExportResult(success=False, message=f"XML export failed: {e}", output_paths=[])
 
+    def _write(self, project: Any, out_path: Path, progress: Optional[ProgressCallback] = None, progress_every: int = 1000) -> None:
+        lookups = _ProjectLookups(project)
+        products = list(getattr(project, "products", None) or [])
+        total = len(products)
+        step = max(1, progress_every)
+        with open(out_path, "w", encoding="utf-8", errors="xmlcharrefreplace", buffering=_STREAM_BUFFER_SIZE) as fh:
+            xml = _StreamingXmlWriter(fh.write)
+            xml.declaration("utf-8")
+            xml.start("Root", {"Application": "Microvellum", "ApplicationVersion": self.application_version})
+            xml.start("Project", {"Name": str(getattr(project, "name", "") or "")})
+            xml.text("JobNumber", getattr(project, "number", None))
+            xml.text("JobDescription", getattr(project, "job_description", None))
+            xml.text("JobAddress", getattr(project, "job_address", None))
+            self._write_specification_groups(xml, lookups)
+            self._write_locations(xml, project)
+            self._write_walls(xml, project, lookups)
+            xml.start("Products")
+            count = 0
+            for p in products:
+                self._write_product(xml, p, lookups)
+                count += 1
+                if progress is not None and count % step == 0:
+                    progress(count, total)
+            xml.end("Products")
+            xml.end("Project")
+            xml.end("Root")
+        if progress is not None and (count == 0 or count % step):
+            progress(count, total)
+
+    def _write_prompts(self, xml: _StreamingXmlWriter, prompts: Iterable[Any]) -> None:
+        roots, children = _prompt_tree(prompts)
+        if not roots:
+            return
+
+        def _one(prompt: Any) -> None:
+            xml.start("Prompt", {"Name": str(getattr(prompt, "name", "") or "")})
+            xml.text("Value", getattr(prompt, "value", None))
+            for child in children.get(getattr(prompt, "id", None), ()):
+                _one(child)
+            xml.end("Prompt")
+
+        xml.start("Prompts")
+        for prompt in roots:
+            _one(prompt)
+        xml.end("Prompts")
+
+    def _write_prompt_sets(self, xml: _StreamingXmlWriter, tag: str, prompt_sets: Iterable[Any]) -> None:
+        for ps in prompt_sets:
+            xml.start(tag, {"Name": str(getattr(ps, "name", "") or "")})
+            self._write_prompts(xml, getattr(ps, "prompts", None))
+            xml.end(tag)
+
+    def _write_specification_groups(self, xml: _StreamingXmlWriter, lookups: _ProjectLookups) -> None:
+        groups = sorted(lookups.spec_group_names.items(), key=lambda kv: (kv[1].lower(), kv[0]))
+        # Microvellum only reads Global/Wizard prompt sets inside a SpecificationGroup
+        for tag, prompt_sets in (("Global", lookups.globals_by_group.get(None, ())), ("Wizard", lookups.wizards_by_group.get(None, ()))):
+            if prompt_sets:
+                get_logger(__name__).warning(
+                    "Skipping %d %s prompt set(s) without a specification group: %s", len(prompt_sets), tag,
+                    ", ".join(str(getattr(ps, "name", "") or "") for ps in prompt_sets),
+                )
+        if not groups:
+            return
+        xml.start("SpecificationGroups")
+        for sg_id, name in groups:
+            xml.start("SpecificationGroup", {"Name": name})
+            self._write_prompt_sets(xml, "Global", lookups.globals_by_group.get(sg_id, ()))
+            self._write_prompt_sets(xml, "Wizard", lookups.wizards_by_group.get(sg_id, ()))
+            xml.end("SpecificationGroup")
+        xml.end("SpecificationGroups")
+
+    def _write_locations(self, xml: _StreamingXmlWriter, project: Any) -> None:
+        locations = getattr(project, "locations", None) or []
+        if not locations:
+            return
+        xml.start("Locations")
+        for loc in locations:
+            xml.empty("Location", {"Name": str(getattr(loc, "name", "") or "")})
+        xml.end("Locations")
+
+    def _write_walls(self, xml: _StreamingXmlWriter, project: Any, lookups: _ProjectLookups) -> None:
+        walls = getattr(project, "walls", None) or []
+        if not walls:
+            return
+        xml.start("Walls")
+        for w in walls:
+            link_id = lookups.wall_link_ids.get(getattr(w, "id", None))
+            xml.start("Wall", {"Name": link_id or ""})
+            xml.text("LinkID", getattr(w, "link_id", None))
+            xml.text("LinkIDLocation", lookups.location_names.get(getattr(w, "location_id", None)) or getattr(w, "link_id_location", None))
+            for tag, attr in (("Width", "width"), ("Height", "height"), ("Depth", "depth"), ("XOrigin", "x_origin"),
+                              ("YOrigin", "y_origin"), ("ZOrigin", "z_origin"), ("Angle", "angle")):
+                xml.text(tag, getattr(w, attr, None))
+            xml.end("Wall")
+        xml.end("Walls")
+
+    def _write_product(self, xml: _StreamingXmlWriter, p: Any, lookups: _ProjectLookups) -> None:
+        # ItemNumber/Comment/Angle/FileName/PictureName are stored as product custom fields
+        extras = {getattr(cf, "name", None): getattr(cf, "value", None) for cf in getattr(p, "custom_fields", None) or []}
+        xml.start("Product", {"Name": str(getattr(p, "name", "") or "")})
+        xml.text("Quantity", getattr(p, "quantity", None))
+        xml.text("Width", getattr(p, "width", None))
+        xml.text("Height", getattr(p, "height", None))
+        xml.text("Depth", getattr(p, "depth", None))
+        for tag in ("ItemNumber", "Comment", "FileName", "PictureName", "Angle"):
+            xml.text(tag, extras.get(tag))
+        xml.text("XOrigin", getattr(p, "x_origin_from_right", None))
+        xml.text("YOrigin", getattr(p, "y_origin_from_face", None))
+        xml.text("ZOrigin", getattr(p, "z_origin_from_bottom", None))
+        xml.text("LinkIDSpecificationGroup", lookups.spec_group_names.get(getattr(p, "specification_group_id", None)))
+        xml.text("LinkIDLocation", lookups.location_names.get(getattr(p, "location_id", None)))
+        xml.text("LinkIDWall", lookups.wall_link_ids.get(getattr(p, "wall_id", None)))
+        self._write_prompts(xml, getattr(p, "prompts", None))
+        xml.end("Product")
+
 
 # Auto-register on import for convenience
 register_exporter("microvellum_xml", lambda: MicrovellumXmlExporter())
+register_exporter("microvellum_project_xml", lambda: MicrovellumProjectXmlExporter())
@@ -1,15 +1,50 @@
 import os
-import requests
+from typing import Iterator, List, Optional
+
 from dotenv import load_dotenv
 
+from mmx_engineering_spec_manager.importers.innergy_cache import InnergyReplaySource, InnergyResponseCache
+from mmx_engineering_spec_manager.importers.innergy_client import InnergyClient, InnergyHTTPError
 from mmx_engineering_spec_manager.utilities.settings import get_settings
 from mmx_engineering_spec_manager.utilities.logging_config import get_logger
 
 load_dotenv()
 
 
+def _is_active_project(item: dict) -> bool:
+    # Include only projects with active status (case-insensitive). Status may be a string or a dict with Name.
+    status_val = item.get("Status")
+    if isinstance(status_val, str):
+        return status_val.strip().lower() == "open"
+    if isinstance(status_val, dict):
+        name = status_val.get("Name") or status_val.get("name")
+        if isinstance(name, str):
+            return name.strip().lower() == "active"
+    return False
+
+
+def _project_summary(item: dict) -> dict:
+    return {
+        "Id": item.get("Id"),
+        "Number": item.get("Number"),
+        "Name": item.get("Name", ""),
+        "Address": item.get("Address", "")
+    }
+
+
+def _cache_options(settings) -> dict:
+    """Response cache / offline / replay options for InnergyClient from Settings."""
+    cache_dir = getattr(settings, "innergy_cache_dir", None)
+    replay_dir = getattr(settings, "innergy_replay_dir", None)
+    return {
+        "cache": InnergyResponseCache(cache_dir, getattr(settings, "innergy_cache_ttl_s", 0.0)) if cache_dir else None,
+        "offline": bool(getattr(settings, "innergy_offline", False)),
+        "replay": InnergyReplaySource(replay_dir) if replay_dir else None,
+    }
+
+
 class InnergyImporter:
-    def __init__(self):
+    def __init__(self, client: Optional[InnergyClient] = None):
         settings = get_settings()
         self.api_key = settings.innergy_api_key
         self.base_url = settings.innergy_base_url
@@ -27,72 +62,70 @@ class InnergyImporter:
         except Exception:  # pragma: no cover
             pass
         self._logger = get_logger(__name__)
+        # Shared pooled Session underneath; settings may be a lightweight stand-in in tests
+        self.client = client or InnergyClient(
+            self.base_url,
+            self.api_key,
+            timeout=(5.0, float(getattr(settings, "innergy_timeout_s", 30.0) or 30.0)),
+            max_retries=int(getattr(settings, "innergy_max_retries", 3) or 0),
+            backoff_factor=float(getattr(settings, "innergy_backoff_s", 0.5) or 0.0),
+            page_size=getattr(settings, "innergy_page_size", None),
+            **_cache_options(settings),
+        )
 
     def _headers(self):
         """Return headers expected by Innergy API (per Postman screenshot).
         Uses custom API-KEY header rather than Authorization.
         """
-        return {
-            "API-KEY": str(self.api_key) if self.api_key is not None else "",
-            "Accept": "*/*",
-            "Connection": "keep-alive",
-        }
+        return self.client.headers()
 
     def get_job_details(self, job_id):
-        url = f"{self.base_url}/api/projects/{job_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.client.get(f"/api/projects/{job_id}")
         if response.status_code == 200:
             return response.json()
         self._logger.warning("Innergy get_job_details non-200: %s", response.status_code)
         return None
 
+    def iter_project_pages(self) -> Iterator[List[dict]]:
+        """Yield active project summaries one page at a time.
+
+        Raises InnergyHTTPError on a non-200 page so streaming callers can stop cleanly.
+        """
+        for items in self.client.iter_pages("/api/projects"):
+            yield [_project_summary(item) for item in items if _is_active_project(item)]
+
     def get_projects(self):
-        url = f"{self.base_url}/api/projects"
-        response = requests.get(url, headers=self._headers())
-        if response.status_code == 200:
+        try:
             filtered_projects = []
-            payload = response.json()
-            # Place a breakpoint here to inspect 'payload' and payload.get("Items")
-            items = payload.get("Items", [])
-            for item in items:
-                # Include only projects with active status (case-insensitive). Status may be a string or a dict with Name.
-                status_val = item.get("Status")
-                is_active = False
-                if isinstance(status_val, str):
-                    is_active = status_val.strip().lower() == "open"
-                elif isinstance(status_val, dict):
-                    name = status_val.get("Name") or status_val.get("name")
-                    if isinstance(name, str):
-                        is_active = name.strip().lower() == "active"
-                if not is_active:
-                    continue
-                project_data = {
-                    "Id": item.get("Id"),
-                    "Number": item.get("Number"),
-                    "Name": item.get("Name", ""),
-                    "Address": item.get("Address", "")
-                }
-                filtered_projects.append(project_data)
+            for page in self.iter_project_pages():
+                filtered_projects.extend(page)
             return filtered_projects
-        self._logger.warning("Innergy get_projects non-200: %s", response.status_code)
-        return None
+        except InnergyHTTPError as e:
+            self._logger.warning("Innergy get_projects non-200: %s", e.status_code)
+            return None
 
     def get_projects_raw(self):
         """Return raw HTTP response content and status from projects endpoint for debugging/log display."""
-        url = f"{self.base_url}/api/projects"
-        response = requests.get(url, headers=self._headers())
+        response = self.client.get("/api/projects")
         try:
             text = response.text
         except Exception:
             text = "<no text>"
         return {"status_code": getattr(response, "status_code", None), "text": text}
 
+    def iter_budget_products(self, job_id) -> Iterator[dict]:
+        """Yield raw budgetProducts items (all fields) from a single download, page by page.
+
+        Raises InnergyHTTPError on a non-200 answer.
+        """
+        for item in self.client.iter_items(f"/api/projects/{job_id}/budgetProducts"):
+            if isinstance(item, dict):
+                yield item
+
     def get_products(self, job_id):
-        url = f"{self.base_url}/api/projects/{job_id}/budgetProducts"
-        response = requests.get(url, headers=self._headers())
-        if response.status_code == 200:
+        try:
             filtered_products = []
-            for item in response.json().get("Items", []):
+            for item in self.iter_budget_products(job_id):
                 # Only return the minimal set required by consumers/tests
                 custom_fields = []
                 for cf in item.get("CustomFields", []) or []:
@@ -105,20 +138,20 @@ class InnergyImporter:
                 }
                 filtered_products.append(product_data)
             return filtered_products
-        self._logger.warning("Innergy get_products non-200: %s", response.status_code)
-        return None
+        except InnergyHTTPError as e:
+            self._logger.warning("Innergy get_products non-200: %s", e.status_code)
+            return None
 
     def get_products_raw(self, job_id):
         """Return the full JSON payload from the budgetProducts endpoint for a job.
         This preserves fields like Location, dimensions, origins, link IDs, etc.,
         for callers that need extended attributes.
         """
-        url = f"{self.base_url}/api/projects/{job_id}/budgetProducts"
-        response = requests.get(url, headers=self._headers())
+        response = self.client.get(f"/api/projects/{job_id}/budgetProducts")
         if response.status_code == 200:
             try:
                 return response.json()
             except Exception:
                 return None
         self._logger.warning("Innergy get_products_raw non-200: %s", response.status_code)
-        return None
\ No newline at end of file
+        return None
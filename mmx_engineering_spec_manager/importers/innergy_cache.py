@@ -0,0 +1,202 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+from mmx_engineering_spec_manager.utilities.logging_config import get_logger
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response served from the cache or a replay file."""
+
+    def __init__(self, status_code: int, text: str, url: str = "", headers: Optional[Dict[str, str]] = None, from_cache: bool = True):
+        self.status_code = status_code
+        self.text = text
+        self.url = url
+        self.headers = dict(headers or {})
+        self.from_cache = from_cache
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    path: Optional[str] = field(default=None, repr=False)
+
+    def is_fresh(self, ttl_s: float) -> bool:
+        return ttl_s > 0 and (time.time() - self.fetched_at) < ttl_s
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional-request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> CachedResponse:
+        headers = {k: v for k, v in (("ETag", self.etag), ("Last-Modified", self.last_modified)) if v}
+        return CachedResponse(200, self.body, self.url, headers)
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None) -> str:
+    """URL plus sorted params, tagged with a hash of the API key so tenants never share entries."""
+    key = url if not params else f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+    if api_key:
+        key = f"{key}#key={hashlib.sha256(str(api_key).encode('utf-8')).hexdigest()[:16]}"
+    return key
+
+
+class InnergyResponseCache:
+    """On-disk cache of successful Innergy GET responses, one JSON file per endpoint + job id
+    and API key.
+
+    Entries carry the response ETag/Last-Modified so stale ones can be revalidated with a
+    conditional request (a 304 costs no body). Within ttl_s an entry is served without any
+    request; ttl_s=0 always revalidates. Writes are atomic (temp file + os.replace), so
+    concurrent ingest threads never see a torn entry.
+    """
+
+    def __init__(self, root_dir: str, ttl_s: float = 0.0):
+        self.root_dir = str(root_dir)
+        self.ttl_s = max(0.0, float(ttl_s or 0.0))
+        self._logger = get_logger(__name__)
+
+    def _file_for(self, key: str) -> Path:
+        # Readable prefix (endpoint and job id) plus a hash of the full key
+        parts = urlsplit(key)
+        slug = "".join(ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in parts.path.strip("/"))[:80]
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return Path(self.root_dir) / f"{slug or 'root'}-{digest}.json"
+
+    def load(self, url: str, params: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None) -> Optional[CacheEntry]:
+        path = self._file_for(cache_key(url, params, api_key))
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return CacheEntry(
+                url=data["url"],
+                body=data["body"],
+                fetched_at=float(data.get("fetched_at") or 0.0),
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                path=str(path),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning("Ignoring unreadable Innergy cache entry %s: %s", path, e)
+            return None
+
+    def store(self, url: str, params: Optional[Dict[str, Any]], response: Any, api_key: Optional[str] = None) -> Optional[CacheEntry]:
+        """Save a 200 response. Returns the entry, or None when the body is not cacheable text."""
+        if getattr(response, "status_code", None) != 200:
+            return None
+        try:
+            body = response.text
+        except Exception:
+            body = None
+        if not isinstance(body, str):
+            return None
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag") if hasattr(headers, "get") else None
+        last_modified = headers.get("Last-Modified") if hasattr(headers, "get") else None
+        entry = CacheEntry(
+            url=url,
+            body=body,
+            fetched_at=time.time(),
+            etag=etag if isinstance(etag, str) else None,
+            last_modified=last_modified if isinstance(last_modified, str) else None,
+        )
+        self._write(self._file_for(cache_key(url, params, api_key)), entry)
+        return entry
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Mark an entry as just revalidated (after a 304)."""
+        entry.fetched_at = time.time()
+        if entry.path:
+            self._write(Path(entry.path), entry)
+
+    def clear(self) -> int:
+        removed = 0
+        for p in Path(self.root_dir).glob("*.json"):
+            try:
+                p.unlink()
+                removed += 1
+            except OSError:  # pragma: no cover
+                pass
+        return removed
+
+    def _write(self, path: Path, entry: CacheEntry) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "url": entry.url,
+                "fetched_at": entry.fetched_at,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "body": entry.body,
+            }
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(payload, fh)
+                os.replace(tmp, path)
+            except Exception:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            entry.path = str(path)
+        except Exception as e:
+            # A cache write must never fail the import
+            self._logger.warning("Could not write Innergy cache entry %s: %s", path, e)
+
+
+class InnergyReplaySource:
+    """Serve Innergy endpoints from saved JSON files instead of the network.
+
+    /api/projects/<id>/budgetProducts maps to api_projects_<id>_budgetProducts.json, falling
+    back to api_projects_byid_budgetProducts.json, so example_data/innergy/json replays for
+    any job id. Missing files answer 404.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = str(root_dir)
+
+    def _candidates(self, url: str) -> List[str]:
+        segments = [s for s in urlsplit(url).path.strip("/").split("/") if s]
+        if not segments:
+            return []
+        names = ["_".join(segments)]
+        if len(segments) >= 3 and segments[:2] == ["api", "projects"]:
+            names.append("_".join(segments[:2] + ["byid"] + segments[3:]))
+        return [
+            "".join(ch if ch.isalnum() or ch in ("-", "_", ".") else "_" for ch in n) + ".json"
+            for n in names
+        ]
+
+    def response_for(self, url: str) -> CachedResponse:
+        for name in self._candidates(url):
+            path = Path(self.root_dir) / name
+            if path.is_file():
+                return CachedResponse(200, path.read_text(encoding="utf-8"), url)
+        return CachedResponse(404, "", url)
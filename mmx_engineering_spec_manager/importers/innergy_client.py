@@ -0,0 +1,279 @@
+from __future__ import annotations
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mmx_engineering_spec_manager.importers.innergy_cache import CachedResponse, InnergyReplaySource, InnergyResponseCache
+from mmx_engineering_spec_manager.utilities.logging_config import get_logger
+
+# Status codes worth retrying: rate limiting and transient server/gateway errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Keys a list payload may use to point at its next page
+_NEXT_LINK_KEYS = ("NextPageLink", "NextLink", "nextLink", "@odata.nextLink")
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _new_session(pool_size: int = 10) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled Session so every client reuses keep-alive connections."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = _new_session()
+        return _shared_session
+
+
+def reset_shared_session() -> None:
+    """Close and drop the shared Session (tests, or after changing network settings)."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            try:
+                _shared_session.close()
+            except Exception:  # pragma: no cover
+                pass
+        _shared_session = None
+
+
+class InnergyHTTPError(RuntimeError):
+    """Raised when Innergy answers with a non-success status after retries."""
+
+    def __init__(self, status_code: Optional[int], url: str):
+        super().__init__(f"Innergy request to {url} failed with status {status_code}")
+        self.status_code = status_code
+        self.url = url
+
+
+class InnergyClient:
+    """Thin HTTP client for the Innergy API.
+
+    - One pooled requests.Session shared across clients (keep-alive, connection reuse).
+    - (connect, read) timeouts on every request.
+    - Exponential backoff on 429/5xx and connection errors, honouring Retry-After.
+    - iter_pages() walks list endpoints page by page as a generator over "Items", with
+      guards against servers that ignore the paging parameters.
+    - Optional on-disk response cache (ETag/Last-Modified revalidation, TTL), offline mode
+      that only serves cached payloads, and a replay source that serves saved JSON files.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        timeout: float | tuple[float, float] = (5.0, 30.0),
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        page_size: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        cache: Optional[InnergyResponseCache] = None,
+        offline: bool = False,
+        replay: Optional[InnergyReplaySource] = None,
+        max_pages: int = 10_000,
+    ):
+        self.base_url = (base_url or "").rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_factor = max(0.0, float(backoff_factor))
+        self.max_backoff = float(max_backoff)
+        self.page_size = page_size
+        self._session = session
+        self._sleep = sleep
+        self.cache = cache
+        self.offline = bool(offline)
+        self.replay = replay
+        self.max_pages = max(1, int(max_pages))
+        self._logger = get_logger(__name__)
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session if self._session is not None else get_shared_session()
+
+    def headers(self) -> Dict[str, str]:
+        """Innergy expects a custom API-KEY header rather than Authorization."""
+        return {
+            "API-KEY": str(self.api_key) if self.api_key is not None else "",
+            "Accept": "*/*",
+            "Connection": "keep-alive",
+        }
+
+    def url(self, path: str) -> str:
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    # ---- Requests ----
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """GET through the replay source / cache, then the network with retries.
+
+        Returns the final response (which may still be non-2xx). Offline cache misses answer
+        504 without touching the network.
+        """
+        url = self.url(path)
+        if self.replay is not None:
+            return self.replay.response_for(url)  # type: ignore[return-value]
+        entry = self.cache.load(url, params, self.api_key) if self.cache is not None else None
+        if entry is not None and (self.offline or entry.is_fresh(self.cache.ttl_s)):
+            return entry.to_response()  # type: ignore[return-value]
+        if self.offline:
+            self._logger.info("Innergy offline mode: no cached response for %s", url)
+            return CachedResponse(504, "", url)  # type: ignore[return-value]
+        response = self._send(url, params, entry.validators() if entry is not None else None)
+        status = getattr(response, "status_code", None)
+        if status == 304 and entry is not None:
+            self.cache.touch(entry)
+            return entry.to_response()  # type: ignore[return-value]
+        if status == 200 and self.cache is not None:
+            self.cache.store(url, params, response, self.api_key)
+        return response
+
+    def _send(self, url: str, params: Optional[Dict[str, Any]], extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        attempt = 0
+        while True:
+            headers = self.headers()
+            if extra_headers:
+                headers.update(extra_headers)
+            kwargs: Dict[str, Any] = {"headers": headers, "timeout": self.timeout}
+            if params:
+                kwargs["params"] = params
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt, None)
+                self._logger.warning("Innergy GET %s failed (%s); retrying in %.1fs", url, e, delay)
+            else:
+                status = getattr(response, "status_code", None)
+                if status not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                delay = self._backoff(attempt, response)
+                self._logger.warning("Innergy GET %s returned %s; retrying in %.1fs", url, status, delay)
+            attempt += 1
+            (self._sleep or time.sleep)(delay)
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET and decode JSON; raises InnergyHTTPError on a non-200 answer."""
+        response = self.get(path, params)
+        if getattr(response, "status_code", None) != 200:
+            raise InnergyHTTPError(getattr(response, "status_code", None), self.url(path))
+        return response.json()
+
+    def iter_pages(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[List[Any]]:
+        """Yield the "Items" list of each page of a list endpoint.
+
+        Follows a next-page link when the payload carries one; the link is requested as is,
+        since it encodes its own paging parameters. Otherwise, when page_size is set, pages
+        are requested with skip/take until a short page comes back. Stops early when a page
+        repeats the previous one or a link comes back again (a server, or the replay source,
+        ignoring the paging parameters) and after max_pages pages. At most the current and
+        the previous page are held.
+        """
+        query: Dict[str, Any] = dict(params or {})
+        skip = 0
+        next_path: Optional[str] = path
+        following_link = False
+        seen_links: set[str] = set()
+        previous: Optional[List[Any]] = None
+        pages = 0
+        while next_path:
+            if following_link:
+                request_params = None
+            else:
+                request_params = dict(query)
+                if self.page_size:
+                    request_params.update({"skip": skip, "take": self.page_size})
+            payload = self.get_json(next_path, request_params or None)
+            items = payload.get("Items", []) if isinstance(payload, dict) else list(payload or [])
+            items = items or []
+            if previous is not None and items and items == previous:
+                self._logger.warning("Innergy paging of %s returned the same page twice; stopping", path)
+                return
+            yield items
+            pages += 1
+            if pages >= self.max_pages:
+                self._logger.warning("Innergy paging of %s stopped after %d pages", path, pages)
+                return
+            previous = items
+            link = next((payload.get(k) for k in _NEXT_LINK_KEYS if isinstance(payload, dict) and payload.get(k)), None)
+            if isinstance(link, str) and link:
+                if link in seen_links:
+                    self._logger.warning("Innergy paging of %s returned the same next link twice; stopping", path)
+                    return
+                seen_links.add(link)
+                next_path, following_link = link, True
+            elif not following_link and self.page_size and len(items) >= self.page_size:
+                skip += len(items)
+            else:
+                next_path = None
+
+    def iter_items(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        for page in self.iter_pages(path, params):
+            yield from page
+
+    # ---- Helpers ----
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = None
+        try:
+            if response is not None:
+                retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError, AttributeError):
+            retry_after = None
+        if retry_after is not None and retry_after >= 0:
+            return min(retry_after, self.max_backoff)
+        return min(self.backoff_factor * (2 ** attempt), self.max_backoff)
+
+
+def prefetch(iterable: Iterable[Any], depth: int = 1) -> Iterator[Any]:
+    """Iterate `iterable` on a background thread, keeping up to `depth` items ready.
+
+    Lets a consumer write page N while page N+1 downloads. Exceptions raised by the
+    producer are re-raised in the consumer.
+    """
+    q: "queue.Queue[tuple[str, Any]]" = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                q.put(("item", item))
+            q.put(("done", None))
+        except BaseException as e:  # pragma: no cover - surfaced to consumer
+            q.put(("error", e))
+
+    t = threading.Thread(target=_produce, name="innergy-prefetch", daemon=True)
+    t.start()
+    try:
+        while True:
+            kind, value = q.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                return
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Any, Dict, Iterable, List
 
 from mmx_engineering_spec_manager.dtos.project_dto import (
@@ -7,6 +8,7 @@ from mmx_engineering_spec_manager.dtos.project_dto import (
     ProductDTO,
     CustomFieldDTO,
 )
+from mmx_engineering_spec_manager.dtos.product_batch import ProductBatch
 
 
 def map_custom_fields_to_dtos(custom_fields: Iterable[Dict[str, Any]] | None) -> List[CustomFieldDTO]:
@@ -20,26 +22,116 @@ def map_custom_fields_to_dtos(custom_fields: Iterable[Dict[str, Any]] | None) ->
     return dtos
 
 
-def map_products_payload_to_dtos(products_payload: Any) -> List[ProductDTO]:
-    items: Iterable[Dict[str, Any]]
+def _products_payload_items(products_payload: Any) -> Iterable[Dict[str, Any]]:
     if isinstance(products_payload, dict) and "Items" in products_payload:
-        items = products_payload.get("Items", [])
-    elif isinstance(products_payload, list):
-        items = products_payload
-    else:
-        items = []
+        return products_payload.get("Items", []) or []
+    if isinstance(products_payload, list):
+        return products_payload
+    return []
+
+
+def map_products_payload_to_batch(products_payload: Any) -> ProductBatch:
+    """ProductBatch of a budgetProducts payload ({"Items": [...]} or a plain list)."""
+    return parse_budget_products(_products_payload_items(products_payload))
+
+
+def map_products_payload_to_dtos(products_payload: Any) -> List[ProductDTO]:
+    return map_products_payload_to_batch(products_payload).to_dtos()
+
+
+def map_product_item_to_dto(item: Dict[str, Any]) -> ProductDTO:
+    return ProductDTO(
+        name=item.get("Name") or item.get("name") or "",
+        quantity=item.get("QuantCount") or item.get("quantity"),
+        description=item.get("Description") or item.get("description") or "",
+        custom_fields=map_custom_fields_to_dtos(item.get("CustomFields") or item.get("custom_fields")),
+    )
+
 
-    products: List[ProductDTO] = []
-    for item in items:
-        products.append(
-            ProductDTO(
-                name=item.get("Name") or item.get("name") or "",
-                quantity=item.get("QuantCount") or item.get("quantity"),
-                description=item.get("Description") or item.get("description") or "",
-                custom_fields=map_custom_fields_to_dtos(item.get("CustomFields") or item.get("custom_fields")),
-            )
-        )
-    return products
+# budgetProducts item keys -> snake_case product attributes without a DTO field
+_PRODUCT_EXTENDED_KEYS = (
+    ("width", "Width"),
+    ("height", "Height"),
+    ("depth", "Depth"),
+    ("x_origin", "XOrigin"),
+    ("y_origin", "YOrigin"),
+    ("z_origin", "ZOrigin"),
+    ("item_number", "ItemNumber"),
+    ("comment", "Comment"),
+    ("angle", "Angle"),
+    ("link_id_specification_group", "LinkIDSpecificationGroup"),
+    ("link_id_location", "LinkIDLocation"),
+    ("link_id_wall", "LinkIDWall"),
+    ("file_name", "FileName"),
+    ("picture_name", "PictureName"),
+)
+
+
+def extract_product_extended_attributes(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return location and the extended (ProductModel) attributes of a raw budgetProducts item."""
+    out: Dict[str, Any] = {"location": _location_name(item)}
+    for key, src_key in _PRODUCT_EXTENDED_KEYS:
+        out[key] = item.get(src_key)
+    return out
+
+
+def _location_name(item: Dict[str, Any]) -> Any:
+    # Location can be str or dict
+    loc_val = item.get("Location") or item.get("location") or item.get("LocationName") or item.get("locationName")
+    if isinstance(loc_val, dict):
+        return loc_val.get("Name") or loc_val.get("name") or loc_val.get("Title") or loc_val.get("title")
+    if isinstance(loc_val, str):
+        return loc_val
+    return None
+
+
+def _interned(value: Any, cache: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return cache.setdefault(value, sys.intern(value))
+    return value
+
+
+def parse_budget_products(items: Iterable[Dict[str, Any]]) -> ProductBatch:
+    """Parse raw budgetProducts items into a ProductBatch in one pass over the payload.
+
+    Accepts the Innergy PascalCase keys (and the snake_case fallbacks map_product_item_to_dto
+    understands). Non-dict items are skipped.
+    """
+    name: List[str] = []
+    quantity: List[Any] = []
+    description: List[str] = []
+    location: List[Any] = []
+    extended: Dict[str, List[Any]] = {key: [] for key, _ in _PRODUCT_EXTENDED_KEYS}
+    extended_keys = [(extended[key], src_key) for key, src_key in _PRODUCT_EXTENDED_KEYS]
+    spec_groups = extended["link_id_specification_group"]
+    cf_offsets: List[int] = [0]
+    cf_names: List[str] = []
+    cf_values: List[Any] = []
+    strings: Dict[str, str] = {}
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        name.append(item.get("Name") or item.get("name") or "")
+        quantity.append(item.get("QuantCount") or item.get("quantity"))
+        description.append(item.get("Description") or item.get("description") or "")
+        location.append(_interned(_location_name(item), strings))
+        for column, src_key in extended_keys:
+            column.append(item.get(src_key))
+        spec_groups[-1] = _interned(spec_groups[-1], strings)
+        for cf in item.get("CustomFields") or item.get("custom_fields") or []:
+            cf_names.append(cf.get("Name") or cf.get("name") or "")
+            cf_values.append(cf.get("Value") if "Value" in cf else cf.get("value"))
+        cf_offsets.append(len(cf_names))
+    return ProductBatch(
+        name=tuple(name),
+        quantity=tuple(quantity),
+        description=tuple(description),
+        location=tuple(location),
+        cf_offsets=tuple(cf_offsets),
+        cf_names=tuple(cf_names),
+        cf_values=tuple(cf_values),
+        **{key: tuple(values) for key, values in extended.items()},
+    )
 
 
 def map_project_payload_to_dto(project_payload: Dict[str, Any], products_payload: Any | None = None) -> ProjectDTO:
@@ -55,7 +147,8 @@ def map_project_payload_to_dto(project_payload: Dict[str, Any], products_payload
     locations_payload = project_payload.get("locations") or project_payload.get("Locations") or []
     locations = [LocationDTO(name=loc.get("name") or loc.get("Name") or "") for loc in locations_payload]
 
-    products = map_products_payload_to_dtos(products_payload) if products_payload is not None else []
+    # Kept columnar: persistence reads locations, dimensions and extras straight from the batch
+    products = map_products_payload_to_batch(products_payload) if products_payload is not None else ProductBatch()
 
     return ProjectDTO(
         number=number,
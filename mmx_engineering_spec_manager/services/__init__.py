@@ -1,9 +1,10 @@
 from .project_bootstrap_service import ProjectBootstrapService, Result
 from .ingest_innergy_project_service import IngestInnergyProjectService, IngestResult, build_default_ingest_service
 from .attributes_service import AttributesService
-from .workspace_service import WorkspaceService
+from .workspace_service import WorkspaceService, WorkspaceChangeJournal
 from .projects_service import ProjectsService
 from .products_service import ProductsService
+from .search_service import SearchService
 
 __all__ = [
     "ProjectBootstrapService",
@@ -13,6 +14,8 @@ __all__ = [
     "build_default_ingest_service",
     "AttributesService",
     "WorkspaceService",
+    "WorkspaceChangeJournal",
     "ProjectsService",
     "ProductsService",
+    "SearchService",
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Tuple, Any, Iterable
+from typing import Optional, Tuple, Any, Iterable, Callable, Dict
 
 from sqlalchemy.orm import sessionmaker
 
@@ -32,15 +32,39 @@ class IngestInnergyProjectService:
         self,
         session_factory: sessionmaker,
         importer: Optional[ProjectImporter] = None,
+        data_manager: Any = None,
     ) -> None:
         self._session_factory = session_factory
         self._importer = importer or InnergyProjectImporterAdapter()
+        # Batch ingest is delegated to DataManager.ingest_many; created on first use
+        self._data_manager = data_manager
 
     def ingest(self, job_id: Any) -> IngestResult:
         # Fetch payloads via importer
         project_payload = self._importer.fetch_project(job_id)
         products_payload: Optional[Iterable[dict]] = self._importer.fetch_products(job_id) or []
+        return self._persist(project_payload, products_payload)
 
+    def ingest_many(
+        self,
+        job_ids: Iterable[Any],
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, bool]:
+        """Ingest several jobs concurrently through DataManager.ingest_many, fetching with this
+        service's importer.
+
+        Each job lands in its own per-project DB like a single first-open ingest. progress(int)
+        receives the percentage of finished jobs. Returns {job_id: ok}.
+        """
+        if self._data_manager is None:
+            from mmx_engineering_spec_manager.data_manager.manager import DataManager
+            self._data_manager = DataManager()
+        return self._data_manager.ingest_many(
+            job_ids, max_workers=max_workers, progress=progress, importer=self._importer
+        )
+
+    def _persist(self, project_payload: Any, products_payload: Optional[Iterable[dict]]) -> IngestResult:
         # Map to DTOs
         dto = map_project_payload_to_dto(project_payload, products_payload)
         ingest_dto = IngestProjectDTO(
@@ -82,18 +106,18 @@ class IngestInnergyProjectService:
                         loc = Location(name=loc_dto.name, project=project)
                         tx.session.add(loc)
 
-            # Products
-            if dto.products:
-                for p_dto in dto.products:
-                    prod = Product(
-                        name=p_dto.name,
-                        quantity=p_dto.quantity,
-                        project=project,
-                    )
-                    tx.session.add(prod)
-                    # Custom fields for product
-                    for cf in (p_dto.custom_fields or []):
-                        tx.session.add(CustomField(name=cf.name, value=cf.value, product=prod))
+            # Products, read column-wise from the mapped ProductBatch
+            batch = dto.products
+            for i in range(len(batch)):
+                prod = Product(
+                    name=batch.name[i],
+                    quantity=batch.quantity[i],
+                    project=project,
+                )
+                tx.session.add(prod)
+                # Custom fields for product
+                for cf_name, cf_value in batch.custom_fields_of(i):
+                    tx.session.add(CustomField(name=cf_name, value=cf_value, product=prod))
 
             # Commit
             tx.commit()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
+
+from mmx_engineering_spec_manager.dtos.product_batch import ProductBatch
 
 try:  # shared Result
     from .project_bootstrap_service import Result  # type: ignore
@@ -20,10 +22,15 @@ except Exception:  # pragma: no cover
             return cls(ok=False, value=None, error=error)
 
 
+def _as_products(products: Any) -> Sequence[dict]:
+    return products if isinstance(products, ProductBatch) else list(products or [])
+
+
 class ProductsService:
     """Service for product list persistence and Innergy fetch.
 
     This service wraps DataManager product operations and provides a UI-agnostic API.
+    A ProductBatch from the Innergy fetch is passed through as is rather than copied into dicts.
     """
 
     def __init__(self, data_manager: Any) -> None:
@@ -37,18 +44,19 @@ class ProductsService:
             return []
 
     # --- Writes ---
-    def replace_products_for_project(self, project_id: int, products: List[dict]) -> Result:
+    def replace_products_for_project(self, project_id: int, products: Sequence[dict]) -> Result:
         try:
-            ok = bool(self._dm.replace_products_for_project(int(project_id), list(products or [])))
-            if ok:
-                return Result.ok_value(None)
+            stats = self._dm.replace_products_for_project(int(project_id), _as_products(products))
+            if stats:
+                # Truthy ProductSaveStats (or True from older data managers)
+                return Result.ok_value(stats if stats is not True else None)
             return Result.fail("replace_products_for_project returned False")
         except Exception as e:
             return Result.fail(str(e))
 
     # --- External fetch (Innergy) ---
-    def fetch_products_from_innergy(self, project_number: str | int) -> List[dict]:
+    def fetch_products_from_innergy(self, project_number: str | int) -> Sequence[dict]:
         try:
-            return list(self._dm.fetch_products_from_innergy(str(project_number)) or [])
+            return _as_products(self._dm.fetch_products_from_innergy(str(project_number)))
         except Exception:
             return []
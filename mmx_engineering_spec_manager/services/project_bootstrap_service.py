@@ -112,6 +112,53 @@ class ProjectBootstrapService:
         except Exception as e:
             return Result.fail(str(e))
 
+    def ingest_many(self, project_numbers: Any, max_workers: int | None = None, progress: Any | None = None) -> Result[dict, str]:
+        """Ingest details for several projects concurrently into their per-project DBs.
+
+        Parameters:
+            project_numbers: Iterable of project numbers (or project objects with 'number').
+            max_workers: Upper bound on concurrent downloads and per-project writes.
+            progress: Optional callable receiving the percentage of finished jobs.
+
+        Returns:
+            Result.ok_value({number: bool}) with per-job success, or Result.fail(error_message).
+        """
+        try:
+            settings = self._get_settings()
+            if not bool(getattr(settings, "innergy_api_key", None)):
+                return Result.fail("Innergy API key not configured")
+            ingest_many = getattr(self._dm, "ingest_many", None)
+            if ingest_many is None:
+                return Result.fail("DataManager missing ingest_many")
+            numbers = [str(getattr(p, "number", p)) for p in (project_numbers or [])]
+            return Result.ok_value(ingest_many(numbers, max_workers=max_workers, progress=progress))
+        except Exception as e:
+            return Result.fail(str(e))
+
+    def start_ingest_many(
+        self,
+        project_numbers: Any,
+        max_workers: int | None = None,
+        on_progress: Any | None = None,
+        on_result: Any | None = None,
+    ) -> tuple[Any, Any]:
+        """Run ingest_many on a background QThread.
+
+        The FunctionWorker injects its progress callback, so per-job percentages arrive on
+        worker.progress and the Result on worker.result. on_progress/on_result are connected
+        before the thread starts so no early emission is missed.
+
+        Returns:
+            (worker, thread); callers keep both referenced until worker.finished.
+        """
+        from mmx_engineering_spec_manager.utilities.async_worker import FunctionWorker
+        worker = FunctionWorker(self.ingest_many, args=(list(project_numbers or []),), kwargs={"max_workers": max_workers})
+        if on_progress is not None:
+            worker.progress.connect(on_progress)
+        if on_result is not None:
+            worker.result.connect(on_result)
+        return worker, worker.start()
+
     def load_enriched_project(self, project: Any) -> Result[Any, str]:
         """Load the enriched project from the per-project DB if available.
 
@@ -120,9 +167,10 @@ class ProjectBootstrapService:
 
         Returns:
             Result.ok_value(project_like) on success, or Result.fail(error_message) on failure.
+            The value is a ProjectSnapshot when the DataManager provides one.
         """
         try:
-            getter = getattr(self._dm, "get_full_project_from_project_db", None)
+            getter = getattr(self._dm, "get_project_snapshot", None) or getattr(self._dm, "get_full_project_from_project_db", None)
             pid = getattr(project, "id", None)
             if getter is None or pid is None:
                 return Result.ok_value(project)
@@ -43,12 +43,12 @@ class ProjectsService:
             return None
 
     def load_enriched_project(self, project: Any) -> Result:
-        """Load project with related entities from the project's DB when available."""
+        """Load an immutable ProjectSnapshot from the project's DB when available."""
         try:
             pid = getattr(project, "id", None)
             if pid is None:
                 return Result.ok_value(project)
-            loaded = self._dm.get_full_project_from_project_db(int(pid))
+            loaded = self._dm.get_project_snapshot(int(pid))
             return Result.ok_value(loaded if loaded is not None else project)
         except Exception as e:
             return Result.fail(str(e))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence
+
+try:  # Prefer shared Result type used by other services
+    from .project_bootstrap_service import Result  # type: ignore
+except Exception:  # pragma: no cover - fallback tiny Result to avoid import issues in isolation
+    @dataclass
+    class Result:  # type: ignore
+        ok: bool
+        value: Optional[Any] = None
+        error: Optional[str] = None
+
+        @classmethod
+        def ok_value(cls, value: Any | None = None) -> "Result":
+            return cls(ok=True, value=value, error=None)
+
+        @classmethod
+        def fail(cls, error: str) -> "Result":
+            return cls(ok=False, value=None, error=error)
+
+
+class SearchService:
+    """Cross-project full-text search (e.g. "which job used HW-12", "ADA" in product comments).
+
+    Wraps DataManager's FTS5 index in the global DB. The index follows DataManager's
+    replace_* saves; reindex_project/rebuild cover data written by other paths.
+    """
+
+    def __init__(self, data_manager: Any) -> None:
+        self._dm = data_manager
+
+    def search(self, query: str, limit: int = 50, kinds: Optional[Sequence[str]] = None) -> Result:
+        """Ranked list of SearchHit (best first); an empty query yields an empty list."""
+        try:
+            if not (query or "").strip():
+                return Result.ok_value([])
+            hits = self._dm.search(query, limit=int(limit), kinds=list(kinds) if kinds else None)
+            return Result.ok_value(list(hits or []))
+        except Exception as e:
+            return Result.fail(str(e))
+
+    def reindex_project(self, project_id: int) -> Result:
+        try:
+            written = self._dm.refresh_search_index(int(project_id))
+            if written is False:
+                return Result.fail("Search index refresh failed")
+            return Result.ok_value(written)
+        except Exception as e:
+            return Result.fail(str(e))
+
+    def rebuild(self, project_ids: Optional[Iterable[int]] = None) -> Result:
+        try:
+            ids = [int(p) for p in project_ids] if project_ids is not None else None
+            return Result.ok_value(self._dm.rebuild_search_index(ids))
+        except Exception as e:
+            return Result.fail(str(e))
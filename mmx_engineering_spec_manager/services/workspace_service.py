@@ -27,28 +27,114 @@ class WorkspaceNode:
 
     type: one of {"project","location","wall","product"}
     label: human-readable text (e.g., project number/name, location name)
-    children: nested nodes
+    children: nested nodes (empty until loaded for lazy branches)
+    key: unique node key for WorkspaceService.load_children ("location:3", "wall:7")
+    child_count: number of children the node has, loaded or not
     """
     id: Any
     type: str
     label: str
     children: List["WorkspaceNode"]
+    key: str = ""
+    child_count: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "type": self.type,
             "label": self.label,
+            "key": self.key or f"{self.type}:{self.id}",
+            "child_count": self.child_count,
             "children": [c.to_dict() for c in (self.children or [])],
         }
 
 
+# Key of the synthetic location bucket holding walls without a known location
+UNPLACED_LOCATION_KEY = "location:none"
+
+
+class WorkspaceChangeJournal:
+    """Unsaved workspace edits, coalesced per product / wall.
+
+    Every drag overwrites the pending value of the columns it touches, so the journal
+    holds at most one entry per edited row however many events were recorded and a
+    save writes only the final positions. Recording is O(1).
+    """
+
+    PRODUCT_FIELDS = ("x_origin_from_right", "y_origin_from_face", "z_origin_from_bottom")
+    WALL_FIELDS = ("width", "height", "depth", "x_origin", "y_origin", "z_origin", "angle", "thicknesses")
+
+    def __init__(self) -> None:
+        self._products: Dict[int, Dict[str, float]] = {}
+        self._walls: Dict[int, Dict[str, float]] = {}
+        self.events = 0
+
+    def record_product_move(self, product_id: int, **fields: float) -> None:
+        self._record(self._products, product_id, fields, self.PRODUCT_FIELDS)
+
+    def record_wall_edit(self, wall_id: int, **fields: float) -> None:
+        self._record(self._walls, wall_id, fields, self.WALL_FIELDS)
+
+    def _record(self, target: Dict[int, Dict[str, float]], row_id: int, fields: Dict[str, Any], allowed: tuple) -> None:
+        unknown = set(fields) - set(allowed)
+        if unknown:
+            raise ValueError(f"Unsupported workspace fields: {sorted(unknown)}")
+        values = {k: float(v) for k, v in fields.items() if v is not None}
+        if values:
+            target.setdefault(int(row_id), {}).update(values)
+            self.events += 1
+
+    def product_changes(self) -> Dict[int, Dict[str, float]]:
+        return {k: dict(v) for k, v in self._products.items()}
+
+    def wall_changes(self) -> Dict[int, Dict[str, float]]:
+        return {k: dict(v) for k, v in self._walls.items()}
+
+    def to_changes(self) -> Dict[str, Any]:
+        """Plain-dict form accepted by WorkspaceService.save_changes."""
+        return {"products": self.product_changes(), "walls": self.wall_changes()}
+
+    def clear(self) -> None:
+        self._products.clear()
+        self._walls.clear()
+        self.events = 0
+
+    def __len__(self) -> int:
+        return len(self._products) + len(self._walls)
+
+    @classmethod
+    def from_changes(cls, changes: Any) -> "WorkspaceChangeJournal":
+        """Build a journal from a save_changes payload.
+
+        Accepts the to_changes() shape ({"products": {id: {...}}, "walls": {id: {...}}}) and
+        the move lists the Workspace tab used to collect ("plan_moves"/"elevation_moves");
+        later entries win. A list of payloads is merged in order; unknown keys are ignored.
+        """
+        journal = cls()
+        payloads = changes if isinstance(changes, list) else [changes]
+        for payload in payloads:
+            if not isinstance(payload, dict):
+                continue
+            for key, record, allowed in (
+                ("products", journal.record_product_move, cls.PRODUCT_FIELDS),
+                ("walls", journal.record_wall_edit, cls.WALL_FIELDS),
+            ):
+                for row_id, fields in (payload.get(key) or {}).items():
+                    record(row_id, **{k: v for k, v in (fields or {}).items() if k in allowed})
+            for move in list(payload.get("plan_moves") or []) + list(payload.get("elevation_moves") or []):
+                if isinstance(move, dict) and move.get("product_id") is not None:
+                    journal.record_product_move(
+                        move["product_id"], **{k: v for k, v in move.items() if k in cls.PRODUCT_FIELDS}
+                    )
+        return journal
+
+
 class WorkspaceService:
     """Service for Workspace domain use-cases.
 
-    Responsibilities (initial scaffolding for Phase 3, Step 1):
+    Responsibilities:
     - Provide a UI-agnostic API to load a project "tree" suitable for presentation.
-    - Provide a placeholder API to persist workspace changes (to be implemented in later steps).
+    - Persist workspace geometry changes (product moves, wall edits) to the project DB.
 
     This service intentionally avoids importing any UI toolkit. It wraps DataManager
     reads/writes and exposes simple dict-based DTOs.
@@ -58,107 +144,107 @@ class WorkspaceService:
         self._dm = data_manager
 
     def load_project_tree(self, project_id: int) -> Dict[str, Any]:
-        """Load a hierarchical representation of a project's workspace elements.
+        """Load the top of a project's workspace tree: the project and its locations.
 
-        Returns a dict representing the root node with nested children. The shape is:
+        Only location rows and per-location wall counts are read; walls and products are
+        fetched branch by branch with load_children(). The shape is:
         {
-            "id": <project_id>,
-            "type": "project",
-            "label": "<number> - <name>",
+            "id": <project_id>, "type": "project", "key": "project:<id>",
+            "label": "<number> - <name>", "child_count": <n locations>,
             "children": [
-                {"id": <location_id>, "type": "location", "label": <name>, "children": [
-                    {"id": <wall_id>, "type": "wall", "label": <wall label>, "children": [
-                        {"id": <product_id>, "type": "product", "label": <name>, "children": []}, ...
-                    ]}, ...
-                ]}, ...
+                {"id": <location_id>, "type": "location", "key": "location:<id>",
+                 "label": <name>, "child_count": <n walls>, "children": []}, ...
             ]
         }
-
-        Notes:
-        - This is a best-effort mapping from available ORM objects; fields may be missing
-          depending on the dataset. The service is defensive and produces an empty tree on
-          failures.
+        Walls whose location is unknown are grouped under an unnamed location with key
+        UNPLACED_LOCATION_KEY. The service is defensive and returns an empty tree on failures.
         """
+        empty = WorkspaceNode(id=project_id, type="project", label=f"Project {project_id}", children=[])
         try:
-            project = None
-            try:
-                project = self._dm.get_full_project_from_project_db(int(project_id))
-            except Exception:
-                project = None
-            if project is None:
-                root = WorkspaceNode(id=project_id, type="project", label=f"Project {project_id}", children=[])
-                return root.to_dict()
+            loaded = self._dm.get_workspace_locations(int(project_id))
+            if not loaded:
+                return empty.to_dict()
+            project, locations, unplaced = loaded
 
             # Project label
-            number = getattr(project, "number", None) or ""
-            name = getattr(project, "name", None) or ""
+            number = project.number or ""
+            name = project.name or ""
             proj_label = (f"{number} - {name}").strip(" -") or (name or number or f"Project {project_id}")
-            root = WorkspaceNode(id=getattr(project, "id", project_id), type="project", label=proj_label, children=[])
-
-            # Locations (if present)
-            locations = list(getattr(project, "locations", []) or [])
-            loc_nodes: List[WorkspaceNode] = []
-            for loc in locations:
-                loc_id = getattr(loc, "id", None)
-                loc_name = getattr(loc, "name", None) or ""
-                loc_node = WorkspaceNode(id=loc_id if loc_id is not None else f"loc-{loc_name}", type="location", label=str(loc_name), children=[])
-                # Walls under this location, if relationship exists
-                walls = []
-                try:
-                    walls = list(getattr(loc, "walls", []) or [])
-                except Exception:
-                    # Some schemas may relate walls via project only; fall back below
-                    walls = []
-                for w in walls:
-                    wid = getattr(w, "id", None)
-                    wlabel = self._format_wall_label(w)
-                    wall_node = WorkspaceNode(id=wid if wid is not None else f"wall-{wlabel}", type="wall", label=wlabel, children=[])
-                    # Products under wall
-                    for p in list(getattr(w, "products", []) or []):
-                        pid = getattr(p, "id", None)
-                        pname = getattr(p, "name", None) or getattr(p, "material", None) or "Product"
-                        wall_node.children.append(WorkspaceNode(id=pid if pid is not None else f"prod-{pname}", type="product", label=str(pname), children=[]))
-                    loc_node.children.append(wall_node)
-                loc_nodes.append(loc_node)
-
-            # If no walls discovered under locations, try project-level walls
-            if not any(n.children for n in loc_nodes):
-                for w in list(getattr(project, "walls", []) or []):
-                    wid = getattr(w, "id", None)
-                    wlabel = self._format_wall_label(w)
-                    wall_node = WorkspaceNode(id=wid if wid is not None else f"wall-{wlabel}", type="wall", label=wlabel, children=[])
-                    for p in list(getattr(w, "products", []) or []):
-                        pid = getattr(p, "id", None)
-                        pname = getattr(p, "name", None) or getattr(p, "material", None) or "Product"
-                        wall_node.children.append(WorkspaceNode(id=pid if pid is not None else f"prod-{pname}", type="product", label=str(pname), children=[]))
-                    # Attach to a synthetic location bucket
-                    loc_label = getattr(getattr(w, "location", None), "name", None) or ""
-                    bucket_label = loc_label or ""
-                    bucket_id = f"loc-{bucket_label or 'unknown'}"
-                    # Find/create bucket
-                    bucket = next((n for n in loc_nodes if n.label == bucket_label), None)
-                    if bucket is None:
-                        bucket = WorkspaceNode(id=bucket_id, type="location", label=bucket_label, children=[])
-                        loc_nodes.append(bucket)
-                    bucket.children.append(wall_node)
-
-            root.children = loc_nodes
+            root = WorkspaceNode(id=project.id, type="project", label=proj_label, children=[])
+            for loc, n_walls in locations:
+                root.children.append(WorkspaceNode(
+                    id=loc.id, type="location", label=str(loc.name or ""), children=[],
+                    key=f"location:{loc.id}", child_count=n_walls,
+                ))
+            if unplaced:
+                root.children.append(WorkspaceNode(
+                    id="loc-unknown", type="location", label="", children=[],
+                    key=UNPLACED_LOCATION_KEY, child_count=unplaced,
+                ))
+            root.child_count = len(root.children)
             return root.to_dict()
         except Exception:
             # Defensive default
-            return WorkspaceNode(id=project_id, type="project", label=f"Project {project_id}", children=[]).to_dict()
+            return empty.to_dict()
+
+    def load_children(self, project_id: int, node_key: str) -> List[Dict[str, Any]]:
+        """Load the direct children of one tree node.
+
+        "location:<id>" (or UNPLACED_LOCATION_KEY) yields wall nodes with product counts;
+        "wall:<id>" yields product nodes. Anything else, or a failure, yields [].
+        """
+        try:
+            kind, _, raw_id = str(node_key).partition(":")
+            if kind == "location":
+                location_id = None if node_key == UNPLACED_LOCATION_KEY else int(raw_id)
+                return [
+                    WorkspaceNode(
+                        id=w.id, type="wall", label=self._format_wall_label(w), children=[],
+                        key=f"wall:{w.id}", child_count=n_products,
+                    ).to_dict()
+                    for w, n_products in self._dm.get_workspace_walls(int(project_id), location_id) or []
+                ]
+            if kind == "wall":
+                return [
+                    WorkspaceNode(
+                        id=p.id, type="product", label=str(p.name or "Product"), children=[],
+                        key=f"product:{p.id}",
+                    ).to_dict()
+                    for p in self._dm.get_workspace_products(int(project_id), int(raw_id)) or []
+                ]
+            return []
+        except Exception:
+            return []
 
-    def save_changes(self, changes: Dict[str, Any] | List[Dict[str, Any]] | None) -> Result:
+    def save_changes(
+        self,
+        changes: Dict[str, Any] | List[Dict[str, Any]] | WorkspaceChangeJournal | None,
+        project_id: Optional[int] = None,
+    ) -> Result:
         """Persist workspace changes.
 
-        Initial scaffolding returns success without applying changes. In later steps,
-        this will delegate to DataManager/Repositories to upsert walls, products,
-        and geometry changes captured by the ViewModel.
+        Accepts a WorkspaceChangeJournal or a payload understood by
+        WorkspaceChangeJournal.from_changes. The target project is project_id, or else the
+        payload's "project_id". Moves are coalesced to one row per product/wall and written
+        by the DataManager in a single transaction. Returns
+        Result.ok_value({"products": n, "walls": n}), or Result.ok_value(None) when there is
+        nothing to write.
         """
         try:
-            # Placeholder no-op for Phase 3, Step 1
-            _ = changes  # satisfy linters
-            return Result.ok_value(None)
+            if isinstance(changes, WorkspaceChangeJournal):
+                journal = changes
+            else:
+                journal = WorkspaceChangeJournal.from_changes(changes)
+                if project_id is None and isinstance(changes, dict):
+                    project_id = changes.get("project_id")
+            if not len(journal):
+                return Result.ok_value(None)
+            if project_id is None:
+                return Result.fail("No project selected")
+            counts = self._dm.apply_workspace_changes(int(project_id), journal.product_changes(), journal.wall_changes())
+            if counts is False or counts is None:
+                return Result.fail("Failed to save workspace changes")
+            return Result.ok_value(counts)
         except Exception as e:
             return Result.fail(str(e))
 
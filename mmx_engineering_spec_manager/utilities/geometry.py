@@ -1,4 +1,7 @@
 from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
 
 def x_left_to_xorigin_from_right(wall_length: float, product_width: float, x_left_from_left: float) -> float:
     """
@@ -26,3 +29,183 @@ def y_top_to_zorigin_from_bottom(wall_height: float, product_height: float, y_to
     ZOrigin = wall_height - (y_top + product_height)
     """
     return float(wall_height) - (float(y_top_from_top) + float(product_height))
+
+
+# ---- Batch (columnar) kernel ----
+#
+# The functions below take whole columns for one wall (sequences aligned by product, e.g. the
+# tuples of a ProductColumns) and return tuples, so exporters and validation passes make one
+# call per wall instead of one call per product. Missing values (None) count as 0.
+
+
+def _col(values: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    return tuple(0.0 if v is None else float(v) for v in values)
+
+
+def x_lefts_to_xorigins_from_right(wall_length: float, widths: Sequence[Optional[float]], x_lefts: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """Column form of x_left_to_xorigin_from_right."""
+    L = float(wall_length)
+    return tuple(L - (x + w) for w, x in zip(_col(widths), _col(x_lefts)))
+
+
+def xorigins_from_right_to_x_lefts(wall_length: float, widths: Sequence[Optional[float]], x_origins: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """Column form of xorigin_from_right_to_x_left."""
+    L = float(wall_length)
+    return tuple(L - xo - w for w, xo in zip(_col(widths), _col(x_origins)))
+
+
+def y_tops_to_zorigins_from_bottom(wall_height: float, heights: Sequence[Optional[float]], y_tops: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """Column form of y_top_to_zorigin_from_bottom."""
+    H = float(wall_height)
+    return tuple(H - (y + h) for h, y in zip(_col(heights), _col(y_tops)))
+
+
+def zorigins_from_bottom_to_y_tops(wall_height: float, heights: Sequence[Optional[float]], z_origins: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """Inverse of y_tops_to_zorigins_from_bottom."""
+    H = float(wall_height)
+    return tuple(H - zo - h for h, zo in zip(_col(heights), _col(z_origins)))
+
+
+def out_of_bounds(
+    wall_length: float,
+    wall_height: float,
+    widths: Sequence[Optional[float]],
+    heights: Sequence[Optional[float]],
+    x_origins: Sequence[Optional[float]],
+    z_origins: Sequence[Optional[float]],
+    tolerance: float = 1e-6,
+) -> Tuple[int, ...]:
+    """Indices of products that extend past either end of the wall, below the floor or above the wall."""
+    L, H, tol = float(wall_length), float(wall_height), float(tolerance)
+    return tuple(
+        i
+        for i, (w, h, xo, zo) in enumerate(zip(_col(widths), _col(heights), _col(x_origins), _col(z_origins)))
+        if xo < -tol or xo + w > L + tol or zo < -tol or zo + h > H + tol
+    )
+
+
+def overlapping_pairs(
+    widths: Sequence[Optional[float]],
+    heights: Sequence[Optional[float]],
+    x_origins: Sequence[Optional[float]],
+    z_origins: Sequence[Optional[float]],
+    tolerance: float = 1e-6,
+) -> Tuple[Tuple[int, int], ...]:
+    """Index pairs (i < j) of products whose elevation faces overlap; touching edges are fine.
+
+    Sweep over x: products are sorted once by their start along the wall and each one is
+    only compared with the products still open at that point, so the cost is
+    O(n log n + overlaps) rather than comparing every pair.
+    """
+    ws, hs, xs, zs = _col(widths), _col(heights), _col(x_origins), _col(z_origins)
+    tol = float(tolerance)
+    order = sorted(range(len(ws)), key=xs.__getitem__)
+    active: list = []
+    pairs = []
+    for i in order:
+        start = xs[i]
+        active = [j for j in active if xs[j] + ws[j] > start + tol]
+        lo, hi = zs[i], zs[i] + hs[i]
+        for j in active:
+            if zs[j] < hi - tol and lo < zs[j] + hs[j] - tol:
+                pairs.append((min(i, j), max(i, j)))
+        if ws[i] > tol:
+            active.append(i)
+    return tuple(sorted(pairs))
+
+
+def wall_fill(
+    wall_length: float,
+    widths: Sequence[Optional[float]],
+    x_origins: Sequence[Optional[float]],
+) -> Tuple[float, Tuple[Tuple[float, float], ...]]:
+    """Run length covered by products and the uncovered gaps along the wall.
+
+    Positions are XOrigin-style (measured from the right end). Products are projected onto
+    the wall's run and clipped to it; overlapping products are only counted once. Gaps are
+    returned as (start, end) pairs in the same from-right coordinates, in ascending order.
+    """
+    L = float(wall_length)
+    spans = sorted(
+        (max(0.0, xo), min(L, xo + w))
+        for w, xo in zip(_col(widths), _col(x_origins))
+        if w > 0 and xo < L and xo + w > 0
+    )
+    covered = 0.0
+    gaps = []
+    cursor = 0.0
+    for start, end in spans:
+        if start > cursor:
+            gaps.append((cursor, start))
+            cursor = start
+        if end > cursor:
+            covered += end - cursor
+            cursor = end
+    if cursor < L:
+        gaps.append((cursor, L))
+    return covered, tuple(gaps)
+
+
+@dataclass(frozen=True, slots=True)
+class WallGeometry:
+    """Batch geometry results for the products on one wall (indices refer to the input columns)."""
+    x_lefts: Tuple[float, ...]
+    y_tops: Tuple[float, ...]
+    out_of_bounds: Tuple[int, ...]
+    overlaps: Tuple[Tuple[int, int], ...]
+    covered: float
+    gaps: Tuple[Tuple[float, float], ...]
+    wall_length: float
+
+    @property
+    def fill_ratio(self) -> float:
+        return self.covered / self.wall_length if self.wall_length > 0 else 0.0
+
+
+def analyze_wall(
+    wall_length: float,
+    wall_height: float,
+    widths: Sequence[Optional[float]],
+    heights: Sequence[Optional[float]],
+    x_origins: Sequence[Optional[float]],
+    z_origins: Sequence[Optional[float]],
+) -> WallGeometry:
+    """Scene positions, bounds and overlap checks, and fill/gaps for one wall in a single call."""
+    ws, hs, xs, zs = _col(widths), _col(heights), _col(x_origins), _col(z_origins)
+    covered, gaps = wall_fill(wall_length, ws, xs)
+    return WallGeometry(
+        x_lefts=xorigins_from_right_to_x_lefts(wall_length, ws, xs),
+        y_tops=zorigins_from_bottom_to_y_tops(wall_height, hs, zs),
+        out_of_bounds=out_of_bounds(wall_length, wall_height, ws, hs, xs, zs),
+        overlaps=overlapping_pairs(ws, hs, xs, zs),
+        covered=covered,
+        gaps=gaps,
+        wall_length=float(wall_length),
+    )
+
+
+def analyze_project_walls(snapshot) -> Dict[int, WallGeometry]:
+    """analyze_wall for every wall of a ProjectSnapshot, read straight from its product columns.
+
+    Products are bucketed by wall_id in one pass over the column, so no ProductSnapshot rows
+    are materialized. Walls without a width or height are skipped.
+    """
+    cols = snapshot.product_columns
+    by_wall: Dict[int, list] = {}
+    for i, wid in enumerate(cols.wall_id):
+        if wid is not None:
+            by_wall.setdefault(wid, []).append(i)
+    out: Dict[int, WallGeometry] = {}
+    for wall in snapshot.walls:
+        if not wall.width or not wall.height:
+            continue
+        idx = by_wall.get(wall.id, ())
+        out[wall.id] = analyze_wall(
+            wall.width,
+            wall.height,
+            [cols.width[i] for i in idx],
+            [cols.height[i] for i in idx],
+            [cols.x_origin_from_right[i] for i in idx],
+            [cols.z_origin_from_bottom[i] for i in idx],
+        )
+    return out
@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Iterable, Set
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from contextlib import contextmanager
 
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
 from mmx_engineering_spec_manager.utilities.logging_config import get_logger
 
@@ -16,14 +21,316 @@ def _connect(engine: Engine):
         conn.close()
 
 
-def _sqlite_table_columns(engine: Engine, table: str) -> Set[str]:
-    cols: Set[str] = set()
+@dataclass(frozen=True)
+class Migration:
+    """A single numbered schema upgrade step.
+
+    apply(conn, metadata) runs inside the upgrade transaction; steps must tolerate a
+    database that already has their change (fresh files are built by create_all).
+    """
+    version: int
+    description: str
+    apply: Callable[[Connection, Any], None]
+
+
+class MigrationDeferred(Exception):
+    """Raised by a step that cannot apply to the current data yet.
+
+    The upgrade keeps the step's partial work, still runs the later (idempotent) steps and
+    stamps the version just below the deferred step, so it is retried on the next upgrade.
+    """
+
+
+def _is_sqlite(engine: Engine) -> bool:
+    return str(engine.url).startswith("sqlite")
+
+
+def _columns(conn: Connection, table: str) -> Set[str]:
+    # PRAGMA table_info returns: cid, name, type, notnull, dflt_value, pk
+    return {str(row[1]) for row in conn.exec_driver_sql(f"PRAGMA table_info('{table}')")}
+
+
+def _add_missing_columns(conn: Connection, table: str, expected: Dict[str, str]) -> List[str]:
+    """Add any nullable columns from expected (name -> SQL type) missing on table."""
+    existing = _columns(conn, table)
+    if not existing:
+        return []
+    added: List[str] = []
+    for col, col_type in expected.items():
+        if col in existing:
+            continue
+        sql = f"ALTER TABLE {table} ADD COLUMN {col} {col_type} NULL"
+        conn.exec_driver_sql(sql)
+        get_logger(__name__).info("Applied migration: %s", sql)
+        added.append(col)
+    return added
+
+
+_PRODUCTS_COLUMNS: Dict[str, str] = {
+    "width": "REAL",
+    "height": "REAL",
+    "depth": "REAL",
+    "x_origin_from_right": "REAL",
+    "y_origin_from_face": "REAL",
+    "z_origin_from_bottom": "REAL",
+    "specification_group_id": "INTEGER",
+}
+_WALLS_COLUMNS: Dict[str, str] = {"thicknesses": "REAL"}
+_GLOBAL_PROMPTS_COLUMNS: Dict[str, str] = {"specification_group_id": "INTEGER"}
+_WIZARD_PROMPTS_COLUMNS: Dict[str, str] = {"specification_group_id": "INTEGER"}
+
+
+def _m0001_baseline_tables(conn: Connection, metadata: Any) -> None:
+    metadata.create_all(bind=conn)
+
+
+def _m0002_products_dimensions(conn: Connection, metadata: Any) -> None:
+    _add_missing_columns(conn, "products", _PRODUCTS_COLUMNS)
+
+
+def _m0003_walls_thicknesses(conn: Connection, metadata: Any) -> None:
+    _add_missing_columns(conn, "walls", _WALLS_COLUMNS)
+
+
+def _m0004_prompts_specification_group(conn: Connection, metadata: Any) -> None:
+    _add_missing_columns(conn, "global_prompts", _GLOBAL_PROMPTS_COLUMNS)
+    _add_missing_columns(conn, "wizard_prompts", _WIZARD_PROMPTS_COLUMNS)
+
+
+def _m0005_projects_number_unique_index(conn: Connection, metadata: Any) -> None:
+    if not _columns(conn, "projects"):
+        return
+    dupes = conn.exec_driver_sql(
+        "SELECT number FROM projects WHERE number IS NOT NULL GROUP BY number HAVING COUNT(*) > 1 LIMIT 1"
+    ).fetchone()
+    if dupes is not None:
+        # Keep lookups indexed meanwhile; the unique index is retried on the next upgrade
+        conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_projects_number ON projects (number)")
+        raise MigrationDeferred(f"projects.number has duplicate values (e.g. {dupes[0]!r})")
+    existing = conn.exec_driver_sql(
+        "SELECT \"unique\" FROM pragma_index_list('projects') WHERE name = 'ix_projects_number'"
+    ).fetchone()
+    if existing is not None and not existing[0]:
+        # Left behind by an earlier deferred attempt
+        conn.exec_driver_sql("DROP INDEX ix_projects_number")
+    conn.exec_driver_sql("CREATE UNIQUE INDEX IF NOT EXISTS ix_projects_number ON projects (number)")
+
+
+# Foreign-key indexes for the DataManager read paths; names match SQLAlchemy's
+# index=True naming (ix_<table>_<column>) so fresh and upgraded files agree
+_FK_INDEXES: Tuple[Tuple[str, str], ...] = (
+    ("products", "project_id"),
+    ("products", "location_id"),
+    ("products", "wall_id"),
+    ("custom_fields", "product_id"),
+    ("custom_fields", "project_id"),
+    ("locations", "project_id"),
+    ("walls", "project_id"),
+    ("location_table_callouts", "project_id"),
+    ("location_table_callouts", "location_id"),
+    ("finish_callouts", "project_id"),
+    ("hardware_callouts", "project_id"),
+    ("sink_callouts", "project_id"),
+    ("appliance_callouts", "project_id"),
+    ("prompts", "parent_id"),
+)
+
+
+def _create_column_indexes(conn: Connection, pairs: Tuple[Tuple[str, str], ...]) -> None:
+    for table, column in pairs:
+        if column not in _columns(conn, table):
+            continue
+        conn.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})")
+
+
+def _m0006_foreign_key_indexes(conn: Connection, metadata: Any) -> None:
+    _create_column_indexes(conn, _FK_INDEXES)
+
+
+# Foreign keys followed by the eager project graph loader (get_full_project_from_project_db)
+_GRAPH_FK_INDEXES: Tuple[Tuple[str, str], ...] = (
+    ("walls", "location_id"),
+    ("prompts", "product_id"),
+    ("prompts", "global_prompts_id"),
+    ("prompts", "wizard_prompts_id"),
+    ("global_prompts", "project_id"),
+    ("wizard_prompts", "project_id"),
+)
+
+
+def _m0007_project_graph_indexes(conn: Connection, metadata: Any) -> None:
+    _create_column_indexes(conn, _GRAPH_FK_INDEXES)
+
+
+def _m0008_products_content_digest(conn: Connection, metadata: Any) -> None:
+    _add_missing_columns(conn, "products", {"content_digest": "VARCHAR"})
+
+
+# Ordered list of schema upgrades. Append new steps with the next version number; never
+# renumber or edit a released step. The head version is stored via PRAGMA user_version.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create baseline tables", _m0001_baseline_tables),
+    Migration(2, "products: dimension, origin and specification group columns", _m0002_products_dimensions),
+    Migration(3, "walls: thicknesses column", _m0003_walls_thicknesses),
+    Migration(4, "global/wizard prompts: specification group column", _m0004_prompts_specification_group),
+    Migration(5, "projects: unique index on number", _m0005_projects_number_unique_index),
+    Migration(6, "foreign-key indexes for read paths", _m0006_foreign_key_indexes),
+    Migration(7, "foreign-key indexes for the project graph loader", _m0007_project_graph_indexes),
+    Migration(8, "products: content digest column for differential saves", _m0008_products_content_digest),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_sqlite_user_version(engine: Engine) -> int:
+    """Return the schema version stamped in a SQLite database (0 when never stamped)."""
+    with _connect(engine) as conn:
+        return _read_user_version(conn)
+
+
+def set_sqlite_user_version(engine: Engine, version: int) -> None:
+    """Stamp a SQLite database with the given schema version."""
+    with engine.begin() as conn:
+        _write_user_version(conn, version)
+
+
+def _read_user_version(conn: Connection) -> int:
+    row = conn.exec_driver_sql("PRAGMA user_version").fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _write_user_version(conn: Connection, version: int) -> None:
+    # PRAGMA does not accept bound parameters; version is forced to int
+    conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def _has_user_tables(conn: Connection) -> bool:
+    row = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' LIMIT 1"
+    ).fetchone()
+    return row is not None
+
+
+def upgrade_sqlite_schema(engine: Engine, metadata: Any, migrations: Optional[List[Migration]] = None) -> Tuple[int, int]:
+    """
+    Apply pending migrations to a SQLite database in a single transaction.
+
+    The current version is read from PRAGMA user_version. A database that is already at
+    head costs one PRAGMA read. A brand-new (empty) file is built with create_all and
+    stamped at head directly. Otherwise every step newer than the stamp runs in order and
+    the stamp is advanced, all inside one BEGIN IMMEDIATE transaction so a failure leaves
+    the file untouched and concurrent upgraders serialize. A step raising MigrationDeferred
+    holds the stamp just below its version so it runs again next time.
+
+    Returns (from_version, to_version).
+    """
+    steps = sorted(migrations if migrations is not None else MIGRATIONS, key=lambda m: m.version)
+    head = steps[-1].version if steps else 0
     with _connect(engine) as conn:
-        res = conn.exec_driver_sql(f"PRAGMA table_info('{table}')")
-        for row in res:
-            # PRAGMA table_info returns: cid, name, type, notnull, dflt_value, pk
-            cols.add(str(row[1]))
-    return cols
+        current = _read_user_version(conn)
+        if current >= head:
+            return current, current
+        # pysqlite does not open a transaction for DDL on its own; take the write lock explicitly
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the lock in case another connection upgraded meanwhile
+            current = _read_user_version(conn)
+            if current >= head:
+                conn.rollback()
+                return current, current
+            stamp = head
+            if current == 0 and not _has_user_tables(conn):
+                metadata.create_all(bind=conn)
+            else:
+                for step in steps:
+                    if step.version <= current:
+                        continue
+                    try:
+                        step.apply(conn, metadata)
+                    except MigrationDeferred as e:
+                        stamp = min(stamp, step.version - 1)
+                        get_logger(__name__).warning(
+                            "Deferred schema step %d (%s) on %s: %s", step.version, step.description, engine.url, e
+                        )
+                        continue
+                    get_logger(__name__).info("Applied schema step %d (%s) to %s", step.version, step.description, engine.url)
+            _write_user_version(conn, stamp)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return current, stamp
+
+
+def ensure_sqlite_schema(engine: Engine, metadata: Any) -> bool:
+    """
+    Bring a database up to SCHEMA_VERSION, skipping all DDL when it is already current.
+
+    Returns True if schema work was performed, False if the database was already current.
+    Non-SQLite backends have no version stamp and always run create_all.
+    """
+    if not _is_sqlite(engine):
+        metadata.create_all(engine)
+        return True
+    before, after = upgrade_sqlite_schema(engine, metadata)
+    return before != after
+
+
+def _load_model_metadata() -> Any:
+    """Import every ORM model so Base.metadata knows all tables, and return it."""
+    import importlib
+
+    for mod in (
+        "appliance_callout", "custom_field", "finish_callout", "global_prompts", "hardware_callout",
+        "location", "location_table_callout", "product", "project", "prompt", "sink_callout",
+        "specification_group", "wall", "wizard_prompts",
+    ):
+        importlib.import_module(f"mmx_engineering_spec_manager.db_models.{mod}")
+    from mmx_engineering_spec_manager.db_models.database_config import Base
+
+    return Base.metadata
+
+
+def upgrade_project_db_file(db_path: str, metadata: Any | None = None) -> Tuple[int, int]:
+    """Upgrade one per-project SQLite file using a short-lived engine. Returns (from, to)."""
+    from mmx_engineering_spec_manager.utilities.persistence import create_engine_and_sessionmaker_for_sqlite_path
+
+    md = metadata if metadata is not None else _load_model_metadata()
+    engine, _ = create_engine_and_sessionmaker_for_sqlite_path(db_path)
+    try:
+        return upgrade_sqlite_schema(engine, md)
+    finally:
+        engine.dispose()
+
+
+def upgrade_all_project_dbs(projects_dir: str | None = None, max_workers: int | None = None) -> Dict[str, Tuple[int, int] | str]:
+    """
+    Upgrade every *.db file under projects_dir (default: AppDataLocation/projects) in parallel.
+
+    Files are independent, so each is upgraded on its own worker thread with its own engine.
+    Returns a mapping path -> (from_version, to_version), or path -> error message on failure.
+    """
+    logger = get_logger(__name__)
+    if projects_dir is None:
+        from mmx_engineering_spec_manager.utilities.persistence import _app_data_dir
+
+        projects_dir = os.path.join(_app_data_dir(), "projects")
+    paths = sorted(str(p) for p in Path(projects_dir).glob("*.db"))
+    if not paths:
+        return {}
+    metadata = _load_model_metadata()
+    workers = max_workers or min(8, len(paths))
+
+    def _one(path: str) -> Tuple[int, int] | str:
+        try:
+            return upgrade_project_db_file(path, metadata)
+        except Exception as e:
+            logger.warning("Upgrading %s failed: %s", path, e)
+            return f"error: {e}"
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_one, paths))
+    return dict(zip(paths, results))
 
 
 def migrate_sqlite_products_add_missing_columns(engine: Engine) -> None:
@@ -35,38 +342,10 @@ def migrate_sqlite_products_add_missing_columns(engine: Engine) -> None:
       - width, height, depth (REAL)
       - x_origin_from_right, y_origin_from_face, z_origin_from_bottom (REAL)
       - specification_group_id (INTEGER)
-    """
-    logger = get_logger(__name__)
 
-    try:
-        # Only attempt for SQLite
-        if not str(engine.url).startswith("sqlite"):
-            return
-
-        expected: dict[str, str] = {
-            "width": "REAL",
-            "height": "REAL",
-            "depth": "REAL",
-            "x_origin_from_right": "REAL",
-            "y_origin_from_face": "REAL",
-            "z_origin_from_bottom": "REAL",
-            "specification_group_id": "INTEGER",
-        }
-        existing = _sqlite_table_columns(engine, "products")
-        to_add = [name for name in expected.keys() if name not in existing]
-        if not to_add:
-            return
-
-        with _connect(engine) as conn:
-            for col in to_add:
-                sql = f"ALTER TABLE products ADD COLUMN {col} {expected[col]} NULL"
-                conn.exec_driver_sql(sql)
-                logger.info("Applied migration: %s", sql)
-    except Exception as e:  # pragma: no cover
-        # Do not crash app startup because of a failed helper migration
-        logger.exception("SQLite migration for products failed: %s", e)
-        # intentionally swallow to keep app usable; user can recreate DB if needed
-        return
+    Kept for callers outside the versioned path; equivalent to schema step 2.
+    """
+    _run_standalone(engine, "products", _PRODUCTS_COLUMNS)
 
 
 def migrate_sqlite_walls_add_missing_columns(engine: Engine) -> None:
@@ -76,28 +355,7 @@ def migrate_sqlite_walls_add_missing_columns(engine: Engine) -> None:
     Added columns (nullable):
       - thicknesses (REAL)
     """
-    logger = get_logger(__name__)
-
-    try:
-        if not str(engine.url).startswith("sqlite"):
-            return
-
-        expected: dict[str, str] = {
-            "thicknesses": "REAL",
-        }
-        existing = _sqlite_table_columns(engine, "walls")
-        to_add = [name for name in expected.keys() if name not in existing]
-        if not to_add:
-            return
-
-        with _connect(engine) as conn:
-            for col in to_add:
-                sql = f"ALTER TABLE walls ADD COLUMN {col} {expected[col]} NULL"
-                conn.exec_driver_sql(sql)
-                logger.info("Applied migration: %s", sql)
-    except Exception as e:  # pragma: no cover
-        logger.exception("SQLite migration for walls failed: %s", e)
-        return
+    _run_standalone(engine, "walls", _WALLS_COLUMNS)
 
 
 def migrate_sqlite_global_prompts_add_missing_columns(engine: Engine) -> None:
@@ -107,28 +365,7 @@ def migrate_sqlite_global_prompts_add_missing_columns(engine: Engine) -> None:
     Added columns (nullable):
       - specification_group_id (INTEGER)
     """
-    logger = get_logger(__name__)
-
-    try:
-        if not str(engine.url).startswith("sqlite"):
-            return
-
-        expected: dict[str, str] = {
-            "specification_group_id": "INTEGER",
-        }
-        existing = _sqlite_table_columns(engine, "global_prompts")
-        to_add = [name for name in expected.keys() if name not in existing]
-        if not to_add:
-            return
-
-        with _connect(engine) as conn:
-            for col in to_add:
-                sql = f"ALTER TABLE global_prompts ADD COLUMN {col} {expected[col]} NULL"
-                conn.exec_driver_sql(sql)
-                logger.info("Applied migration: %s", sql)
-    except Exception as e:  # pragma: no cover
-        logger.exception("SQLite migration for global_prompts failed: %s", e)
-        return
+    _run_standalone(engine, "global_prompts", _GLOBAL_PROMPTS_COLUMNS)
 
 
 def migrate_sqlite_wizard_prompts_add_missing_columns(engine: Engine) -> None:
@@ -138,25 +375,40 @@ def migrate_sqlite_wizard_prompts_add_missing_columns(engine: Engine) -> None:
     Added columns (nullable):
       - specification_group_id (INTEGER)
     """
-    logger = get_logger(__name__)
+    _run_standalone(engine, "wizard_prompts", _WIZARD_PROMPTS_COLUMNS)
 
-    try:
-        if not str(engine.url).startswith("sqlite"):
-            return
 
-        expected: dict[str, str] = {
-            "specification_group_id": "INTEGER",
-        }
-        existing = _sqlite_table_columns(engine, "wizard_prompts")
-        to_add = [name for name in expected.keys() if name not in existing]
-        if not to_add:
+def _run_standalone(engine: Engine, table: str, expected: Dict[str, str]) -> None:
+    logger = get_logger(__name__)
+    try:
+        # Only attempt for SQLite
+        if not _is_sqlite(engine):
             return
-
-        with _connect(engine) as conn:
-            for col in to_add:
-                sql = f"ALTER TABLE wizard_prompts ADD COLUMN {col} {expected[col]} NULL"
-                conn.exec_driver_sql(sql)
-                logger.info("Applied migration: %s", sql)
+        with engine.begin() as conn:
+            _add_missing_columns(conn, table, expected)
     except Exception as e:  # pragma: no cover
-        logger.exception("SQLite migration for wizard_prompts failed: %s", e)
+        # Do not crash app startup because of a failed helper migration
+        logger.exception("SQLite migration for %s failed: %s", table, e)
         return
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    """Command-line entry: upgrade all per-project databases in parallel."""
+    parser = argparse.ArgumentParser(description="Upgrade per-project SQLite databases to the current schema version.")
+    parser.add_argument("--dir", dest="projects_dir", default=None, help="Directory containing project .db files")
+    parser.add_argument("--workers", type=int, default=None, help="Maximum parallel upgrades")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    results = upgrade_all_project_dbs(args.projects_dir, args.workers)
+    failed = 0
+    for path, res in results.items():
+        if isinstance(res, str):
+            failed += 1
+            print(f"{path}: {res}")
+        else:
+            print(f"{path}: v{res[0]} -> v{res[1]}")
+    print(f"Upgraded {len(results) - failed} of {len(results)} project databases (schema v{SCHEMA_VERSION}).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -1,16 +1,103 @@
 from __future__ import annotations
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple, Any
+from typing import Tuple, Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from PySide6.QtCore import QStandardPaths
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
 
 
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+@dataclass(frozen=True)
+class SqlitePragmaProfile:
+    """PRAGMA settings applied to every new SQLite connection.
+
+    Defaults favour a desktop app where the UI thread and worker threads share files:
+    WAL lets readers proceed while a writer commits, synchronous=NORMAL is durable in WAL
+    mode except for power loss, and busy_timeout waits for locks instead of failing.
+
+    cache_size follows SQLite semantics: negative values are KiB, positive values pages.
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -20000
+    mmap_size: int = 268435456
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5000
+
+    @classmethod
+    def from_env(cls) -> "SqlitePragmaProfile":
+        """Build a profile from SQLITE_* environment variables, falling back to defaults."""
+        d = cls()
+
+        def _int(name: str, default: int) -> int:
+            try:
+                return int(os.getenv(name, str(default)))
+            except ValueError:
+                return default
+
+        return cls(
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", d.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", d.synchronous),
+            cache_size=_int("SQLITE_CACHE_SIZE", d.cache_size),
+            mmap_size=_int("SQLITE_MMAP_SIZE", d.mmap_size),
+            temp_store=os.getenv("SQLITE_TEMP_STORE", d.temp_store),
+            busy_timeout=_int("SQLITE_BUSY_TIMEOUT_MS", d.busy_timeout),
+        )
+
+    def statements(self) -> List[str]:
+        """Return the PRAGMA statements for this profile; unknown modes are skipped."""
+        out: List[str] = []
+        jm = str(self.journal_mode or "").upper()
+        if jm in _JOURNAL_MODES:
+            out.append(f"PRAGMA journal_mode={jm}")
+        sync = str(self.synchronous or "").upper()
+        if sync in _SYNCHRONOUS_MODES:
+            out.append(f"PRAGMA synchronous={sync}")
+        ts = str(self.temp_store or "").upper()
+        if ts in _TEMP_STORES:
+            out.append(f"PRAGMA temp_store={ts}")
+        out.append(f"PRAGMA cache_size={int(self.cache_size)}")
+        out.append(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        out.append(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        return out
+
+
+def _default_pragma_profile() -> SqlitePragmaProfile:
+    try:
+        # Local import: settings imports this module
+        from mmx_engineering_spec_manager.utilities.settings import get_settings
+
+        return get_settings().sqlite_pragmas
+    except Exception:  # pragma: no cover
+        return SqlitePragmaProfile.from_env()
+
+
+def apply_sqlite_pragmas(engine: Any, profile: Optional[SqlitePragmaProfile] = None) -> None:
+    """Register a connect hook on engine that applies the pragma profile to each connection."""
+    statements = (profile or _default_pragma_profile()).statements()
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):  # pragma: no cover - exercised via connect
+        cursor = dbapi_connection.cursor()
+        try:
+            for stmt in statements:
+                cursor.execute(stmt)
+        finally:
+            cursor.close()
+
+
 def _app_data_dir() -> str:
     """Return the writable application data directory (matches prior default)."""
     data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
@@ -43,10 +130,10 @@ def get_database_url() -> str:
     return f"sqlite:///{db_path}"
 
 
-def create_engine_and_sessionmaker(echo: bool = False) -> Tuple[Any, sessionmaker]:
+def create_engine_and_sessionmaker(echo: bool = False, pragmas: Optional[SqlitePragmaProfile] = None) -> Tuple[Any, sessionmaker]:
     """
     Create a SQLAlchemy engine and a bound sessionmaker based on the resolved URL.
-    Applies SQLite-specific connect args when needed.
+    Applies SQLite-specific connect args and the pragma profile when needed.
     """
     url = get_database_url()
     connect_args = {}
@@ -59,6 +146,8 @@ def create_engine_and_sessionmaker(echo: bool = False) -> Tuple[Any, sessionmake
         connect_args = {"check_same_thread": False}
 
     engine = create_engine(url, echo=echo, connect_args=connect_args)
+    if url.startswith("sqlite"):
+        apply_sqlite_pragmas(engine, pragmas)
     Session = sessionmaker(bind=engine)
     return engine, Session
 
@@ -90,12 +179,172 @@ def project_sqlite_db_path(project: Any) -> str:
     return str(base_dir / filename)
 
 
-def create_engine_and_sessionmaker_for_sqlite_path(db_path: str, echo: bool = False) -> Tuple[Any, sessionmaker]:
-    """Create engine and sessionmaker for a specific SQLite file path."""
+def create_engine_and_sessionmaker_for_sqlite_path(db_path: str, echo: bool = False, pragmas: Optional[SqlitePragmaProfile] = None) -> Tuple[Any, sessionmaker]:
+    """Create engine and sessionmaker for a specific SQLite file path (pragma profile applied)."""
     # Ensure directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     url = f"sqlite:///{db_path}"
     connect_args = {"check_same_thread": False}
     engine = create_engine(url, echo=echo, connect_args=connect_args)
+    apply_sqlite_pragmas(engine, pragmas)
     Session = sessionmaker(bind=engine)
     return engine, Session
+
+
+def _normalize_sqlite_path(db_path: str) -> str:
+    """Return a canonical key for a SQLite file path (absolute, case-normalized on Windows)."""
+    return os.path.normcase(os.path.abspath(str(db_path)))
+
+
+class SqliteEngineRegistry:
+    """Bounded, LRU-evicting cache of per-project SQLite engines and sessionmakers.
+
+    Per-project databases are opened repeatedly while the user flips between jobs. Rather
+    than building (and leaking) a new Engine for every DataManager call, engines are kept
+    here keyed by the normalized file path. When more than ``max_size`` files are open the
+    least recently used engine is disposed, closing its pooled connections and file handles.
+
+    If the underlying file disappears (e.g. the user or a test deleted it) the stale engine
+    is disposed and a fresh one is created on the next lookup.
+
+    The registry also remembers which files have had their schema verified in this process
+    (see mark_schema_ready); that flag is dropped together with the engine.
+    """
+
+    def __init__(self, max_size: int = 8, echo: bool = False, pragmas: Optional[SqlitePragmaProfile] = None) -> None:
+        self._max_size = max(1, int(max_size))
+        self._echo = echo
+        self._pragmas = pragmas
+        self._entries: "OrderedDict[str, Tuple[Any, sessionmaker]]" = OrderedDict()
+        self._schema_ready: set[str] = set()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, db_path: str) -> Tuple[Any, sessionmaker]:
+        """Return a cached (engine, Session) pair for db_path, creating it on a miss."""
+        key = _normalize_sqlite_path(db_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not os.path.exists(key):
+                # File was removed behind our back; drop the engine pointing at the old inode
+                self._dispose_key(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = create_engine_and_sessionmaker_for_sqlite_path(key, echo=self._echo, pragmas=self._pragmas)
+            self._entries[key] = entry
+            while len(self._entries) > self._max_size:
+                old_key = next(iter(self._entries))
+                self._dispose_key(old_key)
+                self.evictions += 1
+            return entry
+
+    def dispose(self, db_path: str) -> bool:
+        """Dispose and forget the engine for db_path. Returns True if one was cached."""
+        key = _normalize_sqlite_path(db_path)
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._dispose_key(key)
+            return True
+
+    def dispose_all(self) -> None:
+        """Dispose every cached engine (e.g. on application shutdown)."""
+        with self._lock:
+            for key in list(self._entries.keys()):
+                self._dispose_key(key)
+
+    def is_schema_ready(self, db_path: str) -> bool:
+        """True if the schema for db_path was verified since its engine was created."""
+        key = _normalize_sqlite_path(db_path)
+        with self._lock:
+            return key in self._schema_ready and key in self._entries
+
+    def mark_schema_ready(self, db_path: str) -> None:
+        """Record that db_path's schema is current so callers can skip DDL checks."""
+        key = _normalize_sqlite_path(db_path)
+        with self._lock:
+            if key in self._entries:
+                self._schema_ready.add(key)
+
+    def __contains__(self, db_path: object) -> bool:
+        with self._lock:
+            return _normalize_sqlite_path(str(db_path)) in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters: hits, misses, evictions, open engines and checked-out connections."""
+        with self._lock:
+            checked_out = 0
+            for engine, _ in self._entries.values():
+                try:
+                    checked_out += int(engine.pool.checkedout())
+                except Exception:  # pragma: no cover - pool types without counters
+                    pass
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "open_engines": len(self._entries),
+                "checked_out_connections": checked_out,
+            }
+
+    def _dispose_key(self, key: str) -> None:
+        self._schema_ready.discard(key)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        try:
+            entry[0].dispose()
+        except Exception:  # pragma: no cover
+            pass
+
+
+_engine_registry: SqliteEngineRegistry | None = None
+_engine_registry_lock = threading.Lock()
+
+
+def get_sqlite_engine_registry() -> SqliteEngineRegistry:
+    """Return the process-wide per-project engine registry (created lazily)."""
+    global _engine_registry
+    if _engine_registry is None:
+        with _engine_registry_lock:
+            if _engine_registry is None:
+                try:
+                    max_size = int(os.getenv("PROJECT_DB_ENGINE_CACHE_SIZE", "8"))
+                except ValueError:
+                    max_size = 8
+                _engine_registry = SqliteEngineRegistry(max_size=max_size)
+    return _engine_registry
+
+
+def reset_sqlite_engine_registry(registry: SqliteEngineRegistry | None = None) -> SqliteEngineRegistry:
+    """Dispose the current registry's engines and install registry (or a fresh default one)."""
+    global _engine_registry
+    with _engine_registry_lock:
+        old = _engine_registry
+        _engine_registry = registry
+    if old is not None and old is not registry:
+        old.dispose_all()
+    return get_sqlite_engine_registry()
+
+
+def get_engine_and_sessionmaker_for_sqlite_path(db_path: str) -> Tuple[Any, sessionmaker]:
+    """Shared (engine, Session) for a per-project SQLite file, served from the registry.
+
+    Unlike create_engine_and_sessionmaker_for_sqlite_path, callers must not dispose the
+    returned engine; its lifetime is owned by the registry.
+    """
+    return get_sqlite_engine_registry().get(db_path)
@@ -0,0 +1,176 @@
+"""Stable fingerprints for product lists, used to detect changes between Innergy and the DB.
+
+Each product (dict or attribute object, as returned by the Innergy fetch or the per-project
+DB; a ProductBatch is read column-wise) is reduced to its compared fields and hashed into a
+fixed-size digest. A project digest combines the per-product digests with a modular sum, so
+it does not depend on list order and no sort is needed. Products are also keyed by a stable identity (item number, else name +
+location + occurrence) so two fingerprints can be diffed into added / removed / changed keys
+in one pass over each list.
+"""
+from __future__ import annotations
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from mmx_engineering_spec_manager.dtos.product_batch import ProductBatch
+
+# (attribute name, default used when the value is missing or empty)
+_STR_FIELDS = ("name", "description", "location", "item_number", "comment", "file_name", "picture_name")
+_FIELDS: Tuple[Tuple[str, Any], ...] = (
+    ("name", ""),
+    ("quantity", None),
+    ("description", ""),
+    ("location", ""),
+    ("width", None),
+    ("height", None),
+    ("depth", None),
+    ("x_origin", None),
+    ("y_origin", None),
+    ("z_origin", None),
+    ("item_number", ""),
+    ("comment", ""),
+    ("angle", None),
+    ("link_id_specification_group", None),
+    ("link_id_location", None),
+    ("link_id_wall", None),
+    ("file_name", ""),
+    ("picture_name", ""),
+)
+
+_DIGEST_BITS = 128
+_DIGEST_MOD = 1 << _DIGEST_BITS
+
+ProductKey = Tuple[Any, ...]
+
+
+def _get(product: Any, name: str, default: Any = None) -> Any:
+    if isinstance(product, dict):
+        return product.get(name, default)
+    return getattr(product, name, default)
+
+
+def _canonical(value: Any) -> Any:
+    # 2, 2.0 compare equal as before; make them hash the same too
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _normalized(values: Iterable[Any], cf_pairs: Iterable[Tuple[Any, Any]]) -> Tuple[Any, ...]:
+    out = []
+    for (name, default), value in zip(_FIELDS, values):
+        if name in _STR_FIELDS:
+            value = value or default
+        out.append(_canonical(value))
+    pairs = [(n or "", _canonical(v)) for n, v in cf_pairs]
+    pairs.sort(key=repr)
+    out.append(tuple(pairs))
+    return tuple(out)
+
+
+def _cf_pairs(product: Any) -> list:
+    return [(_get(cf, "name", ""), _get(cf, "value", None)) for cf in _get(product, "custom_fields", None) or []]
+
+
+def product_fields(product: Any) -> Tuple[Any, ...]:
+    """The compared fields of one product, with custom fields as sorted (name, value) pairs."""
+    return _normalized((_get(product, name, default) for name, default in _FIELDS), _cf_pairs(product))
+
+
+def _digest(fields: Tuple[Any, ...]) -> int:
+    data = repr(fields).encode("utf-8", "surrogatepass")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=_DIGEST_BITS // 8).digest(), "big")
+
+
+def product_digest(product: Any) -> int:
+    """128-bit digest of product_fields(product)."""
+    return _digest(product_fields(product))
+
+
+def values_digest(values: Iterable[Any], cf_pairs: Iterable[Tuple[Any, Any]] = ()) -> int:
+    """128-bit digest of field values plus (name, value) pairs exactly as given (no normalization)."""
+    return _digest((tuple(values), tuple(cf_pairs)))
+
+
+def _item_number(item: Any, cf_pairs: Iterable[Tuple[Any, Any]]) -> str:
+    if item in (None, ""):
+        item = next((v for n, v in cf_pairs if n == "ItemNumber"), None)
+    return "" if item in (None, "") else str(item).strip()
+
+
+def _iter_compare_rows(products: Any) -> Iterator[Tuple[Tuple[Any, ...], str, Any, Any]]:
+    """(normalized fields, item number, name, location) per product.
+
+    A ProductBatch is read column-wise without building a dict per product.
+    """
+    if isinstance(products, ProductBatch):
+        columns = [getattr(products, name) for name, _ in _FIELDS]
+        for i, values in enumerate(zip(*columns)):
+            pairs = products.custom_fields_of(i)
+            yield _normalized(values, pairs), _item_number(products.item_number[i], pairs), products.name[i], products.location[i]
+        return
+    for p in products or []:
+        pairs = _cf_pairs(p)
+        fields = _normalized((_get(p, name, default) for name, default in _FIELDS), pairs)
+        yield fields, _item_number(_get(p, "item_number", None), pairs), _get(p, "name", ""), _get(p, "location", "")
+
+
+@dataclass(frozen=True)
+class ProductsDiff:
+    added: Tuple[ProductKey, ...] = ()
+    removed: Tuple[ProductKey, ...] = ()
+    changed: Tuple[ProductKey, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        return f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed"
+
+
+@dataclass(frozen=True)
+class ProductsFingerprint:
+    """Per-product digests keyed by identity plus an order-independent digest of the list."""
+
+    digests: Dict[ProductKey, int] = field(default_factory=dict)
+    digest: int = 0
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def matches(self, other: "ProductsFingerprint") -> bool:
+        return len(self) == len(other) and self.digest == other.digest
+
+    def diff(self, new: "ProductsFingerprint") -> ProductsDiff:
+        """Keys added, removed or changed going from self to new (in new's / self's order)."""
+        if self.matches(new):
+            return ProductsDiff()
+        old = self.digests
+        added, changed = [], []
+        for key, d in new.digests.items():
+            prev = old.get(key)
+            if prev is None:
+                added.append(key)
+            elif prev != d:
+                changed.append(key)
+        removed = [key for key in old if key not in new.digests]
+        return ProductsDiff(tuple(added), tuple(removed), tuple(changed))
+
+
+def fingerprint_products(products: Optional[Iterable[Any]]) -> ProductsFingerprint:
+    """Fingerprint a product list in one pass."""
+    digests: Dict[ProductKey, int] = {}
+    seen: Dict[ProductKey, int] = {}
+    total = 0
+    for fields, item, name, location in _iter_compare_rows(products):
+        d = _digest(fields)
+        total = (total + d) % _DIGEST_MOD
+        base = ("item", item) if item else ("name", name or "", str(location or "").strip())
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        digests[base + (n,)] = d
+    return ProductsFingerprint(digests, total)
+
+
+def diff_products(old: Optional[Iterable[Any]], new: Optional[Iterable[Any]]) -> ProductsDiff:
+    return fingerprint_products(old).diff(fingerprint_products(new))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 from PySide6.QtCore import QStandardPaths
 
-from .persistence import default_sqlite_db_path, get_database_url
+from .persistence import default_sqlite_db_path, get_database_url, SqlitePragmaProfile
 
 # Load .env if present
 load_dotenv()
@@ -19,6 +19,23 @@ def _app_data_dir() -> str:
     return data_dir
 
 
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or str(raw).strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None or str(raw).strip() == "":
+        return default
+    return str(raw).strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass(frozen=True)
 class Settings:
     # Innergy / Importer settings
@@ -35,6 +52,22 @@ class Settings:
     # General app paths
     app_data_dir: str = ""
 
+    # Innergy HTTP client: read timeout (seconds), retries on 429/5xx, backoff base, optional page size
+    innergy_timeout_s: float = 30.0
+    innergy_max_retries: int = 3
+    innergy_backoff_s: float = 0.5
+    innergy_page_size: Optional[int] = None
+
+    # Innergy response cache: directory (None disables), freshness TTL (0 = always revalidate),
+    # offline mode (serve cached payloads only) and a replay directory of saved JSON responses
+    innergy_cache_dir: Optional[str] = None
+    innergy_cache_ttl_s: float = 0.0
+    innergy_offline: bool = False
+    innergy_replay_dir: Optional[str] = None
+
+    # SQLite connection pragmas (WAL, synchronous, cache/mmap sizes, busy timeout)
+    sqlite_pragmas: SqlitePragmaProfile = field(default_factory=SqlitePragmaProfile)
+
 
 _settings_singleton: Optional[Settings] = None
 
@@ -53,6 +86,17 @@ def get_settings() -> Settings:
     # Use the persistence helper for DB URL resolution (keeps compatibility)
     database_url = os.getenv("DATABASE_URL") or get_database_url()
 
+    innergy_timeout_s = _env_float("INNERGY_TIMEOUT_S", 30.0)
+    innergy_max_retries = int(_env_float("INNERGY_MAX_RETRIES", 3))
+    innergy_backoff_s = _env_float("INNERGY_BACKOFF_S", 0.5)
+    innergy_page_size = int(_env_float("INNERGY_PAGE_SIZE", 0)) or None
+    innergy_cache_dir = None
+    if _env_flag("INNERGY_HTTP_CACHE", True):
+        innergy_cache_dir = os.getenv("INNERGY_CACHE_DIR") or str(Path(app_data) / "http_cache" / "innergy")
+    innergy_cache_ttl_s = _env_float("INNERGY_CACHE_TTL_S", 0.0)
+    innergy_offline = _env_flag("INNERGY_OFFLINE", False)
+    innergy_replay_dir = os.getenv("INNERGY_REPLAY_DIR") or None
+
     microvellum_xml_template_path = os.getenv("MICROVELLUM_XML_TEMPLATE_PATH")
     xlsx_template_path = os.getenv("XLSX_TEMPLATE_PATH")
 
@@ -63,5 +107,14 @@ def get_settings() -> Settings:
         microvellum_xml_template_path=microvellum_xml_template_path,
         xlsx_template_path=xlsx_template_path,
         app_data_dir=app_data,
+        innergy_timeout_s=innergy_timeout_s,
+        innergy_max_retries=innergy_max_retries,
+        innergy_backoff_s=innergy_backoff_s,
+        innergy_page_size=innergy_page_size,
+        innergy_cache_dir=innergy_cache_dir,
+        innergy_cache_ttl_s=innergy_cache_ttl_s,
+        innergy_offline=innergy_offline,
+        innergy_replay_dir=innergy_replay_dir,
+        sqlite_pragmas=SqlitePragmaProfile.from_env(),
     )
     return _settings_singleton
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Rect:
+    """Axis-aligned rectangle: left x, top y, width, height (scene units, inches)."""
+    x: float
+    y: float
+    w: float
+    h: float
+
+    @property
+    def right(self) -> float:
+        return self.x + self.w
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.h
+
+    def overlaps(self, other: "Rect") -> bool:
+        # Touching edges do not count: products placed side by side are not colliding
+        return self.x < other.right and other.x < self.right and self.y < other.bottom and other.y < self.bottom
+
+    def moved(self, dx: float = 0.0, dy: float = 0.0) -> "Rect":
+        return Rect(self.x + dx, self.y + dy, self.w, self.h)
+
+    def differs(self, other: Optional["Rect"], eps: float = 1e-6) -> bool:
+        if other is None:
+            return True
+        return any(abs(a - b) > eps for a, b in ((self.x, other.x), (self.y, other.y), (self.w, other.w), (self.h, other.h)))
+
+
+class RectIndex:
+    """Spatial index over the product rectangles on one wall, keyed by product id.
+
+    Products along a wall are laid out mostly in x, so rectangles are kept in a list sorted
+    by left edge (an interval index over x). A query only visits the rectangles whose left
+    edge lies within [query.x - widest, query.right), found by bisection, then filters on y.
+    Left and right edges are also kept sorted for nearest-edge snapping. Lookups are
+    O(log n + k) for k candidates; inserts and removals are bisection plus a list shift.
+    """
+
+    def __init__(self, rects: Iterable[Tuple[Hashable, Rect]] = ()) -> None:
+        self._rects: Dict[Hashable, Rect] = {}
+        self._by_x: List[Tuple[float, int, Hashable]] = []
+        self._edges: List[Tuple[float, int, Hashable]] = []
+        self._max_w = 0.0
+        # Tie-breaker so ids of different types never get compared
+        self._seq: Dict[Hashable, int] = {}
+        self._next_seq = 0
+        for key, rect in rects:
+            self.insert(key, rect)
+
+    # ---- Mutation ----
+    def insert(self, key: Hashable, rect: Rect) -> None:
+        if key in self._rects:
+            self.remove(key)
+        seq = self._seq.get(key)
+        if seq is None:
+            seq = self._seq[key] = self._next_seq
+            self._next_seq += 1
+        self._rects[key] = rect
+        insort(self._by_x, (rect.x, seq, key))
+        insort(self._edges, (rect.x, seq, key))
+        insort(self._edges, (rect.right, seq, key))
+        self._max_w = max(self._max_w, rect.w)
+
+    update = insert
+
+    def remove(self, key: Hashable) -> Optional[Rect]:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return None
+        seq = self._seq[key]
+        self._discard(self._by_x, (rect.x, seq, key))
+        self._discard(self._edges, (rect.x, seq, key))
+        self._discard(self._edges, (rect.right, seq, key))
+        if rect.w >= self._max_w:
+            self._max_w = max((r.w for r in self._rects.values()), default=0.0)
+        return rect
+
+    def clear(self) -> None:
+        self._rects.clear()
+        self._by_x.clear()
+        self._edges.clear()
+        self._seq.clear()
+        self._max_w = 0.0
+
+    @staticmethod
+    def _discard(items: List[Tuple[float, int, Hashable]], entry: Tuple[float, int, Hashable]) -> None:
+        i = bisect_left(items, entry[:2])
+        while i < len(items) and items[i][:2] == entry[:2]:
+            if items[i][2] == entry[2]:
+                del items[i]
+                return
+            i += 1
+
+    # ---- Queries ----
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rects
+
+    def get(self, key: Hashable) -> Optional[Rect]:
+        return self._rects.get(key)
+
+    def changed(self, key: Hashable, rect: Rect, eps: float = 1e-6) -> bool:
+        """True when rect differs from what is indexed for key (or key is not indexed)."""
+        return rect.differs(self._rects.get(key), eps)
+
+    def query(self, rect: Rect, exclude: Optional[Hashable] = None) -> List[Hashable]:
+        """Keys whose rectangle overlaps rect."""
+        lo = bisect_left(self._by_x, (rect.x - self._max_w,))
+        hi = bisect_left(self._by_x, (rect.right,))
+        out = []
+        for _, _, key in self._by_x[lo:hi]:
+            if key != exclude and self._rects[key].overlaps(rect):
+                out.append(key)
+        return out
+
+    def overlapping(self, key: Hashable) -> List[Hashable]:
+        rect = self._rects.get(key)
+        return self.query(rect, exclude=key) if rect is not None else []
+
+    def nearest_edge(self, x: float, tolerance: float, exclude: Optional[Hashable] = None) -> Optional[float]:
+        """The indexed left/right edge closest to x within tolerance, else None."""
+        if tolerance <= 0:
+            return None
+        best: Optional[float] = None
+        i = bisect_left(self._edges, (x,))
+        # Walk outwards from the insertion point in both directions
+        for j in range(i - 1, -1, -1):
+            ex, _, key = self._edges[j]
+            if x - ex > tolerance:
+                break
+            if key != exclude:
+                best = ex
+                break
+        hi = bisect_right(self._edges, (x + tolerance, float("inf")))
+        for j in range(i, hi):
+            ex, _, key = self._edges[j]
+            if key != exclude:
+                if best is None or abs(ex - x) < abs(best - x):
+                    best = ex
+                break
+        return best
+
+    def snap_x(self, key: Hashable, rect: Rect, tolerance: float) -> float:
+        """Left x for rect after snapping its left or right edge to the nearest neighbour edge."""
+        candidates = []
+        left = self.nearest_edge(rect.x, tolerance, exclude=key)
+        if left is not None:
+            candidates.append((abs(left - rect.x), left))
+        right = self.nearest_edge(rect.right, tolerance, exclude=key)
+        if right is not None:
+            candidates.append((abs(right - rect.right), right - rect.w))
+        if not candidates:
+            return rect.x
+        return min(candidates)[1]
@@ -132,7 +132,7 @@ class MainWindowViewModel:
                         else:
                             self.notify(f"Failed to load project from DB: {getattr(res, 'error', 'unknown error')}", level="warning")
                     elif getattr(self, "_data_manager", None) is not None:  # fallback during transition
-                        loaded = self._data_manager.get_full_project_from_project_db(pid)
+                        loaded = self._data_manager.get_project_snapshot(pid)
                         if loaded is not None:
                             enriched = loaded
                             self.project_opened.emit(enriched)
@@ -185,7 +185,7 @@ class MainWindowViewModel:
                         else:
                             self.notify(f"Failed to load project from DB: {getattr(res, 'error', 'unknown error')}", level="warning")
                     elif getattr(self, "_data_manager", None) is not None:  # fallback during transition
-                        loaded = self._data_manager.get_full_project_from_project_db(pid)
+                        loaded = self._data_manager.get_project_snapshot(pid)
                         if loaded is not None:
                             enriched = loaded
                 except Exception:
@@ -1,7 +1,14 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from mmx_engineering_spec_manager.dtos.product_batch import ProductBatch
+from mmx_engineering_spec_manager.utilities.product_fingerprint import (
+    ProductsDiff,
+    ProductsFingerprint,
+    fingerprint_products,
+)
 
 try:  # pragma: no cover - import resilience
     from mmx_engineering_spec_manager.services import ProjectBootstrapService
@@ -42,11 +49,19 @@ class Event:
                 pass
 
 
+def _staged_copy(products: Any) -> Sequence[Dict[str, Any]]:
+    # ProductBatch is immutable, so it can be shared instead of copied into dicts
+    return products if isinstance(products, ProductBatch) else list(products or [])
+
+
 @dataclass
 class ProjectDetailsViewState:
     active_project_id: Optional[int] = None
     project: Any | None = None  # domain model or ORM-like object
-    staged_products: List[Dict[str, Any]] = field(default_factory=list)
+    staged_products: Sequence[Dict[str, Any]] = field(default_factory=list)  # list or ProductBatch
+    # Fingerprint of staged_products (computed once when staged) and its diff against the DB
+    staged_fingerprint: Optional[ProductsFingerprint] = None
+    staged_diff: ProductsDiff = field(default_factory=ProductsDiff)
     is_loading: bool = False
     is_saving: bool = False
     error: Optional[str] = None
@@ -138,7 +153,7 @@ class ProjectDetailsViewModel:
         finally:
             self.view_state.is_loading = False
 
-    def load_products_from_innergy_if_needed(self) -> List[Dict[str, Any]]:
+    def load_products_from_innergy_if_needed(self) -> Sequence[Dict[str, Any]]:
         """Fetch products from Innergy, compare with DB, and stage changes if different.
 
         If there are no differences, emit an informational notification.
@@ -158,34 +173,38 @@ class ProjectDetailsViewModel:
             current_db = self._products.get_products_from_db(int(pid)) or []
         except Exception:
             current_db = []
-        if self._normalize_products_for_compare(fetched) == self._normalize_products_for_compare(current_db):
+        fetched_fp = fingerprint_products(fetched)
+        diff = fingerprint_products(current_db).diff(fetched_fp)
+        if not diff:
             self._notify("No changes were discovered.")
             # Clear staged products
-            self.view_state.staged_products = []
+            self._set_staged([], None, ProductsDiff())
             self.products_loaded.emit([])
             return []
-        # Stage products and notify view
-        staged = list(fetched or [])
-        self.view_state.staged_products = staged
+        # Stage products and notify view (a ProductBatch is kept columnar)
+        staged = _staged_copy(fetched)
+        self._set_staged(staged, fetched_fp, diff)
         self.products_loaded.emit(staged)
         return staged
 
-    def stage_products(self, products: List[Dict[str, Any]]) -> None:
-        self.view_state.staged_products = list(products or [])
+    def stage_products(self, products: Sequence[Dict[str, Any]]) -> None:
+        staged = _staged_copy(products)
+        # The DB diff is only known after a fetch; keep the fingerprint for later compares
+        self._set_staged(staged, fingerprint_products(staged), ProductsDiff())
         self.products_loaded.emit(self.view_state.staged_products)
 
     def save_products_changes(self) -> bool:
         pid = self.view_state.active_project_id
         if not pid or self._products is None:
             return False
-        prods = list(self.view_state.staged_products or [])
+        prods = _staged_copy(self.view_state.staged_products)
         if not prods:
             return False
         try:
             res = self._products.replace_products_for_project(int(pid), prods)
             if getattr(res, "ok", False):
                 # Clear staged changes and reload enriched project for display
-                self.view_state.staged_products = []
+                self._set_staged([], None, ProductsDiff())
                 try:
                     if self._projects is not None:
                         res2 = self._projects.load_enriched_project(self.view_state.project)
@@ -194,7 +213,13 @@ class ProjectDetailsViewModel:
                             self.project_loaded.emit(self.view_state.project)
                 except Exception:
                     pass
-                self._notify("Products saved")
+                stats = getattr(res, "value", None)
+                if stats is not None and hasattr(stats, "inserted"):
+                    self._notify(
+                        f"Products saved ({stats.inserted} added, {stats.updated} updated, {stats.deleted} removed)"
+                    )
+                else:
+                    self._notify("Products saved")
                 return True
             # Failure
             self._set_error(getattr(res, "error", "Failed to save products"))
@@ -204,66 +229,14 @@ class ProjectDetailsViewModel:
             return False
 
     # ---- Helpers ----
+    def _set_staged(self, products: Sequence[Dict[str, Any]], fingerprint: Optional[ProductsFingerprint], diff: ProductsDiff) -> None:
+        self.view_state.staged_products = products
+        self.view_state.staged_fingerprint = fingerprint
+        self.view_state.staged_diff = diff
+
     def _set_error(self, message: str) -> None:
         self.view_state.error = message
         self.notification.emit({"level": "error", "message": message})
 
     def _notify(self, message: str, level: str = "info") -> None:
         self.notification.emit({"level": level, "message": message})
-
-    def _normalize_products_for_compare(self, products_list: List[Dict[str, Any]] | List[Any]) -> List[Any]:
-        """Return a sorted, normalized list of tuples for equality compare including extended attributes.
-        Accepts dicts or objects with attributes like the DataManager returns.
-        """
-        norm = []
-        for d in (products_list or []):
-            if isinstance(d, dict):
-                name = d.get("name") or ""
-                qty = d.get("quantity")
-                desc = d.get("description") or ""
-                cfs = d.get("custom_fields") or []
-                loc = d.get("location") or ""
-                width = d.get("width")
-                height = d.get("height")
-                depth = d.get("depth")
-                xo = d.get("x_origin")
-                yo = d.get("y_origin")
-                zo = d.get("z_origin")
-                item_no = d.get("item_number") or ""
-                comment = d.get("comment") or ""
-                angle = d.get("angle")
-                link_sg = d.get("link_id_specification_group")
-                link_loc = d.get("link_id_location")
-                link_wall = d.get("link_id_wall")
-                file_name = d.get("file_name") or ""
-                picture_name = d.get("picture_name") or ""
-            else:
-                name = getattr(d, "name", "")
-                qty = getattr(d, "quantity", None)
-                desc = getattr(d, "description", "")
-                cfs = getattr(d, "custom_fields", []) or []
-                loc = getattr(d, "location", "") if hasattr(d, "location") else ""
-                width = getattr(d, "width", None)
-                height = getattr(d, "height", None)
-                depth = getattr(d, "depth", None)
-                xo = getattr(d, "x_origin", None)
-                yo = getattr(d, "y_origin", None)
-                zo = getattr(d, "z_origin", None)
-                item_no = getattr(d, "item_number", "")
-                comment = getattr(d, "comment", "")
-                angle = getattr(d, "angle", None)
-                link_sg = getattr(d, "link_id_specification_group", None)
-                link_loc = getattr(d, "link_id_location", None)
-                link_wall = getattr(d, "link_id_wall", None)
-                file_name = getattr(d, "file_name", "")
-                picture_name = getattr(d, "picture_name", "")
-            cf_pairs = []
-            for cf in cfs:
-                if isinstance(cf, dict):
-                    cf_pairs.append((cf.get("name") or "", cf.get("value")))
-                else:
-                    cf_pairs.append((getattr(cf, "name", ""), getattr(cf, "value", None)))
-            cf_pairs.sort()
-            norm.append((name, qty, desc, loc, width, height, depth, xo, yo, zo, item_no, comment, angle, link_sg, link_loc, link_wall, file_name, picture_name, tuple(cf_pairs)))
-        norm.sort()
-        return norm
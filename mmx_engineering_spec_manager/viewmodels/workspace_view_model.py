@@ -1,11 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Optional, Callable, Dict
+from typing import Any, Optional, Callable, Dict, List
 
 try:  # pragma: no cover - import resilience for tests
-    from mmx_engineering_spec_manager.services import WorkspaceService, Result  # type: ignore
+    from mmx_engineering_spec_manager.services import WorkspaceService, WorkspaceChangeJournal, Result  # type: ignore
 except Exception:  # pragma: no cover
     WorkspaceService = Any  # type: ignore
+    WorkspaceChangeJournal = None  # type: ignore
     @dataclass
     class Result:  # type: ignore
         ok: bool
@@ -50,7 +51,8 @@ class WorkspaceViewState:
 class WorkspaceViewModel:
     """ViewModel for the Workspace tab.
 
-    - Holds a serializable tree for project → locations → walls → products
+    - Holds a serializable tree for project → locations → walls → products; branches
+      below the locations are fetched on demand with load_children()
     - No UI toolkit imports
     - Delegates I/O to WorkspaceService
     """
@@ -58,8 +60,11 @@ class WorkspaceViewModel:
     def __init__(self, workspace_service: WorkspaceService | None = None) -> None:
         self.view_state = WorkspaceViewState()
         self._service = workspace_service
+        # Pending geometry edits, coalesced per product/wall until saved
+        self.journal = WorkspaceChangeJournal() if WorkspaceChangeJournal is not None else None
         # Events for Views to subscribe to
         self.tree_loaded = Event()
+        self.children_loaded = Event()
         self.notification = Event()
 
     # ---- Commands ----
@@ -69,6 +74,8 @@ class WorkspaceViewModel:
         self.view_state.tree = {}
         self.view_state.error = None
         self.view_state.dirty = False
+        if self.journal is not None:
+            self.journal.clear()
 
     def load(self) -> Dict[str, Any]:
         """Load the project tree via service and update state.
@@ -95,17 +102,60 @@ class WorkspaceViewModel:
         finally:
             self.view_state.is_loading = False
 
+    def load_children(self, node_key: str) -> List[Dict[str, Any]]:
+        """Fetch the children of one tree node on demand (lazy expansion).
+
+        Emits children_loaded(node_key, children) and returns the list ([] on failure).
+        """
+        pid = self.view_state.active_project_id
+        if not pid or self._service is None or not hasattr(self._service, "load_children"):
+            return []
+        try:
+            children = list(self._service.load_children(int(pid), node_key) or [])
+        except Exception as e:  # pragma: no cover
+            self._set_error(str(e))
+            return []
+        self.children_loaded.emit(node_key, children)
+        return children
+
+    def record_product_move(self, product_id: int, **fields: float) -> None:
+        """Journal a product move (x_origin_from_right / y_origin_from_face / z_origin_from_bottom)."""
+        if self.journal is None:
+            return
+        try:
+            self.journal.record_product_move(product_id, **fields)
+        except Exception as e:
+            self._set_error(str(e))
+            return
+        self.mark_dirty(True)
+
+    def record_wall_edit(self, wall_id: int, **fields: float) -> None:
+        if self.journal is None:
+            return
+        try:
+            self.journal.record_wall_edit(wall_id, **fields)
+        except Exception as e:
+            self._set_error(str(e))
+            return
+        self.mark_dirty(True)
+
     def save_changes(self, changes: Dict[str, Any] | None = None) -> bool:
         """Persist changes to the project via the service.
 
+        Without explicit changes the journaled edits are saved (and cleared on success).
         Returns True on success; emits notification and clears dirty flag.
         """
         pid = self.view_state.active_project_id
         if not pid or self._service is None:
             return False
+        from_journal = not changes and self.journal is not None
         try:
-            res: Result = self._service.save_changes(changes or {})
+            payload: Dict[str, Any] = dict(self.journal.to_changes() if from_journal else (changes or {}))
+            payload.setdefault("project_id", pid)
+            res: Result = self._service.save_changes(payload)
             if getattr(res, "ok", False):
+                if from_journal:
+                    self.journal.clear()
                 self.view_state.dirty = False
                 self.notification.emit({"level": "info", "message": "Workspace saved"})
                 return True
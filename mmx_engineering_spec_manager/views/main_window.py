@@ -9,6 +9,7 @@ from .workspace.workspace_tab import WorkspaceTab
 from .attributes.attributes_tab import AttributesTab
 from mmx_engineering_spec_manager.utilities.settings import get_settings
 from mmx_engineering_spec_manager.utilities.persistence import project_sqlite_db_path
+from mmx_engineering_spec_manager.utilities.product_fingerprint import fingerprint_products
 
 
 class MainWindow(QMainWindow):
@@ -102,6 +103,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         self._pending_products = None
+        self._pending_products_diff = None  # ProductsDiff of the staged products vs the DB
         
         # No DataManager in View (MVVM). Keep attribute for legacy no-op handlers.
         self._data_manager = None
@@ -263,7 +265,7 @@ class MainWindow(QMainWindow):
                 # If a DB file existed already, prefer loading from it and SKIP any API calls
                 if existed_already and pid is not None:
                     try:
-                        enriched = self._data_manager.get_full_project_from_project_db(pid)
+                        enriched = self._data_manager.get_project_snapshot(pid)
                         if enriched is not None:
                             project_to_show = enriched
                             # Show details without attempting ingestion
@@ -328,7 +330,7 @@ class MainWindow(QMainWindow):
                             pass
                     # Try to load enriched project from per-project DB regardless
                     try:
-                        enriched = self._data_manager.get_full_project_from_project_db(pid)
+                        enriched = self._data_manager.get_project_snapshot(pid)
                         if enriched is not None:
                             project_to_show = enriched
                     except Exception:
@@ -365,61 +367,6 @@ class MainWindow(QMainWindow):
             pass
 
     # --- Innergy Products Load/Save workflow ---
-    def _normalize_products_for_compare(self, products_list):
-        """Return a sorted list of tuples for stable equality compare including extended attributes."""
-        norm = []
-        for d in (products_list or []):
-            if isinstance(d, dict):
-                name = d.get("name") or ""
-                qty = d.get("quantity")
-                desc = d.get("description") or ""
-                cfs = d.get("custom_fields") or []
-                loc = d.get("location") or ""
-                width = d.get("width")
-                height = d.get("height")
-                depth = d.get("depth")
-                xo = d.get("x_origin")
-                yo = d.get("y_origin")
-                zo = d.get("z_origin")
-                item_no = d.get("item_number") or ""
-                comment = d.get("comment") or ""
-                angle = d.get("angle")
-                link_sg = d.get("link_id_specification_group")
-                link_loc = d.get("link_id_location")
-                link_wall = d.get("link_id_wall")
-                file_name = d.get("file_name") or ""
-                picture_name = d.get("picture_name") or ""
-            else:
-                name = getattr(d, "name", "")
-                qty = getattr(d, "quantity", None)
-                desc = getattr(d, "description", "")
-                cfs = getattr(d, "custom_fields", []) or []
-                loc = getattr(d, "location", "") if hasattr(d, "location") else ""
-                width = getattr(d, "width", None)
-                height = getattr(d, "height", None)
-                depth = getattr(d, "depth", None)
-                xo = getattr(d, "x_origin", None)
-                yo = getattr(d, "y_origin", None)
-                zo = getattr(d, "z_origin", None)
-                item_no = getattr(d, "item_number", "")
-                comment = getattr(d, "comment", "")
-                angle = getattr(d, "angle", None)
-                link_sg = getattr(d, "link_id_specification_group", None)
-                link_loc = getattr(d, "link_id_location", None)
-                link_wall = getattr(d, "link_id_wall", None)
-                file_name = getattr(d, "file_name", "")
-                picture_name = getattr(d, "picture_name", "")
-            cf_pairs = []
-            for cf in cfs:
-                if isinstance(cf, dict):
-                    cf_pairs.append((cf.get("name") or "", cf.get("value")))
-                else:
-                    cf_pairs.append((getattr(cf, "name", ""), getattr(cf, "value", None)))
-            cf_pairs.sort()
-            norm.append((name, qty, desc, loc, width, height, depth, xo, yo, zo, item_no, comment, angle, link_sg, link_loc, link_wall, file_name, picture_name, tuple(cf_pairs)))
-        norm.sort()
-        return norm
-
     def _on_load_products_from_innergy(self):
         project = getattr(self, "current_project", None)
         if project is None or getattr(self, "_data_manager", None) is None:
@@ -463,7 +410,9 @@ class MainWindow(QMainWindow):
             current_db = self._data_manager.get_products_for_project_from_project_db(pid) or []
         except Exception:
             current_db = []
-        if self._normalize_products_for_compare(fetched) == self._normalize_products_for_compare(current_db):
+        fetched_fp = fingerprint_products(fetched)
+        diff = fingerprint_products(current_db).diff(fetched_fp)
+        if not diff:
             try:
                 QMessageBox.information(self, "No Changes", "No changes were discovered.")
             except Exception:
@@ -473,9 +422,11 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._pending_products = None
+            self._pending_products_diff = None
             return
         # Show fetched products in the detail tree without persisting
         self._pending_products = fetched
+        self._pending_products_diff = diff
         # Update (do not replace) the existing tree's Locations subtree
         try:
             self.projects_detail_view.update_products_from_dicts(fetched)
@@ -503,13 +454,14 @@ class MainWindow(QMainWindow):
         if ok:
             # Clear pending and disable button
             self._pending_products = None
+            self._pending_products_diff = None
             try:
                 self.projects_detail_view.set_save_products_changes_enabled(False)
             except Exception:
                 pass
             # Reload enriched project from per-project DB and display
             try:
-                enriched = self._data_manager.get_full_project_from_project_db(pid)
+                enriched = self._data_manager.get_project_snapshot(pid)
                 if enriched is not None:
                     self.projects_tab.display_project_details(enriched)
             except Exception:
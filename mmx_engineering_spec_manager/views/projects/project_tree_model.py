@@ -0,0 +1,89 @@
+from __future__ import annotations
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+# (label, value, loader for the row's own children or None)
+LazyRow = Tuple[str, str, Optional[Callable[[], Iterable["LazyRow"]]]]
+
+# Item data role holding the key of a not-yet-fetched branch
+_PENDING_ROLE = Qt.UserRole + 1
+
+
+class LazyProjectTreeModel(QStandardItemModel):
+    """QStandardItemModel whose branches can be filled on first expand.
+
+    add_lazy_row() appends an [item, value] row and keeps only a loader for its children;
+    QTreeView asks canFetchMore()/fetchMore() when the branch is expanded, and only then
+    are the child items created (their own loaders stay pending in turn). A project with
+    thousands of products therefore opens with one item per location instead of items for
+    every product attribute.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: Dict[int, Callable[[], Iterable[LazyRow]]] = {}
+        self._keys = count(1)
+
+    def add_lazy_row(self, parent: QStandardItem, label: str, value: str = "",
+                     load_children: Optional[Callable[[], Iterable[LazyRow]]] = None) -> QStandardItem:
+        item = QStandardItem(label)
+        parent.appendRow([item, QStandardItem(value)])
+        if load_children is not None:
+            key = next(self._keys)
+            self._pending[key] = load_children
+            item.setData(key, _PENDING_ROLE)
+        return item
+
+    def _pending_key(self, parent: QModelIndex | QPersistentModelIndex) -> Optional[int]:
+        if not parent.isValid() or parent.column() != 0:
+            return None
+        item = self.itemFromIndex(parent)
+        key = item.data(_PENDING_ROLE) if item is not None else None
+        return key if key in self._pending else None
+
+    def remove_children(self, item: QStandardItem) -> None:
+        """Remove all child rows of item, dropping any loaders still pending beneath it."""
+        stack = [item.child(r, 0) for r in range(item.rowCount())]
+        while stack:
+            child = stack.pop()
+            if child is None:
+                continue
+            self._pending.pop(child.data(_PENDING_ROLE), None)
+            stack.extend(child.child(r, 0) for r in range(child.rowCount()))
+        item.removeRows(0, item.rowCount())
+
+    def is_fetched(self, item: QStandardItem) -> bool:
+        return item.data(_PENDING_ROLE) not in self._pending
+
+    # ---- QAbstractItemModel ----
+    def hasChildren(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:
+        if self._pending_key(parent) is not None:
+            return True
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        return self._pending_key(parent) is not None or super().canFetchMore(parent)
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        key = self._pending_key(parent)
+        if key is None:
+            return super().fetchMore(parent)
+        # Drop first so a failing loader is not retried on every repaint
+        loader = self._pending.pop(key)
+        item = self.itemFromIndex(parent)
+        try:
+            rows: List[LazyRow] = list(loader() or [])
+        except Exception:
+            rows = []
+        for label, value, load_children in rows:
+            self.add_lazy_row(item, label, value, load_children)
+        if not rows:
+            # Let the view drop the expand indicator
+            self.dataChanged.emit(parent, parent)
+
+    def clear(self) -> None:
+        self._pending.clear()
+        super().clear()
@@ -1,7 +1,11 @@
+from typing import Callable
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTreeView
 from PySide6.QtCore import Signal, QModelIndex
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 
+from mmx_engineering_spec_manager.views.projects.project_tree_model import LazyProjectTreeModel, LazyRow
+
 # Compat: PySide6 versions used in tests may lack QModelIndex.child; provide a fallback.
 if not hasattr(QModelIndex, "child"):
     def _qindex_child(self, row: int, column: int):  # type: ignore[no-redef]
@@ -20,6 +24,24 @@ class ProjectsDetailView(QWidget):
     load_products_clicked_signal = Signal()
     save_products_changes_clicked_signal = Signal()
 
+    # Extended product dict attributes shown under each product (key, label)
+    _DICT_PRODUCT_ATTRS = (
+        ("width", "Width"),
+        ("height", "Height"),
+        ("depth", "Depth"),
+        ("x_origin", "X Origin"),
+        ("y_origin", "Y Origin"),
+        ("z_origin", "Z Origin"),
+        ("item_number", "Item Number"),
+        ("comment", "Comment"),
+        ("angle", "Angle"),
+        ("link_id_specification_group", "LinkIDSpecificationGroup"),
+        ("link_id_location", "LinkIDLocation"),
+        ("link_id_wall", "LinkIDWall"),
+        ("file_name", "File Name"),
+        ("picture_name", "Picture Name"),
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -76,9 +98,89 @@ class ProjectsDetailView(QWidget):
                 return child
         return None
 
+    # ---- Product rows (built lazily by LazyProjectTreeModel) ----
+    def _products_loader(self, products: list, row_for) -> Callable[[], list[LazyRow]]:
+        return lambda: [row_for(p) for p in products]
+
+    def _append_rows_eagerly(self, parent: QStandardItem, rows) -> None:
+        for label, value, load_children in rows:
+            item = QStandardItem(label)
+            parent.appendRow([item, QStandardItem(value)])
+            if load_children is not None:
+                self._append_rows_eagerly(item, load_children())
+
+    def _orm_product_row(self, p) -> LazyRow:
+        try:
+            pname = getattr(p, 'name', None) or self._as_str(p)
+            qty = getattr(p, 'quantity', None)
+            label, value = self._as_str(pname), (f"Qty: {qty}" if qty is not None else "")
+        except Exception:
+            label, value = self._as_str(p), ""
+        return label, value, lambda: self._orm_product_properties(p)
+
+    def _orm_product_properties(self, p) -> list[LazyRow]:
+        rows: list[LazyRow] = []
+
+        def add(key, value):
+            rows.append((key, self._as_str(value), None))
+
+        # Add product properties (from ORM columns)
+        desc = self._as_str(getattr(p, 'description', ''))
+        if desc:
+            add("Description", desc)
+        # Dimensions, origins and link IDs if present
+        for attr, label in (
+            ('width', "Width"),
+            ('height', "Height"),
+            ('depth', "Depth"),
+            ('x_origin_from_right', "X Origin"),
+            ('y_origin_from_face', "Y Origin"),
+            ('z_origin_from_bottom', "Z Origin"),
+            ('specification_group_id', "LinkIDSpecificationGroup"),
+            ('wall_id', "LinkIDWall"),
+        ):
+            try:
+                value = getattr(p, attr, None)
+            except Exception:
+                continue
+            if value is not None:
+                add(label, value)
+        # Product-level custom fields (includes ItemNumber/Comment/etc.)
+        try:
+            for cf in getattr(p, 'custom_fields', []) or []:
+                add(self._as_str(getattr(cf, 'name', '')), getattr(cf, 'value', ''))
+        except Exception:
+            pass
+        return rows
+
+    def _dict_product_row(self, p: dict) -> LazyRow:
+        value = f"Qty: {self._as_str(p.get('quantity'))}" if p.get("quantity") is not None else ""
+        return self._as_str(p.get("name")), value, lambda: self._dict_product_properties(p)
+
+    def _dict_product_properties(self, p: dict) -> list[LazyRow]:
+        rows: list[LazyRow] = []
+
+        def add(key, value):
+            rows.append((key, self._as_str(value), None))
+
+        add("Name", p.get("name"))
+        if p.get("quantity") is not None:
+            add("Quantity", p.get("quantity"))
+        if p.get("description"):
+            add("Description", p.get("description"))
+        # Extended attributes (if present)
+        for key, label in self._DICT_PRODUCT_ATTRS:
+            if p.get(key) is not None and p.get(key) != "":
+                add(label, p.get(key))
+        # Custom fields
+        for cf in (p.get("custom_fields") or []):
+            if isinstance(cf, dict):
+                add(self._as_str(cf.get("name")), cf.get("value"))
+        return rows
+
     def display_project(self, project):
         # Build a hierarchical model
-        model = QStandardItemModel()
+        model = LazyProjectTreeModel()
         model.setHorizontalHeaderLabels(["Item", "Value"])
 
         # Root: Project label
@@ -163,6 +265,7 @@ class ProjectsDetailView(QWidget):
                 except Exception:
                     lid = None
                 by_loc_id.setdefault(lid, []).append(prod)
+            # Only location nodes are built now; products and their properties on expand
             for loc in locations:
                 # Determine location display and id
                 try:
@@ -171,106 +274,12 @@ class ProjectsDetailView(QWidget):
                 except Exception:
                     loc_name = self._as_str(loc)
                     loc_id = None
-                l_item = QStandardItem(self._as_str(loc_name))
-                l_val = QStandardItem("")
-                locs.appendRow([l_item, l_val])
-                # Products under this location
                 prods_here = by_loc_id.get(loc_id, [])
-                if prods_here:
-                    for p in prods_here:
-                        try:
-                            pname = getattr(p, 'name', None) or self._as_str(p)
-                            qty = getattr(p, 'quantity', None)
-                            p_item = QStandardItem(self._as_str(pname))
-                            p_val = QStandardItem(f"Qty: {qty}" if qty is not None else "")
-                        except Exception:
-                            p_item = QStandardItem(self._as_str(p))
-                            p_val = QStandardItem("")
-                        l_item.appendRow([p_item, p_val])
-                        # Add product properties (from ORM columns)
-                        desc = self._as_str(getattr(p, 'description', ''))
-                        if desc:
-                            self._add_kv_child(p_item, "Description", desc)
-                        # Dimensions
-                        try:
-                            if getattr(p, 'width', None) is not None:
-                                self._add_kv_child(p_item, "Width", self._as_str(getattr(p, 'width', None)))
-                            if getattr(p, 'height', None) is not None:
-                                self._add_kv_child(p_item, "Height", self._as_str(getattr(p, 'height', None)))
-                            if getattr(p, 'depth', None) is not None:
-                                self._add_kv_child(p_item, "Depth", self._as_str(getattr(p, 'depth', None)))
-                        except Exception:
-                            pass
-                        # Origins
-                        try:
-                            if getattr(p, 'x_origin_from_right', None) is not None:
-                                self._add_kv_child(p_item, "X Origin", self._as_str(getattr(p, 'x_origin_from_right', None)))
-                            if getattr(p, 'y_origin_from_face', None) is not None:
-                                self._add_kv_child(p_item, "Y Origin", self._as_str(getattr(p, 'y_origin_from_face', None)))
-                            if getattr(p, 'z_origin_from_bottom', None) is not None:
-                                self._add_kv_child(p_item, "Z Origin", self._as_str(getattr(p, 'z_origin_from_bottom', None)))
-                        except Exception:
-                            pass
-                        # Link IDs if present
-                        try:
-                            if getattr(p, 'specification_group_id', None) is not None:
-                                self._add_kv_child(p_item, "LinkIDSpecificationGroup", self._as_str(getattr(p, 'specification_group_id', None)))
-                            if getattr(p, 'wall_id', None) is not None:
-                                self._add_kv_child(p_item, "LinkIDWall", self._as_str(getattr(p, 'wall_id', None)))
-                        except Exception:
-                            pass
-                        # Product-level custom fields (includes ItemNumber/Comment/etc.)
-                        try:
-                            for cf in getattr(p, 'custom_fields', []) or []:
-                                self._add_kv_child(p_item, self._as_str(getattr(cf, 'name', '')), self._as_str(getattr(cf, 'value', '')))
-                        except Exception:
-                            pass
+                model.add_lazy_row(locs, self._as_str(loc_name), "", self._products_loader(prods_here, self._orm_product_row) if prods_here else None)
             # Unassigned products
             unassigned = by_loc_id.get(None, [])
             if unassigned:
-                ua_group = QStandardItem("Unassigned Products")
-                ua_group_val = QStandardItem("")
-                locs.appendRow([ua_group, ua_group_val])
-                for p in unassigned:
-                    pname = self._as_str(getattr(p, 'name', p))
-                    qty = getattr(p, 'quantity', None)
-                    ua_item = QStandardItem(pname)
-                    ua_val = QStandardItem(f"Qty: {qty}" if qty is not None else "")
-                    ua_group.appendRow([ua_item, ua_val])
-                    # Add same properties for unassigned
-                    desc = self._as_str(getattr(p, 'description', ''))
-                    if desc:
-                        self._add_kv_child(ua_item, "Description", desc)
-                    try:
-                        if getattr(p, 'width', None) is not None:
-                            self._add_kv_child(ua_item, "Width", self._as_str(getattr(p, 'width', None)))
-                        if getattr(p, 'height', None) is not None:
-                            self._add_kv_child(ua_item, "Height", self._as_str(getattr(p, 'height', None)))
-                        if getattr(p, 'depth', None) is not None:
-                            self._add_kv_child(ua_item, "Depth", self._as_str(getattr(p, 'depth', None)))
-                    except Exception:
-                        pass
-                    try:
-                        if getattr(p, 'x_origin_from_right', None) is not None:
-                            self._add_kv_child(ua_item, "X Origin", self._as_str(getattr(p, 'x_origin_from_right', None)))
-                        if getattr(p, 'y_origin_from_face', None) is not None:
-                            self._add_kv_child(ua_item, "Y Origin", self._as_str(getattr(p, 'y_origin_from_face', None)))
-                        if getattr(p, 'z_origin_from_bottom', None) is not None:
-                            self._add_kv_child(ua_item, "Z Origin", self._as_str(getattr(p, 'z_origin_from_bottom', None)))
-                    except Exception:
-                        pass
-                    try:
-                        if getattr(p, 'specification_group_id', None) is not None:
-                            self._add_kv_child(ua_item, "LinkIDSpecificationGroup", self._as_str(getattr(p, 'specification_group_id', None)))
-                        if getattr(p, 'wall_id', None) is not None:
-                            self._add_kv_child(ua_item, "LinkIDWall", self._as_str(getattr(p, 'wall_id', None)))
-                    except Exception:
-                        pass
-                    try:
-                        for cf in getattr(p, 'custom_fields', []) or []:
-                            self._add_kv_child(ua_item, self._as_str(getattr(cf, 'name', '')), self._as_str(getattr(cf, 'value', '')))
-                    except Exception:
-                        pass
+                model.add_lazy_row(locs, "Unassigned Products", "", self._products_loader(unassigned, self._orm_product_row))
 
         self.tree_view.setModel(model)
         # Expand the Properties group by default
@@ -290,6 +299,7 @@ class ProjectsDetailView(QWidget):
         and extended attributes per ProductModel (width, height, depth, x_origin, y_origin, z_origin,
         item_number, comment, angle, link_id_specification_group, link_id_location, link_id_wall,
         file_name, picture_name).
+        Products and their properties are only turned into items when their parent node is expanded.
         """
         model = self.tree_view.model()
         if not isinstance(model, QStandardItemModel):
@@ -304,55 +314,36 @@ class ProjectsDetailView(QWidget):
             locs_val = QStandardItem("")
             root.appendRow([locs, locs_val])
         # Clear existing rows under Locations
+        if isinstance(model, LazyProjectTreeModel):
+            model.remove_children(locs)
         while locs.rowCount() > 0:
             locs.removeRow(0)
-        # Group by 'location' field
-        by_loc_name: dict[str | None, list[dict]] = {}
-        for d in (products or []):
-            if not isinstance(d, dict):
-                continue
-            key = d.get("location")
-            by_loc_name.setdefault(key, []).append(d)
+        # Group by 'location' field. A columnar batch (ProductBatch) is grouped on its location
+        # column, and a product's dict is only built when its location is expanded.
+        by_loc_name: dict[str | None, list] = {}
+        row_for = self._dict_product_row
+        if callable(getattr(products, "group_by", None)) and callable(getattr(products, "row", None)):
+            by_loc_name = products.group_by("location")
+            row_for = lambda i: self._dict_product_row(products.row(i))
+        else:
+            for d in (products or []):
+                if not isinstance(d, dict):
+                    continue
+                key = d.get("location")
+                by_loc_name.setdefault(key, []).append(d)
         # Build location nodes (sorted by name, None last)
         def sort_key(k):
             return ("~" if k is None else str(k).lower())
+        lazy = isinstance(model, LazyProjectTreeModel)
         for loc_name in sorted(by_loc_name.keys(), key=sort_key):
-            l_item = QStandardItem(self._as_str(loc_name) if loc_name is not None else "Unassigned")
-            l_val = QStandardItem("")
-            locs.appendRow([l_item, l_val])
-            for p in by_loc_name[loc_name]:
-                p_item = QStandardItem(self._as_str(p.get("name")))
-                p_val = QStandardItem(f"Qty: {self._as_str(p.get('quantity'))}" if p.get("quantity") is not None else "")
-                l_item.appendRow([p_item, p_val])
-                # Add product properties as children
-                self._add_kv_child(p_item, "Name", self._as_str(p.get("name")))
-                if p.get("quantity") is not None:
-                    self._add_kv_child(p_item, "Quantity", self._as_str(p.get("quantity")))
-                if p.get("description"):
-                    self._add_kv_child(p_item, "Description", self._as_str(p.get("description")))
-                # Extended attributes (if present)
-                for key, label in (
-                    ("width", "Width"),
-                    ("height", "Height"),
-                    ("depth", "Depth"),
-                    ("x_origin", "X Origin"),
-                    ("y_origin", "Y Origin"),
-                    ("z_origin", "Z Origin"),
-                    ("item_number", "Item Number"),
-                    ("comment", "Comment"),
-                    ("angle", "Angle"),
-                    ("link_id_specification_group", "LinkIDSpecificationGroup"),
-                    ("link_id_location", "LinkIDLocation"),
-                    ("link_id_wall", "LinkIDWall"),
-                    ("file_name", "File Name"),
-                    ("picture_name", "Picture Name"),
-                ):
-                    if p.get(key) is not None and p.get(key) != "":
-                        self._add_kv_child(p_item, label, self._as_str(p.get(key)))
-                # Custom fields
-                for cf in (p.get("custom_fields") or []):
-                    if isinstance(cf, dict):
-                        self._add_kv_child(p_item, self._as_str(cf.get("name")), self._as_str(cf.get("value")))
+            label = self._as_str(loc_name) if loc_name is not None else "Unassigned"
+            loader = self._products_loader(by_loc_name[loc_name], row_for)
+            if lazy:
+                model.add_lazy_row(locs, label, "", loader)
+            else:
+                l_item = QStandardItem(label)
+                locs.appendRow([l_item, QStandardItem("")])
+                self._append_rows_eagerly(l_item, loader())
         # Optionally expand Locations
         try:
             root_index = model.index(0, 0)
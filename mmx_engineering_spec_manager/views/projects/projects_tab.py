@@ -1,9 +1,12 @@
 import os
-from PySide6.QtCore import Signal
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtCore import QTimer, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, QPlainTextEdit, QHeaderView, QLineEdit, QProgressDialog, QMessageBox
 
 from .projects_detail_view import ProjectsDetailView
+from .projects_table_model import ProjectsTableModel
+
+# Typing pauses this long (ms) before the projects list is filtered
+SEARCH_DEBOUNCE_MS = 150
 
 
 class ProjectsTab(QWidget):
@@ -14,12 +17,20 @@ class ProjectsTab(QWidget):
         super().__init__(parent)
         self.projects = []
         self.current_project = None
-        self._row_to_project_index = []  # maps visible row -> original self.projects index
         self._vm = None
         self._progress_dialog = None
 
         # UI Elements
         self.projects_table = QTableView()
+        # One model for the tab's lifetime; display/filter only swap its rows
+        self.projects_model = ProjectsTableModel(self)
+        self.projects_table.setModel(self.projects_model)
+        header = self.projects_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
         self.import_button = QPushButton("Import from Innergy")
         self.load_button = QPushButton("Load Project")
         self.select_another_button = QPushButton("Select Another Project")
@@ -60,45 +71,32 @@ class ProjectsTab(QWidget):
         self.load_button.clicked.connect(self.on_load_button_clicked)
         self.search_input.textChanged.connect(self._on_search_text_changed)
         self.select_another_button.clicked.connect(self.show_projects_list)
+        self._search_timer.timeout.connect(self._apply_filter_and_refresh)
 
     def display_projects(self, projects):
         self.projects = projects
+        self.projects_model.set_projects(projects)
         self._apply_filter_and_refresh()
 
-    def _build_model_for_projects(self, subset):
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(["Number", "Name", "Job Description"])
-        for project in subset:
-            row = [
-                QStandardItem(getattr(project, "number", "")),
-                QStandardItem(getattr(project, "name", "")),
-                QStandardItem(getattr(project, "job_description", "")),
-            ]
-            model.appendRow(row)
-        self.projects_table.setModel(model)
-        header = self.projects_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        header.setStretchLastSection(True)
-
     def _apply_filter_and_refresh(self):
-        # Compute filtered subset and mapping by number and name only
+        self._search_timer.stop()
+        # Filter by number and name only
         try:
-            query = (self.search_input.text() if self.search_input else "").strip().lower()
+            query = self.search_input.text() if self.search_input else ""
         except Exception:
             query = ""
-        row_map = []
-        subset = []
-        for idx, p in enumerate(self.projects):
-            num = (getattr(p, "number", "") or "")
-            name = (getattr(p, "name", "") or "")
-            if not query or (query in str(num).lower() or query in str(name).lower()):
-                subset.append(p)
-                row_map.append(idx)
-        self._row_to_project_index = row_map
-        self._build_model_for_projects(subset)
+        self.projects_model.set_filter(query)
 
     def _on_search_text_changed(self, _text):
-        self._apply_filter_and_refresh()
+        # Restart the debounce window; the filter runs once typing pauses
+        self._search_timer.start()
+
+    def _project_for_row(self, row):
+        # Map visible row to original project index if filtered
+        orig_idx = self.projects_model.source_row(row)
+        if orig_idx is not None and 0 <= orig_idx < len(self.projects):
+            return self.projects[orig_idx]
+        return None
 
     def display_log_text(self, text: str):
         try:
@@ -111,14 +109,8 @@ class ProjectsTab(QWidget):
             pass
 
     def on_project_double_clicked(self, index):
-        row = index.row()
-        # Map visible row to original project index if filtered
-        if 0 <= row < len(self._row_to_project_index):
-            orig_idx = self._row_to_project_index[row]
-        else:
-            orig_idx = row
-        if 0 <= orig_idx < len(self.projects):
-            project = self.projects[orig_idx]
+        project = self._project_for_row(index.row())
+        if project is not None:
             self.open_project_signal.emit(project)
 
     def on_load_button_clicked(self):
@@ -136,13 +128,8 @@ class ProjectsTab(QWidget):
                 target_row = idxs[0].row()
         if target_row is None:
             return
-        # Map visible row to original project index
-        if 0 <= target_row < len(self._row_to_project_index):
-            orig_idx = self._row_to_project_index[target_row]
-        else:
-            orig_idx = target_row
-        if 0 <= orig_idx < len(self.projects):
-            project = self.projects[orig_idx]
+        project = self._project_for_row(target_row)
+        if project is not None:
             self.open_project_signal.emit(project)
 
     def display_project_details(self, project):
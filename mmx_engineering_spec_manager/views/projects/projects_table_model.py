@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+
+class ProjectsTableModel(QAbstractTableModel):
+    """Read-only table over the projects list, stored column-wise.
+
+    Number / Name / Job Description are kept as three tuples aligned with the source list,
+    plus a lowercase "number<NUL>name" key per project for searching. Filtering only swaps
+    the list of visible source rows; no per-cell items are created, and a query that
+    extends the previous one only re-checks the rows that are currently visible.
+    """
+
+    HEADERS = ("Number", "Name", "Job Description")
+    _ATTRS = ("number", "name", "job_description")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._projects: Tuple[Any, ...] = ()
+        self._columns: Tuple[Tuple[str, ...], ...] = ((), (), ())
+        self._search_keys: Tuple[str, ...] = ()
+        self._visible: List[int] = []
+        self._query = ""
+
+    # ---- Data ----
+    def set_projects(self, projects: Sequence[Any]) -> None:
+        self.beginResetModel()
+        self._projects = tuple(projects or ())
+        self._columns = tuple(
+            tuple(str(getattr(p, attr, "") or "") for p in self._projects) for attr in self._ATTRS
+        )
+        numbers, names, _ = self._columns
+        self._search_keys = tuple(f"{n}\0{m}".lower() for n, m in zip(numbers, names))
+        self._visible = self._matching(self._query, range(len(self._projects)))
+        self.endResetModel()
+
+    def set_filter(self, text: str) -> None:
+        """Show only projects whose number or name contains text (case-insensitive)."""
+        query = (text or "").strip().lower()
+        if query == self._query:
+            return
+        # Narrowing a query can only drop rows, so only the visible ones need checking
+        candidates = self._visible if self._query and query.startswith(self._query) else range(len(self._projects))
+        visible = self._matching(query, candidates)
+        self._query = query
+        if visible == self._visible:
+            return
+        self.beginResetModel()
+        self._visible = visible
+        self.endResetModel()
+
+    def _matching(self, query: str, candidates) -> List[int]:
+        if not query:
+            return list(candidates)
+        keys = self._search_keys
+        return [i for i in candidates if query in keys[i]]
+
+    def filter_text(self) -> str:
+        return self._query
+
+    def source_row(self, row: int) -> Optional[int]:
+        """Index into the projects list for a visible row, or None if out of range."""
+        if 0 <= row < len(self._visible):
+            return self._visible[row]
+        return None
+
+    def project_at(self, row: int) -> Any:
+        src = self.source_row(row)
+        return self._projects[src] if src is not None else None
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        src = self.source_row(index.row())
+        if src is None or not 0 <= index.column() < len(self._columns):
+            return None
+        return self._columns[index.column()][src]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
@@ -8,6 +8,7 @@ from PySide6.QtWidgets import QGraphicsItem, QGraphicsRectItem, QGraphicsScene,
 from mmx_engineering_spec_manager.utilities.geometry import (
     x_left_to_xorigin_from_right,
 )
+from mmx_engineering_spec_manager.utilities.spatial_index import Rect, RectIndex
 
 
 class _DraggableElevationRect(QGraphicsRectItem):
@@ -26,7 +27,8 @@ class ElevationViewWidget(QGraphicsView):
     """
     Simple 2D elevation view. Draws a wall as a rectangle (width=wall length, height=wall height)
     and products as draggable rectangles. Emits productMoved(product_id, x_origin_from_right, z_origin_from_bottom)
-    when a product item is released after moving.
+    when a product item is released after moving; items that did not move are not emitted.
+    Product rects are kept in a RectIndex for overlap queries and edge snapping.
     """
 
     productMoved = Signal(int, float, float)  # product_id, XOrigin, ZOrigin
@@ -41,10 +43,14 @@ class ElevationViewWidget(QGraphicsView):
         self._wall_length: float = 120.0
         self._wall_height: float = 96.0
         self._product_items: dict[int, _DraggableElevationRect] = {}
+        self._index = RectIndex()
+        # A single dragged product snaps to a neighbour's edge within this distance (0 disables)
+        self.snap_tolerance: float = 1.0
 
     def set_wall(self, length_in: float = 120.0, height_in: float = 96.0, thickness_in: float = 4.0):
         self._scene.clear()
         self._product_items.clear()
+        self._index.clear()
         self._wall_length = max(1.0, float(length_in))
         self._wall_height = max(1.0, float(height_in))
         wall_rect = QRectF(0, 0, self._wall_length, self._wall_height)
@@ -69,18 +75,38 @@ class ElevationViewWidget(QGraphicsView):
         item.setPos(x_left, y_top)
         self._scene.addItem(item)
         self._product_items[product_id] = item
+        self._index.insert(product_id, self._scene_rect(item))
+
+    @staticmethod
+    def _scene_rect(item: QGraphicsRectItem) -> Rect:
+        pos = item.pos()
+        r = item.rect()
+        return Rect(float(pos.x()), float(pos.y()), float(r.width()), float(r.height()))
 
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
-        # Emit moved positions for selected items
-        for pid, item in self._product_items.items():
-            if item.isSelected():
-                pos = item.pos()
-                # XOrigin is distance from right to product rightmost x
-                x_origin = x_left_to_xorigin_from_right(self._wall_length, item.rect().width(), float(pos.x()))
-                # ZOrigin is distance from bottom to product bottom: bottom = y_top + height
-                z_origin = self._wall_height - (pos.y() + item.rect().height())
-                self.productMoved.emit(pid, float(x_origin), float(z_origin))
+        selected = [i for i in self._scene.selectedItems() if isinstance(i, _DraggableElevationRect)]
+        for item in selected:
+            pid = item.product_id
+            rect = self._scene_rect(item)
+            if len(selected) == 1 and self.snap_tolerance > 0 and self._index.changed(pid, rect):
+                x = self._index.snap_x(pid, rect, self.snap_tolerance)
+                if x != rect.x:
+                    item.setX(x)
+                    rect = self._scene_rect(item)
+            # Only products whose position actually changed since the last commit
+            if not self._index.changed(pid, rect):
+                continue
+            self._index.update(pid, rect)
+            # XOrigin is distance from right to product rightmost x
+            x_origin = x_left_to_xorigin_from_right(self._wall_length, rect.w, rect.x)
+            # ZOrigin is distance from bottom to product bottom: bottom = y_top + height
+            z_origin = self._wall_height - rect.bottom
+            self.productMoved.emit(pid, float(x_origin), float(z_origin))
+
+    def overlapping_products(self, product_id: int) -> list[int]:
+        """Ids of products whose face overlaps product_id's."""
+        return list(self._index.overlapping(product_id))
 
     def wall_length(self) -> float:
         return self._wall_length
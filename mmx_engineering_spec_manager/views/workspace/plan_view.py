@@ -5,6 +5,8 @@ from PySide6.QtCore import Qt, QRectF, QSizeF, Signal, QObject
 from PySide6.QtGui import QBrush, QColor, QPen, QPainter
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsRectItem, QGraphicsScene, QGraphicsView
 
+from mmx_engineering_spec_manager.utilities.spatial_index import Rect, RectIndex
+
 
 class _DraggableProductRect(QGraphicsRectItem):
     def __init__(self, product_id: int, rect: QRectF, color: QColor):
@@ -22,7 +24,8 @@ class PlanViewWidget(QGraphicsView):
     """
     Simple 2D plan view (top-down). Draws a wall as a horizontal rectangle and
     products as draggable rectangles in front of the wall. Emits productMoved when
-    a product item is released after moving.
+    a product item is released after moving; items that did not move are not emitted.
+    Product rects are kept in a RectIndex for overlap queries and edge snapping.
     """
 
     productMoved = Signal(int, float, float)  # product_id, scene_x_left, scene_y
@@ -36,10 +39,14 @@ class PlanViewWidget(QGraphicsView):
         self._wall_item: Optional[QGraphicsRectItem] = None
         self._product_items: dict[int, _DraggableProductRect] = {}
         self._wall_length: float = 120.0  # default inches; can be set via set_wall
+        self._index = RectIndex()
+        # A single dragged product snaps to a neighbour's edge within this distance (0 disables)
+        self.snap_tolerance: float = 1.0
 
     def set_wall(self, length_in: float = 120.0, thickness_in: float = 4.0):
         self._scene.clear()
         self._product_items.clear()
+        self._index.clear()
         self._wall_length = max(1.0, float(length_in))
         wall_rect = QRectF(0, 0, self._wall_length, thickness_in)
         wall = QGraphicsRectItem(wall_rect)
@@ -63,17 +70,39 @@ class PlanViewWidget(QGraphicsView):
         # Install event filter via subclassing: override itemChange not available on QGraphicsRectItem in PySide6 easily; use scene mouseRelease
         self._scene.addItem(item)
         self._product_items[product_id] = item
+        self._index.insert(product_id, self._scene_rect(item))
+
+    @staticmethod
+    def _scene_rect(item: QGraphicsRectItem) -> Rect:
+        pos = item.pos()
+        r = item.rect()
+        return Rect(float(pos.x()), float(pos.y()), float(r.width()), float(r.height()))
 
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
-        # Emit moved positions for all selected items (or last moved)
-        for pid, item in self._product_items.items():
-            if item.isSelected():
-                pos = item.pos()
-                # y_from_face = pos.y() - wall_thickness
-                wall_thickness = self._wall_item.rect().height() if self._wall_item else 0.0
-                y_from_face = pos.y() - wall_thickness
-                self.productMoved.emit(pid, float(pos.x()), float(y_from_face))
+        selected = [i for i in self._scene.selectedItems() if isinstance(i, _DraggableProductRect)]
+        wall_thickness = self._wall_item.rect().height() if self._wall_item else 0.0
+        for item in selected:
+            pid = item.product_id
+            rect = self._scene_rect(item)
+            if len(selected) == 1 and self.snap_tolerance > 0 and self._index.changed(pid, rect):
+                x = self._index.snap_x(pid, rect, self.snap_tolerance)
+                if x != rect.x:
+                    item.setX(x)
+                    rect = self._scene_rect(item)
+            # Only products whose position actually changed since the last commit
+            if not self._index.changed(pid, rect):
+                continue
+            self._index.update(pid, rect)
+            self.productMoved.emit(pid, rect.x, rect.y - wall_thickness)
+
+    def overlapping_products(self, product_id: int) -> list[int]:
+        """Ids of products whose footprint overlaps product_id's."""
+        return list(self._index.overlapping(product_id))
 
     def wall_length(self) -> float:
         return self._wall_length
+
+    def product_width(self, product_id: int) -> Optional[float]:
+        item = self._product_items.get(product_id)
+        return float(item.rect().width()) if item is not None else None
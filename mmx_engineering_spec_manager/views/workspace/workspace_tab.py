@@ -1,7 +1,9 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QLabel, QPushButton, QHBoxLayout
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QLabel, QPushButton, QHBoxLayout, QTreeView
 
 from .plan_view import PlanViewWidget
 from .elevation_view import ElevationViewWidget
+from .workspace_tree_model import WorkspaceTreeModel
+from mmx_engineering_spec_manager.utilities.geometry import x_left_to_xorigin_from_right
 
 
 class WorkspaceTab(QWidget):
@@ -43,6 +45,12 @@ class WorkspaceTab(QWidget):
             pass
         header_row.addWidget(self.btn_save)
         self.project_tab.layout().addLayout(header_row)
+        # Project tree; walls and products are fetched per branch as it is expanded
+        self.tree_view = QTreeView()
+        self.tree_view.setHeaderHidden(True)
+        self.tree_view.setUniformRowHeights(True)
+        self.project_tab.layout().addWidget(self.tree_view)
+        self.tree_model = None
 
         # Plan view (Locations)
         self.location_tab.setLayout(QVBoxLayout())
@@ -103,7 +111,8 @@ class WorkspaceTab(QWidget):
     def _render_tree(self, tree: dict) -> None:
         """Render Workspace UI from a VM-provided tree dict.
 
-        Currently updates the Project label from tree['label'] when present. More bindings can be added later.
+        Updates the Project label from tree['label'] and shows the tree; branches below the
+        locations are pulled from the VM's load_children through Qt's fetchMore.
         """
         try:
             label = None
@@ -113,6 +122,13 @@ class WorkspaceTab(QWidget):
                 self.project_label.setText(f"Project Loaded: {label}")
         except Exception:
             pass
+        try:
+            fetch = getattr(self._vm, "load_children", None) if self._vm is not None else None
+            self.tree_model = WorkspaceTreeModel(tree if isinstance(tree, dict) else {}, fetch, self.tree_view)
+            self.tree_view.setModel(self.tree_model)
+            self.tree_view.expand(self.tree_model.index(0, 0))
+        except Exception:
+            pass
 
     def display_project_data(self, project):
         """
@@ -150,17 +166,36 @@ class WorkspaceTab(QWidget):
 
     # ---- Dirty tracking and save wiring ----
     def _on_plan_product_moved(self, product_id: int, x_left: float, y_from_face: float):  # pragma: no cover - thin UI glue
+        # Plan view reports the scene left edge; the DB stores XOrigin from the wall's right end
+        x_origin = None
+        try:
+            width = self.plan_view.product_width(int(product_id))
+            if width is not None:
+                x_origin = x_left_to_xorigin_from_right(self.plan_view.wall_length(), width, float(x_left))
+        except Exception:
+            x_origin = None
+        if self._vm is not None and hasattr(self._vm, "record_product_move"):
+            self._vm.record_product_move(int(product_id), x_origin_from_right=x_origin, y_origin_from_face=float(y_from_face))
+            return
         try:
             self._pending_changes.setdefault("plan_moves", []).append({
                 "product_id": int(product_id),
                 "x_left": float(x_left),
-                "y_from_face": float(y_from_face),
+                "x_origin_from_right": x_origin,
+                "y_origin_from_face": float(y_from_face),
             })
         except Exception:
             pass
         self._mark_dirty()
 
     def _on_elevation_product_moved(self, product_id: int, x_origin_from_right: float, z_origin_from_bottom: float):  # pragma: no cover - thin UI glue
+        if self._vm is not None and hasattr(self._vm, "record_product_move"):
+            self._vm.record_product_move(
+                int(product_id),
+                x_origin_from_right=float(x_origin_from_right),
+                z_origin_from_bottom=float(z_origin_from_bottom),
+            )
+            return
         try:
             self._pending_changes.setdefault("elevation_moves", []).append({
                 "product_id": int(product_id),
@@ -182,7 +217,8 @@ class WorkspaceTab(QWidget):
         try:
             if self._vm is None or not hasattr(self._vm, "save_changes"):
                 return
-            ok = self._vm.save_changes(self._pending_changes or {})
+            # Journaled moves live in the VM; only legacy pending lists are passed explicitly
+            ok = self._vm.save_changes(self._pending_changes or None)
             if ok:
                 # Clear pending changes and mark clean
                 self._pending_changes = {}
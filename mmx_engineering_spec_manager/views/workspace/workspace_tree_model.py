@@ -0,0 +1,113 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+
+
+class _TreeItem:
+    __slots__ = ("node", "parent", "children", "row", "fetched")
+
+    def __init__(self, node: Dict[str, Any], parent: Optional["_TreeItem"], row: int):
+        self.node = node
+        self.parent = parent
+        self.row = row
+        self.children: List[_TreeItem] = []
+        # Nodes that arrive with their children (or have none) need no fetch
+        self.fetched = bool(node.get("children")) or not node.get("child_count")
+        for i, child in enumerate(node.get("children") or []):
+            self.children.append(_TreeItem(child, self, i))
+
+
+class WorkspaceTreeModel(QAbstractItemModel):
+    """Read-only tree over the workspace dict tree, filled lazily.
+
+    Only the nodes present in the initial tree are built. A node whose child_count is
+    non-zero but whose children were not sent reports canFetchMore(); fetchMore() asks
+    fetch_children(node_key) for that single branch. QTreeView calls these as branches
+    are expanded, so a large job never materializes walls/products nobody looks at.
+    """
+
+    def __init__(self, tree: Dict[str, Any], fetch_children: Optional[Callable[[str], List[Dict[str, Any]]]] = None, parent=None):
+        super().__init__(parent)
+        self._root = _TreeItem({"children": [tree] if tree else []}, None, 0)
+        self._fetch_children = fetch_children
+
+    # ---- Helpers ----
+    def _item(self, index: QModelIndex | QPersistentModelIndex) -> _TreeItem:
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    @staticmethod
+    def node_key(node: Dict[str, Any]) -> str:
+        return node.get("key") or f"{node.get('type')}:{node.get('id')}"
+
+    def node(self, index: QModelIndex) -> Optional[Dict[str, Any]]:
+        return self._item(index).node if index.isValid() else None
+
+    # ---- QAbstractItemModel ----
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        item = self._item(parent)
+        if column != 0 or row < 0 or row >= len(item.children):
+            return QModelIndex()
+        return self.createIndex(row, column, item.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._item(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer().node
+        if role == Qt.DisplayRole:
+            return str(node.get("label", ""))
+        if role == Qt.UserRole:
+            return self.node_key(node)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Workspace"
+        return None
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        item = self._item(parent)
+        return bool(item.children) or (not item.fetched and bool(item.node.get("child_count")))
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or self._fetch_children is None:
+            return False
+        return not self._item(parent).fetched
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+        item = self._item(parent)
+        # Mark first so a failing fetch is not retried on every repaint
+        item.fetched = True
+        try:
+            children = list(self._fetch_children(self.node_key(item.node)) or [])
+        except Exception:
+            children = []
+        if not children:
+            # Let the view drop the expand indicator
+            self.dataChanged.emit(parent, parent)
+            return
+        start = len(item.children)
+        self.beginInsertRows(parent, start, start + len(children) - 1)
+        for i, child in enumerate(children):
+            item.children.append(_TreeItem(child, item, start + i))
+        self.endInsertRows()
@@ -27,3 +27,46 @@ def db_session():
             engine.dispose()
         except Exception:
             pass
+
+
+@pytest.fixture
+def project_db(monkeypatch, tmp_path):
+    """Factory for a DataManager backed by per-project SQLite files under tmp_path.
+
+    project_db(number) points every project at tmp_path/<number>.db and prepares project
+    id 1 there (prepare=False skips that); returns (dm, db_path). project_db() gives each
+    project its own tmp_path/<number>.db instead (by="id": tmp_path/P<id>.db, for callers
+    that only pass ids) and returns (dm, None). The global DB is in memory unless global_db
+    names a file under tmp_path. Engines are disposed on teardown.
+    """
+    from types import SimpleNamespace
+
+    from mmx_engineering_spec_manager.data_manager import manager as manager_mod
+    from mmx_engineering_spec_manager.data_manager.manager import DataManager
+    from mmx_engineering_spec_manager.utilities.persistence import get_sqlite_engine_registry
+
+    opened = set()
+
+    def _path_for(number):
+        path = str(tmp_path / f"{number}.db")
+        opened.add(path)
+        return path
+
+    def _make(number=None, name="Project", job_description="", prepare=True, global_db=None, by="number"):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / global_db}" if global_db else "sqlite:///:memory:")
+        if number is None:
+            if by == "id":
+                monkeypatch.setattr(manager_mod, "project_sqlite_db_path", lambda project: _path_for(f"P{project.id}"))
+            else:
+                monkeypatch.setattr(manager_mod, "project_sqlite_db_path", lambda project: _path_for(project.number))
+            return DataManager(), None
+        db_path = _path_for(number)
+        monkeypatch.setattr(manager_mod, "project_sqlite_db_path", lambda project: db_path)
+        dm = DataManager()
+        if prepare:
+            dm.prepare_project_db(SimpleNamespace(id=1, number=number, name=name, job_description=job_description))
+        return dm, db_path
+
+    yield _make
+    for path in opened:
+        get_sqlite_engine_registry().dispose(path)
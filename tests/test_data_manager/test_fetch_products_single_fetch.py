@@ -0,0 +1,45 @@
+import types
+from unittest.mock import Mock
+
+import requests
+
+from mmx_engineering_spec_manager.data_manager.manager import DataManager
+
+
+def _settings():
+    return types.SimpleNamespace(innergy_api_key="KEY", innergy_base_url="https://app.innergy.com")
+
+
+def test_fetch_products_downloads_budget_products_once(monkeypatch, mocker):
+    monkeypatch.setattr('mmx_engineering_spec_manager.data_manager.manager.get_settings', _settings)
+    monkeypatch.setattr('mmx_engineering_spec_manager.importers.innergy.get_settings', _settings)
+    payload = {
+        "Items": [
+            {
+                "Name": "Base", "QuantCount": 2, "Description": "D",
+                "CustomFields": [{"Name": "Finish", "Type": 0, "Value": "PL1"}],
+                "Location": {"Name": "Kitchen"}, "Width": 24, "ItemNumber": "1",
+            },
+            {"Name": "Upper", "QuantCount": 1, "Location": "Pantry"},
+        ]
+    }
+    resp = Mock(status_code=200)
+    resp.json.return_value = payload
+    get = mocker.patch.object(requests.Session, 'get', return_value=resp)
+
+    out = DataManager().fetch_products_from_innergy("123")
+
+    assert get.call_count == 1
+    assert get.call_args.args[0] == "https://app.innergy.com/api/projects/123/budgetProducts"
+    assert [p["name"] for p in out] == ["Base", "Upper"]
+    assert out[0]["quantity"] == 2
+    assert out[0]["custom_fields"] == [{"name": "Finish", "value": "PL1"}]
+    assert out[0]["location"] == "Kitchen" and out[0]["width"] == 24 and out[0]["item_number"] == "1"
+    assert out[1]["location"] == "Pantry" and out[1]["width"] is None
+
+
+def test_fetch_products_non_200_returns_empty(monkeypatch, mocker):
+    monkeypatch.setattr('mmx_engineering_spec_manager.data_manager.manager.get_settings', _settings)
+    monkeypatch.setattr('mmx_engineering_spec_manager.importers.innergy.get_settings', _settings)
+    mocker.patch.object(requests.Session, 'get', return_value=Mock(status_code=404))
+    assert DataManager().fetch_products_from_innergy("123") == []
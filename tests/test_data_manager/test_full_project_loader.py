@@ -0,0 +1,115 @@
+
+import pytest
+from sqlalchemy import event
+
+from mmx_engineering_spec_manager.db_models.custom_field import CustomField
+from mmx_engineering_spec_manager.db_models.global_prompts import GlobalPrompts
+from mmx_engineering_spec_manager.db_models.location import Location
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.prompt import Prompt
+from mmx_engineering_spec_manager.db_models.specification_group import SpecificationGroup
+from mmx_engineering_spec_manager.db_models.wall import Wall
+from mmx_engineering_spec_manager.db_models.wizard_prompts import WizardPrompts
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+def _seed(db_path, n_products):
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        groups = [SpecificationGroup(name=f"SG{i}") for i in range(3)]
+        locs = [Location(name=f"Room {i}", project_id=1) for i in range(4)]
+        s.add_all(groups + locs)
+        s.flush()
+        walls = [Wall(link_id=f"W{i}", project_id=1, location_id=locs[i % 4].id) for i in range(8)]
+        s.add_all(walls)
+        s.flush()
+        for i in range(n_products):
+            p = Product(
+                name=f"P{i}", quantity=1, project_id=1,
+                location_id=locs[i % 4].id, wall_id=walls[i % 8].id,
+                specification_group_id=groups[i % 3].id,
+            )
+            p.custom_fields = [CustomField(name="Finish", value="PL1")]
+            p.prompts = [Prompt(name="Width", value="24")]
+            s.add(p)
+        s.add(CustomField(name="Region", value="West", project_id=1))
+        s.add(GlobalPrompts(name="Globals", project_id=1, specification_group_id=groups[0].id, prompts=[Prompt(name="G", value="1")]))
+        s.add(WizardPrompts(name="Wizard", project_id=1, specification_group_id=groups[1].id, prompts=[Prompt(name="Z", value="2")]))
+        s.commit()
+    finally:
+        s.close()
+
+
+@pytest.fixture
+def make_project(project_db):
+    def _make(n_products):
+        dm, db_path = project_db(f"GRAPH{n_products}", name="Graph")
+        _seed(db_path, n_products)
+        return dm, db_path
+
+    return _make
+
+
+def _capture_selects(db_path, fn):
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+    return result, statements
+
+
+def _walk(project):
+    """Touch everything the views and exporters read from a loaded project."""
+    seen = 0
+    for loc in project.locations:
+        seen += len(loc.walls)
+    for p in project.products:
+        seen += len(p.custom_fields) + len(p.prompts)
+        assert p.location is not None and p.wall is not None
+        assert p.specification_group is not None
+    seen += len(project.walls) + len(project.custom_fields) + len(project.specification_groups)
+    seen += sum(len(g.prompts) for g in project.global_prompts)
+    seen += sum(len(w.prompts) for w in project.wizard_prompts)
+    seen += sum(1 for g in list(project.global_prompts) + list(project.wizard_prompts) if g.specification_group is not None)
+    return seen
+
+
+def test_full_project_loads_in_fixed_number_of_queries(make_project):
+    counts = {}
+    for n in (5, 60):
+        dm, db_path = make_project(n)
+        project, statements = _capture_selects(db_path, lambda: dm.get_full_project_from_project_db(1))
+        counts[n] = len(statements)
+        assert project is not None
+        assert len(project.products) == n
+        # Everything is populated before detaching: walking the graph must not hit the DB
+        _, extra = _capture_selects(db_path, lambda: _walk(project))
+        assert extra == []
+        assert [sg.name for sg in project.specification_groups] == ["SG0", "SG1", "SG2"]
+        assert [p.value for g in project.global_prompts for p in g.prompts] == ["1"]
+    # prepare_project_db's row lookup, the project itself, then one query per eager-loaded
+    # relationship in _full_project_load_options (16), regardless of product count
+    assert counts[5] == counts[60] == 18
+
+
+def test_full_project_queries_are_index_lookups(make_project):
+    dm, db_path = make_project(10)
+    _, statements = _capture_selects(db_path, lambda: dm.get_full_project_from_project_db(1))
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    with engine.connect() as conn:
+        plans = [
+            str(row[-1])
+            for sql, params in statements
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+        ]
+    assert plans
+    assert [p for p in plans if p.startswith("SCAN")] == []
@@ -0,0 +1,110 @@
+import threading
+import types
+
+import pytest
+
+from mmx_engineering_spec_manager.data_manager import manager as manager_mod
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def dm(project_db, monkeypatch):
+    monkeypatch.setattr(manager_mod, "get_settings", lambda: types.SimpleNamespace(innergy_api_key="KEY"))
+    dm, _ = project_db()
+    return dm
+
+
+def test_ingest_many_fetches_concurrently_and_writes_each_project(dm, monkeypatch, tmp_path):
+    numbers = ["J-1", "J-2", "J-3"]
+    # Every download waits until all six are in flight: only passes if fetches overlap
+    barrier = threading.Barrier(6, timeout=5)
+
+    def details(self, n):
+        barrier.wait()
+        return None if n == "J-3" else {"Number": n, "Name": f"Job {n}"}
+
+    def products(self, n):
+        barrier.wait()
+        return [{"Name": f"{n} cab {i}", "QuantCount": 1, "CustomFields": [{"Name": "F", "Value": "x"}]} for i in range(2)]
+
+    monkeypatch.setattr(InnergyImporter, "get_job_details", details)
+    monkeypatch.setattr(InnergyImporter, "get_products", products)
+    progress, jobs = [], []
+
+    res = dm.ingest_many(numbers + ["J-1"], max_workers=6, progress=progress.append, on_job_done=lambda n, ok: jobs.append((n, ok)))
+
+    assert res == {"J-1": True, "J-2": True, "J-3": False}
+    assert sorted(progress) == [33, 66, 100]
+    assert sorted(jobs) == [("J-1", True), ("J-2", True), ("J-3", False)]
+    for n in ("J-1", "J-2"):
+        _, Session = get_engine_and_sessionmaker_for_sqlite_path(str(tmp_path / f"{n}.db"))
+        with Session() as s:
+            names = sorted(name for (name,) in s.query(Product.name))
+        assert names == [f"{n} cab 0", f"{n} cab 1"]
+
+
+def test_ingest_many_without_api_key_skips_network(dm, monkeypatch):
+    monkeypatch.setattr(manager_mod, "get_settings", lambda: types.SimpleNamespace(innergy_api_key=None))
+    monkeypatch.setattr(InnergyImporter, "get_job_details", lambda self, n: pytest.fail("network"))
+    assert dm.ingest_many(["A", "B"]) == {"A": False, "B": False}
+
+
+def test_ingest_many_reports_finished_jobs_while_downloads_run(dm, monkeypatch):
+    # SLOW's download only finishes once FAST has been reported done
+    fast_done = threading.Event()
+    waited = []
+
+    def details(self, n):
+        if n == "SLOW":
+            waited.append(fast_done.wait(timeout=5))
+        return {"Number": n, "Name": n}
+
+    monkeypatch.setattr(InnergyImporter, "get_job_details", details)
+    monkeypatch.setattr(InnergyImporter, "get_products", lambda self, n: [])
+    progress = []
+
+    def on_job_done(n, ok):
+        if n == "FAST":
+            progress.append(("FAST", ok))
+            fast_done.set()
+
+    res = dm.ingest_many(["FAST", "SLOW"], max_workers=2, progress=progress.append, on_job_done=on_job_done)
+
+    assert res == {"FAST": True, "SLOW": True}
+    assert waited == [True]
+    assert progress[:2] == [50, ("FAST", True)]
+
+
+def test_ingest_persists_the_full_product_batch(dm, monkeypatch, tmp_path):
+    from mmx_engineering_spec_manager.db_models.custom_field import CustomField
+
+    monkeypatch.setattr(InnergyImporter, "get_job_details", lambda self, n: {"Number": n, "Name": n})
+    monkeypatch.setattr(InnergyImporter, "get_products", lambda self, n: [
+        {"Name": "Base", "QuantCount": 2, "Location": {"Name": "Kitchen"}, "Width": 24, "XOrigin": 10.5, "ItemNumber": "1.01"},
+    ])
+
+    assert dm.ingest_project_details_to_project_db("J-9")
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(str(tmp_path / "J-9.db"))
+    with Session() as s:
+        p = s.query(Product).one()
+        assert (p.quantity, p.width, p.x_origin_from_right, p.location.name) == (2, 24.0, 10.5, "Kitchen")
+        assert [(cf.name, cf.value) for cf in s.query(CustomField).filter_by(product_id=p.id)] == [("ItemNumber", "1.01")]
+
+
+def test_ingest_many_fetches_through_an_injected_importer(dm, monkeypatch, tmp_path):
+    # An injected ProjectImporter replaces the Innergy client, so no API key is needed
+    monkeypatch.setattr(manager_mod, "get_settings", lambda: types.SimpleNamespace(innergy_api_key=None))
+
+    class _Importer:
+        def fetch_project(self, n):
+            return {"Number": n, "Name": n}
+
+        def fetch_products(self, n):
+            return [{"Name": f"{n} cab", "QuantCount": 1}]
+
+    assert dm.ingest_many(["J-7"], importer=_Importer()) == {"J-7": True}
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(str(tmp_path / "J-7.db"))
+    with Session() as s:
+        assert [name for (name,) in s.query(Product.name)] == ["J-7 cab"]
@@ -1,8 +1,9 @@
 import pytest
 from mmx_engineering_spec_manager.data_manager.manager import DataManager
+from mmx_engineering_spec_manager.db_models.project import Project
 
 
-def test_sync_projects_from_innergy_calls_create_and_commit(db_session, mocker):
+def test_sync_projects_from_innergy_upserts_and_commits_once(db_session, mocker):
     dm = DataManager()
 
     # Mock the importer to return a project payload
@@ -10,20 +11,41 @@ def test_sync_projects_from_innergy_calls_create_and_commit(db_session, mocker):
         'mmx_engineering_spec_manager.data_manager.manager.InnergyImporter'
     )
     mocked_importer_instance = mocked_importer_cls.return_value
-    mocked_importer_instance.get_projects.return_value = [
+    mocked_importer_instance.iter_project_pages.return_value = iter([[
         {"Number": "200", "Name": "From Innergy", "Address": "123 Road"}
-    ]
-
-    # Spy on create_or_update_project to ensure it is called with formatted data
-    mocker.patch.object(dm, 'create_or_update_project')
+    ]])
 
     # Spy on session.commit passed into the method
     mock_commit = mocker.patch.object(db_session, 'commit')
 
     dm.sync_projects_from_innergy(db_session)
 
-    dm.create_or_update_project.assert_called_once_with(
-        {"number": "200", "name": "From Innergy", "job_description": "123 Road"},
-        db_session
-    )
+    row = db_session.query(Project).filter_by(number="200").one()
+    assert (row.name, row.job_description) == ("From Innergy", "123 Road")
     assert mock_commit.call_count == 1
+
+
+def test_sync_projects_is_set_based_and_skips_unchanged(db_session, mocker):
+    dm = DataManager()
+    db_session.add_all([
+        Project(number="1", name="Same", job_description="A"),
+        Project(number="2", name="Old", job_description="B", job_address="Keep"),
+    ])
+    db_session.commit()
+    importer = mocker.patch('mmx_engineering_spec_manager.data_manager.manager.InnergyImporter').return_value
+    importer.iter_project_pages.return_value = iter([
+        [{"Number": "1", "Name": "Same", "Address": "A"}, {"Number": "2", "Name": "New", "Address": "B"}],
+        [{"Number": "3", "Name": "Third", "Address": "C"}],
+    ])
+    create = mocker.patch.object(dm, 'create_or_update_project')
+    statements = []
+    mocker.patch.object(db_session, 'commit', side_effect=lambda: statements.append("COMMIT"))
+
+    assert dm.sync_projects_from_innergy(db_session) == 3
+
+    create.assert_not_called()
+    assert statements == ["COMMIT"]
+    rows = {p.number: p for p in db_session.query(Project).all()}
+    assert rows["2"].name == "New" and rows["2"].job_address == "Keep"
+    assert rows["3"].name == "Third"
+    assert len(rows) == 3
@@ -0,0 +1,16 @@
+from types import SimpleNamespace
+
+from mmx_engineering_spec_manager.data_manager import manager as manager_mod
+from mmx_engineering_spec_manager.utilities.persistence import get_sqlite_engine_registry
+
+
+def test_prepare_project_db_runs_schema_work_once_per_file(project_db, mocker):
+    dm, db_path = project_db("SCHEMA-CACHE", prepare=False)
+    ensure_spy = mocker.spy(manager_mod, "ensure_sqlite_schema")
+
+    project = SimpleNamespace(id=7, number="SCHEMA-CACHE", name="P", job_description="")
+    assert dm.prepare_project_db(project) == db_path
+    assert dm.prepare_project_db(project) == db_path
+    dm.get_callouts_for_project(7)
+    assert ensure_spy.call_count == 1
+    assert get_sqlite_engine_registry().is_schema_ready(db_path)
@@ -0,0 +1,92 @@
+import dataclasses
+import threading
+
+import pytest
+from sqlalchemy import event
+
+from mmx_engineering_spec_manager.db_models.location import Location
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.specification_group import SpecificationGroup
+from mmx_engineering_spec_manager.db_models.wall import Wall
+from mmx_engineering_spec_manager.dtos import ProductSnapshot, ProjectSnapshot
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def dm_with_walls(project_db):
+    dm, db_path = project_db("SNAP", name="Snapshot Job", job_description="Kitchen")
+    dm.replace_products_for_project(1, [
+        {"name": f"P{i}", "quantity": i, "location": "Kitchen" if i < 4 else "Bath", "width": 24.0 + i,
+         "item_number": str(i), "custom_fields": [{"name": "Finish", "value": "PL1"}]}
+        for i in range(6)
+    ])
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        kitchen = s.query(Location).filter_by(name="Kitchen").one()
+        sg = SpecificationGroup(name="Shop")
+        wall = Wall(link_id="W1", project_id=1, location_id=kitchen.id, width=120.0, height=96.0)
+        s.add_all([sg, wall])
+        s.flush()
+        for p in s.query(Product).filter(Product.location_id == kitchen.id):
+            p.wall_id = wall.id
+            p.specification_group_id = sg.id
+        s.add(Wall(link_id="W2", project_id=1, location_id=None, width=60.0))
+        s.commit()
+    finally:
+        s.close()
+    return dm, db_path
+
+
+def test_snapshot_mirrors_project_rows(dm_with_walls):
+    dm, _ = dm_with_walls
+    snap = dm.get_project_snapshot(1)
+    assert isinstance(snap, ProjectSnapshot)
+    assert (snap.number, snap.name, snap.job_description) == ("SNAP", "Snapshot Job", "Kitchen")
+    assert [l.name for l in snap.locations] == ["Kitchen", "Bath"]
+    assert len(snap.product_columns) == 6
+    assert snap.product_columns.width == (24.0, 25.0, 26.0, 27.0, 28.0, 29.0)
+    first = snap.products[0]
+    assert isinstance(first, ProductSnapshot)
+    assert (first.name, first.quantity) == ("P0", 0)
+    assert {(cf.name, cf.value) for cf in first.custom_fields} >= {("Finish", "PL1"), ("ItemNumber", "0")}
+    kitchen = snap.locations[0]
+    assert [p.name for p in snap.products_for_location(kitchen.id)] == ["P0", "P1", "P2", "P3"]
+    wall = snap.walls_for_location(kitchen.id)[0]
+    assert [p.name for p in snap.products_for_wall(wall.id)] == ["P0", "P1", "P2", "P3"]
+    assert [g.name for g in snap.specification_groups] == ["Shop"]
+
+
+def test_snapshot_is_immutable_and_thread_safe(dm_with_walls):
+    dm, _ = dm_with_walls
+    snap = dm.get_project_snapshot(1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.name = "changed"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.products[0].quantity = 5
+    # Slots: no per-instance __dict__
+    assert not hasattr(snap.products[0], "__dict__")
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(sum(p.quantity for p in snap.products)))
+    t.start()
+    t.join()
+    assert seen == [15]
+
+
+def test_snapshot_query_count_is_fixed(dm_with_walls):
+    dm, db_path = dm_with_walls
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        dm.get_project_snapshot(1)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    # prepare_project_db's row lookup + six snapshot SELECTs
+    assert len(statements) == 7
+
@@ -0,0 +1,76 @@
+import re
+
+import pytest
+from sqlalchemy import event
+
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+# Tables whose child rows are looked up by a foreign key on the hot read paths
+_INDEXED_TABLES = (
+    "products", "custom_fields", "locations", "walls", "location_table_callouts",
+    "finish_callouts", "hardware_callouts", "sink_callouts", "appliance_callouts", "prompts",
+)
+_FULL_SCAN = re.compile(r"^SCAN (%s)\b(?! USING)" % "|".join(_INDEXED_TABLES))
+
+
+@pytest.fixture
+def dm_with_data(project_db):
+    dm, db_path = project_db("PLAN", name="Plan")
+    dm.replace_products_for_project(1, [
+        {"name": f"P{i}", "quantity": 1, "location": f"Room {i % 3}", "item_number": str(i),
+         "custom_fields": [{"name": "Finish", "value": "PL1"}]}
+        for i in range(20)
+    ])
+    dm.replace_callouts_for_project(1, {"Finishes": [{"Type": "Finish", "Name": "F", "Tag": "PL1", "Description": "d"}]})
+    return dm, db_path
+
+
+def _captured_selects(engine, fn):
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return statements
+
+
+def _full_scans(engine, statements):
+    scans = []
+    with engine.connect() as conn:
+        for sql, params in statements:
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params):
+                detail = str(row[-1])
+                if _FULL_SCAN.match(detail):
+                    scans.append((detail, sql))
+    return scans
+
+
+def test_read_paths_use_foreign_key_indexes(dm_with_data):
+    dm, db_path = dm_with_data
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+
+    def read_paths():
+        assert len(dm.get_products_for_project_from_project_db(1)) == 20
+        dm.get_callouts_for_project(1)
+        dm.get_location_tables_for_project(1)
+        assert dm.get_full_project_from_project_db(1) is not None
+        assert dm.get_project_snapshot(1) is not None
+        dm.replace_products_for_project(1, [])  # diff save reads existing rows by project
+
+    statements = _captured_selects(engine, read_paths)
+    assert statements
+    assert _full_scans(engine, statements) == []
+
+
+def test_project_lookup_by_number_uses_unique_index(dm_with_data):
+    _, db_path = dm_with_data
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    with engine.connect() as conn:
+        plan = [str(r[-1]) for r in conn.exec_driver_sql("EXPLAIN QUERY PLAN SELECT id FROM projects WHERE number = ?", ("PLAN",))]
+    assert any("ix_projects_number" in p for p in plan), plan
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def dm_with_project_db(project_db):
+    dm, _ = project_db("BULK", name="Bulk")
+    return dm
+
+
+def test_replace_products_bulk_roundtrip(dm_with_project_db):
+    dm = dm_with_project_db
+    products = [
+        {
+            "name": "Base 1", "quantity": 2, "location": "Kitchen", "width": 24.0, "height": 34.5,
+            "x_origin": 10.0, "link_id_wall": "3", "link_id_specification_group": "bad",
+            "item_number": "1", "comment": "ADA",
+            "custom_fields": [{"name": "Finish", "value": "PL1"}],
+        },
+        SimpleNamespace(name="Upper 1", quantity=1, location=" Kitchen ", custom_fields=[], item_number=""),
+        {"name": "Tall 1", "quantity": 1, "location": "Pantry"},
+        {"name": "Loose", "quantity": 1, "location": None},
+    ]
+    assert dm.replace_products_for_project(1, products)
+
+    out = {p["name"]: p for p in dm.get_products_for_project_from_project_db(1)}
+    assert set(out) == {"Base 1", "Upper 1", "Tall 1", "Loose"}
+    base = out["Base 1"]
+    assert base["location"] == "Kitchen"
+    assert base["width"] == 24.0 and base["x_origin"] == 10.0
+    assert base["link_id_wall"] == 3
+    assert base["link_id_specification_group"] is None
+    assert base["item_number"] == "1" and base["comment"] == "ADA"
+    assert {"name": "Finish", "value": "PL1"} in base["custom_fields"]
+    assert out["Upper 1"]["location"] == "Kitchen"
+    assert out["Upper 1"]["item_number"] is None
+    assert out["Tall 1"]["location"] == "Pantry"
+    assert out["Loose"]["location"] is None
+
+
+def test_replace_products_bulk_replaces_previous_rows(dm_with_project_db):
+    dm = dm_with_project_db
+    first = [{"name": f"P{i}", "quantity": 1, "location": "Room", "custom_fields": [{"name": "A", "value": "1"}]} for i in range(1500)]
+    assert dm.replace_products_for_project(1, first)
+    assert dm.replace_products_for_project(1, [{"name": "Only", "quantity": 1, "location": "Room"}])
+    out = dm.get_products_for_project_from_project_db(1)
+    assert [p["name"] for p in out] == ["Only"]
+    assert out[0]["custom_fields"] == []
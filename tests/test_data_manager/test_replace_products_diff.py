@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from mmx_engineering_spec_manager.data_manager import manager as manager_mod
+from mmx_engineering_spec_manager.db_models.custom_field import CustomField
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.dtos import ProductSaveStats
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def dm_and_path(project_db):
+    return project_db("DIFF", name="Diff")
+
+
+def _ids_by_name(db_path):
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    with Session() as s:
+        return {name: pid for pid, name in s.execute(select(Product.id, Product.name))}
+
+
+def _products(n):
+    return [
+        {"name": f"Cab {i}", "quantity": 1, "location": "Kitchen", "item_number": str(i + 1),
+         "custom_fields": [{"name": "Finish", "value": "PL1"}]}
+        for i in range(n)
+    ]
+
+
+def test_diff_save_counts_and_keeps_ids(dm_and_path):
+    dm, db_path = dm_and_path
+    first = dm.replace_products_for_project(1, _products(5))
+    assert first == ProductSaveStats(inserted=5)
+    ids = _ids_by_name(db_path)
+
+    edited = _products(5)
+    edited[1]["quantity"] = 4  # column change
+    edited[2]["custom_fields"] = [{"name": "Finish", "value": "PL2"}]  # custom field change
+    del edited[4]  # removed
+    edited.append({"name": "New", "quantity": 1, "location": "Pantry"})  # added
+    stats = dm.replace_products_for_project(1, edited)
+
+    assert stats == ProductSaveStats(inserted=1, updated=2, deleted=1, unchanged=2)
+    after = _ids_by_name(db_path)
+    assert {k: after[k] for k in ("Cab 0", "Cab 1", "Cab 2", "Cab 3")} == {k: ids[k] for k in ("Cab 0", "Cab 1", "Cab 2", "Cab 3")}
+    assert "Cab 4" not in after
+    out = {p["name"]: p for p in dm.get_products_for_project_from_project_db(1)}
+    assert out["Cab 1"]["quantity"] == 4
+    assert {"name": "Finish", "value": "PL2"} in out["Cab 2"]["custom_fields"]
+    assert out["New"]["location"] == "Pantry"
+
+
+def test_diff_save_noop_writes_nothing(dm_and_path):
+    dm, db_path = dm_and_path
+    dm.replace_products_for_project(1, _products(3))
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    with Session() as s:
+        cf_ids = s.execute(select(CustomField.id).order_by(CustomField.id)).scalars().all()
+    stats = dm.replace_products_for_project(1, _products(3))
+    assert stats == ProductSaveStats(unchanged=3)
+    assert stats.changed == 0
+    with Session() as s:
+        assert s.execute(select(CustomField.id).order_by(CustomField.id)).scalars().all() == cf_ids
+
+
+def test_diff_save_matches_unnumbered_duplicates_in_order(dm_and_path):
+    dm, db_path = dm_and_path
+    rows = [{"name": "Filler", "quantity": q, "location": "Kitchen"} for q in (1, 2, 3)]
+    dm.replace_products_for_project(1, rows)
+    rows[2]["quantity"] = 9
+    assert dm.replace_products_for_project(1, rows) == ProductSaveStats(updated=1, unchanged=2)
+    qtys = sorted(p["quantity"] for p in dm.get_products_for_project_from_project_db(1))
+    assert qtys == [1, 2, 9]
+
+
+def test_product_batch_saves_like_dicts(dm_and_path):
+    from mmx_engineering_spec_manager.mappers.innergy_mapper import parse_budget_products
+    from mmx_engineering_spec_manager.utilities.product_fingerprint import fingerprint_products
+
+    dm, db_path = dm_and_path
+    items = [
+        {"Name": f"Cab {i}", "QuantCount": 1, "Location": {"Name": "Kitchen"}, "ItemNumber": str(i + 1),
+         "Width": 24, "Comment": "c" if i == 0 else None, "CustomFields": [{"Name": "Finish", "Value": "PL1"}]}
+        for i in range(5)
+    ]
+    batch = parse_budget_products(items)
+    assert dm.replace_products_for_project(1, batch) == ProductSaveStats(inserted=5)
+    # Same products as dicts are recognised as unchanged
+    assert dm.replace_products_for_project(1, list(batch)) == ProductSaveStats(unchanged=5)
+
+    stored = dm.get_products_for_project_from_project_db(1)
+    cab0 = next(p for p in stored if p["name"] == "Cab 0")
+    assert cab0["location"] == "Kitchen" and cab0["width"] == 24 and cab0["comment"] == "c"
+    # Column-wise and dict-wise fingerprints of the same batch agree
+    assert fingerprint_products(batch) == fingerprint_products(list(batch))
+
+
+def test_ingest_load_products_and_reingest_keep_ids_and_geometry(dm_and_path, monkeypatch):
+    from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
+
+    dm, db_path = dm_and_path
+    items = [
+        {"Name": f"Cab {i}", "QuantCount": 1, "Location": "Kitchen", "Width": 24 + i, "XOrigin": 10.0 * i, "ItemNumber": str(i + 1)}
+        for i in range(3)
+    ]
+    monkeypatch.setattr(manager_mod, "get_settings", lambda: SimpleNamespace(innergy_api_key="KEY"))
+    monkeypatch.setattr(InnergyImporter, "get_job_details", lambda self, n: {"Number": n, "Name": "Diff"})
+    monkeypatch.setattr(InnergyImporter, "get_products", lambda self, n: items)
+    monkeypatch.setattr(InnergyImporter, "iter_budget_products", lambda self, n: iter(items))
+
+    assert dm.ingest_project_details_to_project_db("DIFF")
+    ids = _ids_by_name(db_path)
+    # "Load products" fetches the same job and saves it: nothing to write
+    assert dm.replace_products_for_project(1, dm.fetch_products_from_innergy("DIFF")) == ProductSaveStats(unchanged=3)
+    assert dm.ingest_project_details_to_project_db("DIFF")
+
+    assert _ids_by_name(db_path) == ids
+    out = {p["name"]: p for p in dm.get_products_for_project_from_project_db(1)}
+    assert [(out[f"Cab {i}"]["width"], out[f"Cab {i}"]["x_origin"], out[f"Cab {i}"]["location"]) for i in range(3)] == [
+        (24.0, 0.0, "Kitchen"), (25.0, 10.0, "Kitchen"), (26.0, 20.0, "Kitchen"),
+    ]
+    assert [out[f"Cab {i}"]["item_number"] for i in range(3)] == ["1", "2", "3"]
+
+
+def test_unchanged_products_are_matched_by_stored_digest(dm_and_path, monkeypatch):
+    dm, db_path = dm_and_path
+    dm.replace_products_for_project(1, _products(50))
+    compared = []
+    real = manager_mod._values_equal
+    monkeypatch.setattr(manager_mod, "_values_equal", lambda a, b: compared.append(a) or real(a, b))
+
+    edited = _products(50)
+    edited[10]["quantity"] = 7
+    assert dm.replace_products_for_project(1, edited) == ProductSaveStats(updated=1, unchanged=49)
+    # Only the edited row was read back and compared column by column
+    assert 0 < len(compared) <= len(manager_mod._PRODUCT_DIFF_COLUMNS)
+
+
+def test_rows_without_a_digest_are_compared_and_backfilled(dm_and_path):
+    dm, db_path = dm_and_path
+    dm.replace_products_for_project(1, _products(3))
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    with Session() as s:
+        s.query(Product).update({Product.content_digest: None})
+        s.commit()
+    assert dm.replace_products_for_project(1, _products(3)) == ProductSaveStats(unchanged=3)
+    with Session() as s:
+        assert s.query(Product).filter(Product.content_digest.is_(None)).count() == 0
+
+
+def test_workspace_move_is_reverted_by_resaving_the_source_products(dm_and_path):
+    dm, db_path = dm_and_path
+    rows = _products(2)
+    rows[0]["x_origin"] = 12.0
+    dm.replace_products_for_project(1, rows)
+    ids = _ids_by_name(db_path)
+    assert dm.apply_workspace_changes(1, {ids["Cab 0"]: {"x_origin_from_right": 99.0}}, {}) == {"products": 1, "walls": 0}
+
+    assert dm.replace_products_for_project(1, rows) == ProductSaveStats(updated=1, unchanged=1)
+    out = {p["name"]: p for p in dm.get_products_for_project_from_project_db(1)}
+    assert out["Cab 0"]["x_origin"] == 12.0
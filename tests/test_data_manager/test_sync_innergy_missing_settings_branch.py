@@ -10,8 +10,8 @@ def test_sync_projects_missing_settings_warns_and_returns_zero(monkeypatch):
         'mmx_engineering_spec_manager.data_manager.manager.get_settings',
         lambda: types.SimpleNamespace(innergy_base_url='', innergy_api_key=None)
     )
-    # get_projects returns empty list to follow through
-    monkeypatch.setattr(InnergyImporter, 'get_projects', lambda self: [])
+    # Project stream yields an empty page to follow through
+    monkeypatch.setattr(InnergyImporter, 'iter_project_pages', lambda self: iter([[]]))
 
     count = dm.sync_projects_from_innergy()
     assert count == 0
@@ -17,7 +17,7 @@ def test_sync_projects_reports_progress_and_returns_count(monkeypatch):
         {"Number": f"P-{i}", "Name": f"Proj{i}", "Address": "Addr"}
         for i in range(3)
     ]
-    monkeypatch.setattr(InnergyImporter, 'get_projects', lambda self: projects)
+    monkeypatch.setattr(InnergyImporter, 'iter_project_pages', lambda self: iter([projects]))
 
     # Avoid DB work inside create_or_update_project to speed up
     monkeypatch.setattr(dm, 'create_or_update_project', lambda *a, **k: None)
@@ -11,7 +11,7 @@ def test_sync_projects_progress_callbacks_exceptions(monkeypatch):
         lambda: types.SimpleNamespace(innergy_base_url='http://x', innergy_api_key='k')
     )
     # One project to iterate
-    monkeypatch.setattr(InnergyImporter, 'get_projects', lambda self: [{"Number":"P-1","Name":"N","Address":"A"}])
+    monkeypatch.setattr(InnergyImporter, 'iter_project_pages', lambda self: iter([[{"Number":"P-1","Name":"N","Address":"A"}]]))
     # No-op for DB
     monkeypatch.setattr(dm, 'create_or_update_project', lambda *a, **k: None)
 
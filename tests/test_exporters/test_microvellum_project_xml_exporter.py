@@ -0,0 +1,135 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mmx_engineering_spec_manager.db_models.custom_field import CustomField
+from mmx_engineering_spec_manager.db_models.global_prompts import GlobalPrompts
+from mmx_engineering_spec_manager.db_models.location import Location
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.prompt import Prompt
+from mmx_engineering_spec_manager.db_models.specification_group import SpecificationGroup
+from mmx_engineering_spec_manager.db_models.wall import Wall
+from mmx_engineering_spec_manager.db_models.wizard_prompts import WizardPrompts
+from mmx_engineering_spec_manager.exporters.microvellum_xml import MicrovellumProjectXmlExporter
+from mmx_engineering_spec_manager.exporters.registry import get_exporter
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def loaded_project(project_db):
+    dm, db_path = project_db("101", name="MvSampleXMLImport", job_description="XML Import")
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        veneer, hpdl = SpecificationGroup(name="Veneer"), SpecificationGroup(name="HPDL")
+        phase_one = Location(name="Phase One", project_id=1)
+        s.add_all([veneer, hpdl, phase_one, Location(name="Phase Two", project_id=1)])
+        s.flush()
+        wall = Wall(link_id="BPWALL.Wall.001", project_id=1, location_id=phase_one.id,
+                    width=120.0, height=108.0, depth=6.0, x_origin=-2.5, y_origin=344.5, z_origin=0.0, angle=0.0)
+        s.add(wall)
+        s.flush()
+        p = Product(name="1 Door Base", quantity=1, width=18.0, height=34.5, depth=23.125, project_id=1,
+                    x_origin_from_right=48.25, y_origin_from_face=0.0, z_origin_from_bottom=0.0,
+                    location_id=phase_one.id, wall_id=wall.id, specification_group_id=veneer.id)
+        p.custom_fields = [CustomField(name="ItemNumber", value="1.01"), CustomField(name="Comment", value="a|b")]
+        s.add(p)
+        s.flush()
+        parent = Prompt(name="Left_Applied_End", value="1", product_id=p.id)
+        s.add_all([parent, Prompt(name="Fixed_Shelf_Qty", value="=2+2", product_id=p.id)])
+        s.flush()
+        s.add(Prompt(name="Applied_End_Type", value="MV Profile Door", product_id=p.id, parent_id=parent.id))
+        # HPDL has prompts but no products
+        s.add(GlobalPrompts(name="Globals", project_id=1, specification_group_id=hpdl.id,
+                            prompts=[Prompt(name="Adj_Max_Span", value="15")]))
+        s.add(WizardPrompts(name="Project Wizard", project_id=1, specification_group_id=veneer.id,
+                            prompts=[Prompt(name="Cost_Adjustment", value="2")]))
+        s.commit()
+    finally:
+        s.close()
+    return dm.get_full_project_from_project_db(1)
+
+
+def test_project_xml_follows_microvellum_import_schema(loaded_project, tmp_path: Path):
+    progress = []
+    res = MicrovellumProjectXmlExporter().export(loaded_project, tmp_path, {"progress": lambda d, t: progress.append((d, t))})
+    assert res.success, res.message
+    assert progress == [(1, 1)]
+
+    root = ET.parse(res.output_paths[0]).getroot()
+    assert (root.tag, root.attrib["Application"]) == ("Root", "Microvellum")
+    project = root.find("Project")
+    assert project.attrib["Name"] == "MvSampleXMLImport"
+    assert project.findtext("JobNumber") == "101"
+
+    groups = {g.attrib["Name"]: g for g in project.findall("SpecificationGroups/SpecificationGroup")}
+    assert list(groups) == ["HPDL", "Veneer"]
+    assert groups["HPDL"].find("Global").attrib["Name"] == "Globals"
+    assert groups["HPDL"].findtext("Global/Prompts/Prompt/Value") == "15"
+    assert groups["Veneer"].findtext("Wizard/Prompts/Prompt/Value") == "2"
+
+    assert [l.attrib["Name"] for l in project.findall("Locations/Location")] == ["Phase One", "Phase Two"]
+    wall = project.find("Walls/Wall")
+    assert wall.findtext("LinkID") == "BPWALL.Wall.001"
+    assert wall.findtext("LinkIDLocation") == "Phase One"
+    assert wall.findtext("Width") == "120.0"
+
+    product = project.find("Products/Product")
+    assert product.attrib["Name"] == "1 Door Base"
+    assert product.findtext("ItemNumber") == "1.01"
+    assert product.findtext("XOrigin") == "48.25"
+    assert product.findtext("LinkIDSpecificationGroup") == "Veneer"
+    assert product.findtext("LinkIDLocation") == "Phase One"
+    assert product.findtext("LinkIDWall") == "BPWALL.Wall.001"
+    prompts = product.findall("Prompts/Prompt")
+    assert [p.attrib["Name"] for p in prompts] == ["Left_Applied_End", "Fixed_Shelf_Qty"]
+    nested = prompts[0].find("Prompt")
+    assert (nested.attrib["Name"], nested.findtext("Value")) == ("Applied_End_Type", "MV Profile Door")
+
+
+def test_project_xml_exporter_is_registered_and_handles_bare_projects(tmp_path: Path):
+    exporter = get_exporter("microvellum_project_xml")
+    assert isinstance(exporter, MicrovellumProjectXmlExporter)
+    res = exporter.export(SimpleNamespace(number="N1", name="Bare & <Co>", products=[]), tmp_path)
+    assert res.success
+    root = ET.parse(res.output_paths[0]).getroot()
+    assert root.find("Project").attrib["Name"] == "Bare & <Co>"
+    assert root.find("Project/Products") is not None and root.find("Project/Walls") is None
+
+
+def test_project_xml_failed_export_removes_partial_file(tmp_path: Path):
+    class _Broken:
+        @property
+        def name(self):
+            raise RuntimeError("detached")
+
+    good = SimpleNamespace(name="Base", quantity=1)
+    res = MicrovellumProjectXmlExporter().export(SimpleNamespace(number="N2", name="P", products=[good, _Broken()]), tmp_path)
+    assert not res.success and "detached" in res.message
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_project_xml_skips_prompt_sets_without_specification_group(tmp_path: Path, monkeypatch):
+    from unittest.mock import Mock
+    from mmx_engineering_spec_manager.exporters import microvellum_xml
+
+    logger = Mock()
+    monkeypatch.setattr(microvellum_xml, "get_logger", lambda name: logger)
+    grouped = SimpleNamespace(name="Globals", specification_group_id=7, specification_group=SimpleNamespace(name="HPDL"), prompts=[])
+    loose_global = SimpleNamespace(name="Loose", specification_group_id=None, prompts=[])
+    loose_wizard = SimpleNamespace(name="LooseWiz", specification_group_id=None, prompts=[])
+    project = SimpleNamespace(number="N3", name="P", products=[], global_prompts=[grouped, loose_global], wizard_prompts=[loose_wizard])
+
+    res = MicrovellumProjectXmlExporter().export(project, tmp_path)
+    assert res.success
+    xml_project = ET.parse(res.output_paths[0]).getroot().find("Project")
+    assert xml_project.find("Global") is None and xml_project.find("Wizard") is None
+    assert [g.attrib["Name"] for g in xml_project.findall("SpecificationGroups/SpecificationGroup/Global")] == ["Globals"]
+    warned = [c.args[-1] for c in logger.warning.call_args_list]
+    assert warned == ["Loose", "LooseWiz"]
+
+    # Only ungrouped sets: no SpecificationGroups element at all
+    res = MicrovellumProjectXmlExporter().export(SimpleNamespace(number="N4", name="P", products=[], global_prompts=[loose_global]), tmp_path)
+    assert ET.parse(res.output_paths[0]).getroot().find("Project/SpecificationGroups") is None
@@ -0,0 +1,98 @@
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+from mmx_engineering_spec_manager.dtos import ProductColumns, ProjectSnapshot
+from mmx_engineering_spec_manager.exporters.microvellum_xml import MicrovellumXmlExporter
+
+
+def _product(i):
+    return SimpleNamespace(
+        name=f"Cab {i} <\"W&D\">\t\n", quantity=i % 3, width=18 + i % 7, height=30.5, depth=None,
+        x_origin_from_right=float(i) if i % 2 else None, y_origin_from_face=0.0, z_origin_from_bottom=None,
+    )
+
+
+class _LazyProducts:
+    """Sequence that builds each product on access, so the source holds no per-product state."""
+
+    def __init__(self, n):
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        return (_product(i) for i in range(self._n))
+
+
+def _project(products, number="P-1"):
+    return SimpleNamespace(number=number, name="Jöb & Co", job_description="a\r\nb", products=products)
+
+
+def _export_both(tmp_path: Path, project):
+    exp = MicrovellumXmlExporter()
+    tree = exp.export(project, tmp_path / "tree")
+    stream = exp.export(project, tmp_path / "stream", {"streaming": True})
+    assert tree.success and stream.success
+    return tree.output_paths[0].read_bytes(), stream.output_paths[0].read_bytes()
+
+
+def test_streaming_output_is_byte_identical(tmp_path: Path):
+    tree, stream = _export_both(tmp_path, _project([_product(i) for i in range(25)]))
+    assert stream == tree
+    # Empty Products collapses to the short form in both paths
+    tree, stream = _export_both(tmp_path, _project([], number="EMPTY"))
+    assert stream == tree and b"<Products />" in stream
+
+
+def test_streaming_exports_snapshot_columns(tmp_path: Path):
+    rows = [(i, f"P{i}", 1, 24.0, 34.5, 24.0, 0.0, None, 0.0, None, None, None, ()) for i in range(10)]
+    snap = ProjectSnapshot(id=1, number="SNAP", name="S", product_columns=ProductColumns.from_rows(rows))
+    tree, stream = _export_both(tmp_path, snap)
+    assert stream == tree and stream.count(b"<Product ") == 10
+
+
+def test_streaming_reports_progress(tmp_path: Path):
+    calls = []
+    res = MicrovellumXmlExporter().export(
+        _project(_LazyProducts(2500)), tmp_path,
+        {"streaming": True, "progress": lambda done, total: calls.append((done, total)), "progress_every": 1000},
+    )
+    assert res.success
+    assert calls == [(1000, 2500), (2000, 2500), (2500, 2500)]
+
+
+def test_streaming_peak_memory_does_not_grow_with_product_count(tmp_path: Path):
+    exp = MicrovellumXmlExporter()
+
+    def peak(n):
+        tracemalloc.start()
+        try:
+            assert exp.export(_project(_LazyProducts(n)), tmp_path, {"streaming": True, "filename": f"{n}.xml"}).success
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(1000), peak(50000)
+    assert large < small * 1.5 + 64 * 1024
+
+
+class _FailingProducts(_LazyProducts):
+    def __iter__(self):
+        for i in range(self._n):
+            if i == 3:
+                raise RuntimeError("db went away")
+            yield _product(i)
+
+
+def test_failed_export_leaves_previous_file_and_no_partial_output(tmp_path: Path):
+    exp = MicrovellumXmlExporter()
+    ok = exp.export(_project([_product(0)]), tmp_path, {"streaming": True})
+    before = ok.output_paths[0].read_bytes()
+
+    for options in ({"streaming": True}, {}):
+        res = exp.export(_project(_FailingProducts(10)), tmp_path, options)
+        assert not res.success and "db went away" in res.message
+        assert ok.output_paths[0].read_bytes() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["P-1.xml"]
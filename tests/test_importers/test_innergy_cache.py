@@ -0,0 +1,109 @@
+import json
+import os
+import types
+from pathlib import Path
+from unittest.mock import Mock
+
+from mmx_engineering_spec_manager.importers import innergy as innergy_mod
+from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
+from mmx_engineering_spec_manager.importers.innergy_cache import InnergyReplaySource, InnergyResponseCache
+from mmx_engineering_spec_manager.importers.innergy_client import InnergyClient
+
+EXAMPLE_DIR = Path(__file__).resolve().parents[2] / "example_data" / "innergy" / "json"
+
+
+def _resp(status, body=None, headers=None):
+    r = Mock()
+    r.status_code = status
+    r.text = json.dumps(body) if body is not None else ""
+    r.json.return_value = body
+    r.headers = headers or {}
+    return r
+
+
+def _client(tmp_path, responses, **kwargs):
+    session = Mock()
+    session.get.side_effect = list(responses)
+    cache = kwargs.pop("cache", None) or InnergyResponseCache(str(tmp_path / "cache"), kwargs.pop("ttl_s", 0.0))
+    api_key = kwargs.pop("api_key", "KEY")
+    return InnergyClient("https://app.innergy.com", api_key, session=session, cache=cache, **kwargs), session
+
+
+def test_etag_revalidation_serves_cached_body_on_304(tmp_path):
+    client, session = _client(tmp_path, [
+        _resp(200, {"Items": [1]}, {"ETag": '"v1"'}),
+        _resp(304),
+    ])
+    assert client.get_json("/api/projects") == {"Items": [1]}
+    assert client.get_json("/api/projects") == {"Items": [1]}
+    second_headers = session.get.call_args_list[1].kwargs["headers"]
+    assert second_headers["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+
+
+def test_changed_payload_replaces_entry(tmp_path):
+    client, _ = _client(tmp_path, [
+        _resp(200, {"v": 1}, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _resp(200, {"v": 2}),
+    ])
+    client.get_json("/api/projects/1")
+    assert client.get_json("/api/projects/1") == {"v": 2}
+    assert client.cache.load("https://app.innergy.com/api/projects/1", api_key="KEY").body == json.dumps({"v": 2})
+
+
+def test_ttl_serves_fresh_entries_without_network(tmp_path):
+    client, session = _client(tmp_path, [_resp(200, {"v": 1})], ttl_s=60)
+    client.get_json("/api/projects/1/budgetProducts")
+    assert client.get_json("/api/projects/1/budgetProducts") == {"v": 1}
+    assert session.get.call_count == 1
+
+
+def test_cache_is_keyed_by_endpoint_and_job(tmp_path):
+    client, session = _client(tmp_path, [_resp(200, {"job": 1}), _resp(200, {"job": 2})], ttl_s=60)
+    assert client.get_json("/api/projects/1") == {"job": 1}
+    assert client.get_json("/api/projects/2") == {"job": 2}
+    names = sorted(os.listdir(tmp_path / "cache"))
+    assert len(names) == 2 and all(n.startswith("api_projects_") for n in names)
+
+
+def test_cache_is_keyed_by_api_key(tmp_path):
+    cache = InnergyResponseCache(str(tmp_path / "cache"), ttl_s=60)
+    first, _ = _client(tmp_path, [_resp(200, {"tenant": "a"})], cache=cache, api_key="KEY-A")
+    first.get_json("/api/projects/1")
+    second, session = _client(tmp_path, [_resp(200, {"tenant": "b"})], cache=cache, api_key="KEY-B")
+    assert second.get_json("/api/projects/1") == {"tenant": "b"}
+    assert session.get.call_count == 1
+    assert first.get_json("/api/projects/1") == {"tenant": "a"}
+    assert not any("KEY-" in p.read_text() for p in (tmp_path / "cache").iterdir())
+
+
+def test_offline_serves_stale_cache_and_misses_without_network(tmp_path):
+    cache = InnergyResponseCache(str(tmp_path / "cache"))
+    online, _ = _client(tmp_path, [_resp(200, {"v": 1}, {"ETag": "x"})], cache=cache)
+    online.get_json("/api/projects/1")
+    offline, session = _client(tmp_path, [], cache=cache, offline=True)
+    assert offline.get_json("/api/projects/1") == {"v": 1}
+    assert offline.get("/api/projects/2").status_code == 504
+    session.get.assert_not_called()
+
+
+def test_importer_replays_example_data_without_network(monkeypatch):
+    settings = types.SimpleNamespace(
+        innergy_api_key=None, innergy_base_url="https://app.innergy.com",
+        innergy_replay_dir=str(EXAMPLE_DIR),
+    )
+    monkeypatch.setattr(innergy_mod, "get_settings", lambda: settings)
+    session_get = Mock(side_effect=AssertionError("network used"))
+    monkeypatch.setattr("requests.Session.get", session_get)
+
+    imp = InnergyImporter()
+    assert isinstance(imp.get_projects(), list)
+    details = imp.get_job_details("ANY-JOB")
+    assert details["Number"] == json.loads((EXAMPLE_DIR / "api_projects_byid.json").read_text())["Number"]
+    products = imp.get_products("ANY-JOB")
+    assert products and all("Name" in p for p in products)
+    session_get.assert_not_called()
+
+
+def test_replay_missing_file_is_404(tmp_path):
+    assert InnergyReplaySource(str(tmp_path)).response_for("https://x/api/other").status_code == 404
@@ -0,0 +1,151 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from mmx_engineering_spec_manager.importers.innergy_client import (
+    InnergyClient,
+    InnergyHTTPError,
+    get_shared_session,
+    prefetch,
+    reset_shared_session,
+)
+
+
+def _resp(status, payload=None, headers=None):
+    r = Mock()
+    r.status_code = status
+    r.json.return_value = payload
+    r.headers = headers or {}
+    return r
+
+
+def _client(responses, **kwargs):
+    session = Mock()
+    session.get.side_effect = list(responses)
+    sleeps = []
+    client = InnergyClient("https://app.innergy.com/", "KEY", session=session, sleep=sleeps.append, **kwargs)
+    return client, session, sleeps
+
+
+def test_get_retries_429_and_5xx_with_exponential_backoff():
+    client, session, sleeps = _client(
+        [_resp(429), _resp(503), _resp(200, {"ok": True})], backoff_factor=0.5
+    )
+    r = client.get("/api/projects")
+    assert r.status_code == 200
+    assert sleeps == [0.5, 1.0]
+    url, kwargs = session.get.call_args.args[0], session.get.call_args.kwargs
+    assert url == "https://app.innergy.com/api/projects"
+    assert kwargs["timeout"] == (5.0, 30.0)
+    assert kwargs["headers"]["API-KEY"] == "KEY"
+
+
+def test_get_honours_retry_after_and_gives_up_after_max_retries():
+    client, session, sleeps = _client(
+        [_resp(429, headers={"Retry-After": "2"}), _resp(500), _resp(500)], max_retries=2
+    )
+    r = client.get("/api/projects")
+    assert r.status_code == 500
+    assert session.get.call_count == 3
+    assert sleeps == [2.0, 1.0]
+
+
+def test_get_does_not_retry_client_errors():
+    client, session, sleeps = _client([_resp(404)])
+    assert client.get("/api/projects/x").status_code == 404
+    assert session.get.call_count == 1 and sleeps == []
+
+
+def test_get_retries_connection_errors_then_raises():
+    client, session, sleeps = _client(
+        [requests.ConnectionError("down"), requests.Timeout("slow")], max_retries=1
+    )
+    with pytest.raises(requests.Timeout):
+        client.get("/api/projects")
+    assert len(sleeps) == 1
+
+
+def test_iter_pages_follows_next_link():
+    client, session, _ = _client([
+        _resp(200, {"Items": [1, 2], "NextPageLink": "https://app.innergy.com/api/projects?page=2"}),
+        _resp(200, {"Items": [3]}),
+    ])
+    assert list(client.iter_pages("/api/projects")) == [[1, 2], [3]]
+    assert session.get.call_args_list[1].args[0] == "https://app.innergy.com/api/projects?page=2"
+
+
+def test_iter_pages_skip_take_until_short_page():
+    client, session, _ = _client([
+        _resp(200, {"Items": [1, 2]}),
+        _resp(200, {"Items": [3]}),
+    ], page_size=2)
+    assert list(client.iter_items("/api/projects")) == [1, 2, 3]
+    assert [c.kwargs["params"] for c in session.get.call_args_list] == [
+        {"skip": 0, "take": 2},
+        {"skip": 2, "take": 2},
+    ]
+
+
+def test_iter_pages_raises_on_non_200():
+    client, _, _ = _client([_resp(403)])
+    with pytest.raises(InnergyHTTPError) as exc:
+        list(client.iter_pages("/api/projects"))
+    assert exc.value.status_code == 403
+
+
+def test_shared_session_is_reused_until_reset():
+    reset_shared_session()
+    s1 = get_shared_session()
+    assert InnergyClient("https://x", None).session is s1
+    reset_shared_session()
+    assert get_shared_session() is not s1
+    reset_shared_session()
+
+
+def test_prefetch_yields_in_order_and_reraises():
+    produced = []
+    def pages():
+        produced.append(1)
+        yield [1]
+        produced.append(2)
+        yield [2]
+        raise RuntimeError("boom")
+
+    it = prefetch(pages())
+    assert next(it) == [1]
+    assert next(it) == [2]
+    with pytest.raises(RuntimeError):
+        next(it)
+    assert produced == [1, 2]
+
+
+def test_iter_pages_requests_next_link_without_skip_take():
+    client, session, _ = _client([
+        _resp(200, {"Items": [1, 2], "NextPageLink": "https://x/api?skip=2&take=2"}),
+        _resp(200, {"Items": [3]}),
+    ], page_size=2)
+    assert list(client.iter_items("/api/projects")) == [1, 2, 3]
+    first, second = session.get.call_args_list
+    assert first.kwargs["params"] == {"skip": 0, "take": 2}
+    assert second.args[0] == "https://x/api?skip=2&take=2"
+    assert "params" not in second.kwargs
+
+
+def test_iter_pages_stops_when_server_ignores_paging():
+    # skip/take ignored: the same full page comes back every time
+    client, session, _ = _client([_resp(200, {"Items": [1, 2]}) for _ in range(5)], page_size=2)
+    assert list(client.iter_pages("/api/projects")) == [[1, 2]]
+    assert session.get.call_count == 2
+
+    # A next link pointing back at itself
+    looping = {"Items": [1], "NextPageLink": "https://x/api?page=2"}
+    client, session, _ = _client([_resp(200, looping), _resp(200, {**looping, "Items": [2]}), _resp(200, looping)])
+    assert list(client.iter_pages("/api/projects")) == [[1], [2]]
+    assert session.get.call_count == 2
+
+
+def test_iter_pages_caps_page_count():
+    client, session, _ = _client([_resp(200, {"Items": [i, i]}) for i in range(10)], page_size=2, max_pages=3)
+    assert list(client.iter_pages("/api/projects")) == [[0, 0], [1, 1], [2, 2]]
+    assert session.get.call_count == 3
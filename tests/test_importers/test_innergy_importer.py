@@ -4,6 +4,13 @@ import pytest
 import requests
 from unittest.mock import Mock
 from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
+from mmx_engineering_spec_manager.importers import innergy_client
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff_sleep(monkeypatch):
+    # 5xx answers are retried with backoff; keep the suite fast
+    monkeypatch.setattr(innergy_client.time, "sleep", lambda s: None)
 
 
 def test_get_job_details_successful(mocker):
@@ -15,8 +22,8 @@ def test_get_job_details_successful(mocker):
     mock_response.status_code = 200
     mock_response.json.return_value = {"job_number": "12345"}
 
-    # Patch the requests.get method to return our mock response
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    # Patch the pooled Session's get method to return our mock response
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     # Note that the __init__ method no longer takes an API key
     importer = InnergyImporter()
@@ -25,13 +32,14 @@ def test_get_job_details_successful(mocker):
     importer.get_job_details(job_id="12345")
 
     # Assert that the API call was made and the response was handled
-    requests.get.assert_called_once_with(
+    requests.Session.get.assert_called_once_with(
         "https://app.innergy.com/api/projects/12345",
         headers={
             "API-KEY": str(os.getenv("INNERGY_API_KEY") or ""),
             "Accept": "*/*",
             "Connection": "keep-alive",
         },
+        timeout=(5.0, 30.0),
     )
 
 def test_get_job_details_returns_data(mocker):
@@ -59,8 +67,8 @@ def test_get_job_details_returns_data(mocker):
     mock_response.status_code = 200
     mock_response.json.return_value = mock_job_data
 
-    # Patch the requests.get method to return our mock response
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    # Patch the pooled Session's get method to return our mock response
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
 
@@ -77,13 +85,14 @@ def test_get_job_details_returns_data(mocker):
     assert job_details["Address"]["Address1"] == "123 Main St"
 
     # Assert that the correct API call was made
-    requests.get.assert_called_once_with(
+    requests.Session.get.assert_called_once_with(
         "https://app.innergy.com/api/projects/12345",
         headers={
             "API-KEY": str(os.getenv("INNERGY_API_KEY") or ""),
             "Accept": "*/*",
             "Connection": "keep-alive",
         },
+        timeout=(5.0, 30.0),
     )
 
 
@@ -128,8 +137,8 @@ def test_get_projects_returns_filtered_data(mocker):
     mock_response.status_code = 200
     mock_response.json.return_value = mock_projects_payload
 
-    # Patch the requests.get method to return our mock response
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    # Patch the pooled Session's get method to return our mock response
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
 
@@ -140,13 +149,14 @@ def test_get_projects_returns_filtered_data(mocker):
     assert projects_data == expected_data
 
     # Assert that the correct API call was made
-    requests.get.assert_called_once_with(
+    requests.Session.get.assert_called_once_with(
         "https://app.innergy.com/api/projects",
         headers={
             "API-KEY": str(os.getenv("INNERGY_API_KEY") or ""),
             "Accept": "*/*",
             "Connection": "keep-alive",
         },
+        timeout=(5.0, 30.0),
     )
 
 def test_get_products_with_custom_fields_returns_data(mocker):
@@ -191,8 +201,8 @@ def test_get_products_with_custom_fields_returns_data(mocker):
     mock_response.status_code = 200
     mock_response.json.return_value = mock_products_payload
 
-    # Patch the requests.get method to return our mock response
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    # Patch the pooled Session's get method to return our mock response
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
 
@@ -210,7 +220,7 @@ def test_get_job_details_non_200_returns_none(mocker):
 
     mock_response = Mock()
     mock_response.status_code = 404
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
     assert importer.get_job_details(job_id="nope") is None
@@ -223,7 +233,7 @@ def test_get_projects_non_200_returns_none(mocker):
 
     mock_response = Mock()
     mock_response.status_code = 500
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
     assert importer.get_projects() is None
@@ -236,7 +246,7 @@ def test_get_products_non_200_returns_none(mocker):
 
     mock_response = Mock()
     mock_response.status_code = 403
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer = InnergyImporter()
     assert importer.get_products(job_id="nope") is None
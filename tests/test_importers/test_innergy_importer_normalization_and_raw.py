@@ -28,7 +28,7 @@ def test_get_projects_raw_returns_status_and_text(monkeypatch):
     mock_resp = Mock()
     mock_resp.status_code = 202
     mock_resp.text = '{"ok": true}'
-    monkeypatch.setattr(requests, 'get', lambda url, headers=None: mock_resp)
+    monkeypatch.setattr(requests.Session, 'get', lambda self, url, **kwargs: mock_resp)
 
     imp = InnergyImporter()
     raw = imp.get_projects_raw()
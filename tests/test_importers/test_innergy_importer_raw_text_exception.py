@@ -8,7 +8,7 @@ def test_get_projects_raw_handles_text_exception(monkeypatch):
         @property
         def text(self):
             raise RuntimeError('nope')
-    monkeypatch.setattr(requests, 'get', lambda url, headers=None: _Resp())
+    monkeypatch.setattr(requests.Session, 'get', lambda self, url, **kwargs: _Resp())
     imp = InnergyImporter()
     raw = imp.get_projects_raw()
     assert raw['status_code'] == 200
@@ -26,7 +26,7 @@ def test_get_projects_includes_active_dict_status_and_excludes_inactive(monkeypa
     resp = Mock()
     resp.status_code = 200
     resp.json.return_value = payload
-    monkeypatch.setattr(requests, 'get', lambda url, headers=None: resp)
+    monkeypatch.setattr(requests.Session, 'get', lambda self, url, **kwargs: resp)
 
     imp = InnergyImporter()
     projects = imp.get_projects()
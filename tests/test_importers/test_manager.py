@@ -17,8 +17,8 @@ def test_importer_manager_loads_innergy_importer(mocker):
     mock_response.status_code = 200
     mock_response.json.return_value = {"job_number": "12345"}
 
-    # Patch the requests.get method to return our mock response
-    mocker.patch.object(requests, 'get', return_value=mock_response)
+    # Patch the pooled Session's get method to return our mock response
+    mocker.patch.object(requests.Session, 'get', return_value=mock_response)
 
     importer_manager = ImporterManager()
     importer = importer_manager.get_importer("innergy")
@@ -27,13 +27,14 @@ def test_importer_manager_loads_innergy_importer(mocker):
     importer.get_job_details(job_id="12345")
 
     # Assert that the API call was made and the response was handled
-    requests.get.assert_called_once_with(
+    requests.Session.get.assert_called_once_with(
         "https://app.innergy.com/api/projects/12345",
         headers={
             "API-KEY": str(os.getenv("INNERGY_API_KEY") or ""),
             "Accept": "*/*",
             "Connection": "keep-alive",
         },
+        timeout=(5.0, 30.0),
     )
 
 
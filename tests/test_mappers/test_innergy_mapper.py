@@ -1,7 +1,9 @@
 from mmx_engineering_spec_manager.mappers.innergy_mapper import (
+    extract_product_extended_attributes,
     map_custom_fields_to_dtos,
     map_products_payload_to_dtos,
     map_project_payload_to_dto,
+    parse_budget_products,
 )
 
 
@@ -63,9 +65,53 @@ def test_map_project_payload_to_dto_handles_address_and_locations_and_products()
     assert dto.job_description == "JD"
     assert dto.job_address == "123 Main"
     assert [l.name for l in dto.locations] == ["Kitchen", "Bath"]
-    assert dto.products and dto.products[0].name == "Cabinet"
+    assert dto.products.name == ("Cabinet",) and dto.products[0]["description"] == "Desc"
     assert dto.custom_fields and dto.custom_fields[0].name == "P_CF"
 
     # Address as plain string fallback
     dto2 = map_project_payload_to_dto({"number": "N", "Address": "Somewhere"})
     assert dto2.job_address == "Somewhere"
+
+
+def test_extract_product_extended_attributes_location_variants():
+    item = {"Location": {"Name": "Kitchen"}, "Width": 24, "XOrigin": 10, "ItemNumber": "7", "LinkIDWall": 3}
+    ext = extract_product_extended_attributes(item)
+    assert ext["location"] == "Kitchen"
+    assert ext["width"] == 24 and ext["x_origin"] == 10
+    assert ext["item_number"] == "7" and ext["link_id_wall"] == 3
+    assert ext["depth"] is None and ext["picture_name"] is None
+    assert extract_product_extended_attributes({"LocationName": "Bath"})["location"] == "Bath"
+    assert extract_product_extended_attributes({"Location": 5})["location"] is None
+
+
+def test_parse_budget_products_builds_columns_in_one_pass():
+    items = [
+        {
+            "Name": "Base", "QuantCount": 2, "Description": "D", "Location": {"Name": "Kitchen"},
+            "Width": 24, "XOrigin": 10, "ItemNumber": "1", "LinkIDSpecificationGroup": "SG-1",
+            "CustomFields": [{"Name": "Finish", "Value": "PL1"}, {"Name": "Edge", "Value": None}],
+        },
+        "not-a-product",
+        {"name": "Upper", "quantity": 1, "location": "Kitchen", "LinkIDSpecificationGroup": "SG-1"},
+        {"Name": "Tall", "LocationName": "Pantry", "custom_fields": [{"name": "Finish", "value": "PL2"}]},
+    ]
+    batch = parse_budget_products(items)
+
+    assert len(batch) == 3
+    assert batch.name == ("Base", "Upper", "Tall")
+    assert batch.width == (24, None, None) and batch.x_origin == (10, None, None)
+    assert batch.location == ("Kitchen", "Kitchen", "Pantry")
+    # Repeated names share one string object
+    assert batch.location[0] is batch.location[1]
+    assert batch.link_id_specification_group[0] is batch.link_id_specification_group[1]
+    assert batch.cf_offsets == (0, 2, 2, 3)
+    assert batch.custom_fields_of(2) == [("Finish", "PL2")]
+    assert batch.group_by("location") == {"Kitchen": [0, 1], "Pantry": [2]}
+
+    # Reads as the list of product dicts the fetch used to return
+    assert batch[0]["custom_fields"] == [{"name": "Finish", "value": "PL1"}, {"name": "Edge", "value": None}]
+    assert batch[-1]["location"] == "Pantry" and batch[-1]["item_number"] is None
+    assert [p["name"] for p in batch] == ["Base", "Upper", "Tall"]
+    dtos = batch.to_dtos()
+    assert dtos[0].quantity == 2 and dtos[0].custom_fields[0].name == "Finish"
+    assert parse_budget_products([]) == parse_budget_products(None)
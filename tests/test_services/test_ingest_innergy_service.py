@@ -1,10 +1,15 @@
+import threading
+
+import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from mmx_engineering_spec_manager.services.ingest_innergy_project_service import IngestInnergyProjectService
 from mmx_engineering_spec_manager.db_models.database_config import Base
 from mmx_engineering_spec_manager.db_models.project import Project
+from mmx_engineering_spec_manager.db_models.product import Product
 from mmx_engineering_spec_manager.importers.contracts import ProjectImporter, ProjectSummaryDTO
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
 
 
 class _StubImporter(ProjectImporter):
@@ -121,3 +126,47 @@ def test_ingest_service_handles_no_products_branch():
         assert len(p.products) == 0
     finally:
         s.close()
+
+
+@pytest.fixture
+def dm(project_db):
+    dm, _ = project_db()
+    return dm
+
+
+def test_ingest_many_persists_each_job_and_reports_progress(dm, tmp_path):
+    class _PerJobImporter(_StubImporter):
+        def fetch_project(self, job_id):
+            if job_id == "BAD":
+                raise RuntimeError("boom")
+            return {"Number": job_id, "Name": f"Job {job_id}"}
+
+    svc = IngestInnergyProjectService(session_factory=_build_session_factory(), importer=_PerJobImporter(), data_manager=dm)
+    progress = []
+    results = svc.ingest_many(["J1", "J2", "BAD"], max_workers=3, progress=progress.append)
+
+    assert results == {"J1": True, "J2": True, "BAD": False}
+    assert sorted(progress) == [33, 66, 100]
+    assert sorted(p.number for p in dm.session.query(Project).all()) == ["J1", "J2"]
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(str(tmp_path / "J1.db"))
+    with Session() as s:
+        assert sorted(name for (name,) in s.query(Product.name)) == ["Cabinet A", "Cabinet B"]
+
+
+def test_ingest_many_delegates_to_the_data_manager_batch_ingest(dm):
+    threads = []
+
+    class _RecordingImporter(_StubImporter):
+        def fetch_project(self, job_id):
+            threads.append(threading.current_thread().name)
+            return {"Number": job_id, "Name": f"Job {job_id}"}
+
+        def fetch_products(self, job_id):
+            threads.append(threading.current_thread().name)
+            return super().fetch_products(job_id)
+
+    svc = IngestInnergyProjectService(session_factory=_build_session_factory(), importer=_RecordingImporter(), data_manager=dm)
+    results = svc.ingest_many(["J1", "J2"], max_workers=2)
+
+    assert results == {"J1": True, "J2": True}
+    assert len(threads) == 4 and all(name.startswith("innergy-fetch") for name in threads)
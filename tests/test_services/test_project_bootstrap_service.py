@@ -0,0 +1,35 @@
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from mmx_engineering_spec_manager.services.project_bootstrap_service import ProjectBootstrapService
+
+
+class _FakeDM:
+    def __init__(self):
+        self.calls = []
+
+    def ingest_many(self, numbers, max_workers=None, progress=None):
+        self.calls.append((numbers, max_workers))
+        for i, n in enumerate(numbers, start=1):
+            progress(int(100 * i / len(numbers)))
+        return {n: True for n in numbers}
+
+
+def _with_key():
+    return type("S", (), {"innergy_api_key": "KEY"})()
+
+
+def test_start_ingest_many_reports_progress_on_the_worker_signal():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    loop = QEventLoop()
+    dm = _FakeDM()
+    svc = ProjectBootstrapService(dm, settings_provider=_with_key)
+    progress, results = [], []
+
+    worker, thread = svc.start_ingest_many(["J-1", "J-2"], max_workers=2, on_progress=progress.append, on_result=results.append)
+    thread.finished.connect(loop.quit)
+    QTimer.singleShot(2000, loop.quit)
+    loop.exec()
+
+    assert dm.calls == [(["J-1", "J-2"], 2)]
+    assert progress == [50, 100]
+    assert len(results) == 1 and results[0].ok and results[0].value == {"J-1": True, "J-2": True}
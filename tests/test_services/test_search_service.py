@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mmx_engineering_spec_manager.data_manager import manager as manager_mod
+from mmx_engineering_spec_manager.data_manager.search_index import build_match_query
+from mmx_engineering_spec_manager.dtos import SearchHit
+from mmx_engineering_spec_manager.services import SearchService
+
+
+@pytest.fixture
+def dm(project_db):
+    dm, _ = project_db(global_db="global.db", by="id")
+    for number, name, desc in (("J-100", "Harbor Clinic", "ADA restrooms"), ("J-200", "Maple Kitchen", "Residential")):
+        dm.create_or_update_project({"number": number, "name": name, "job_description": desc})
+    return dm
+
+
+def _project_id(dm, number):
+    return next(p.id for p in dm.get_all_projects() if p.number == number)
+
+
+def test_saves_update_the_index_and_search_ranks_hits(dm):
+    clinic, kitchen = _project_id(dm, "J-100"), _project_id(dm, "J-200")
+    dm.prepare_project_db(SimpleNamespace(id=clinic, number="J-100", name="Harbor Clinic", job_description="ADA restrooms"))
+    dm.replace_products_for_project(clinic, [
+        {"name": "Vanity Base", "quantity": 1, "location": "Restroom", "comment": "ADA knee space"},
+        {"name": "Tall Pantry", "quantity": 1, "location": "Break Room", "custom_fields": [{"name": "Finish", "value": "PL-7"}]},
+    ])
+    dm.replace_callouts_for_project(kitchen, {"Hardware": [{"name": "Pull 128mm", "tag": "HW-12", "description": "Satin nickel"}]})
+
+    service = SearchService(dm)
+    res = service.search("HW-12")
+    assert res.ok
+    assert [(h.project_id, h.kind, h.field, h.title) for h in res.value] == [(kitchen, "callout", "Hardware", "HW-12")]
+    assert res.value[0].project_number == "J-200"
+
+    ada = service.search("ada").value
+    assert all(isinstance(h, SearchHit) for h in ada)
+    assert {(h.kind, h.title) for h in ada} == {("project", "J-100 Harbor Clinic"), ("product", "Vanity Base")}
+    product_hit = next(h for h in ada if h.kind == "product")
+    assert product_hit.field == "Comment" and "[ADA]" in product_hit.snippet
+
+    # Filter by kind; prefix matching; custom-field values are searchable
+    assert [h.kind for h in service.search("ada", kinds=["product"]).value] == ["product"]
+    assert [h.title for h in service.search("pan").value] == ["Tall Pantry"]
+    assert [(h.kind, h.field) for h in service.search("PL-7").value] == [("custom_field", "Finish")]
+
+    # A later save replaces that project's documents instead of appending
+    dm.replace_products_for_project(clinic, [{"name": "Vanity Base", "quantity": 1, "location": "Restroom"}])
+    assert [h.kind for h in service.search("ada").value] == ["project"]
+    assert service.search("pantry").value == []
+
+
+def test_rebuild_and_query_edge_cases(dm):
+    clinic = _project_id(dm, "J-100")
+    dm.replace_products_for_project(clinic, [{"name": f"Base {i}", "quantity": 1, "location": "Room"} for i in range(2000)])
+    service = SearchService(dm)
+    # Only projects with a DB file are indexed
+    assert service.rebuild().value == 1
+    hits = service.search("base 1999").value
+    assert [h.title for h in hits] == ["Base 1999"]
+    assert service.search("   ").value == []
+    # FTS syntax in user input is treated as text
+    assert service.search('"unbalanced OR NEAR(').ok
+    assert build_match_query('HW-12 "x') == '"HW-12"* """x"*'
+
+
+def test_index_work_does_not_touch_the_global_session(dm):
+    from mmx_engineering_spec_manager.db_models.project import Project
+
+    clinic = _project_id(dm, "J-100")
+    dm.prepare_project_db(SimpleNamespace(id=clinic, number="J-100", name="Harbor Clinic", job_description="ADA restrooms"))
+    pending = Project(number="J-PENDING", name="Pending")
+    dm.session.add(pending)
+    service = SearchService(dm)
+    assert service.reindex_project(clinic).ok
+    assert [h.project_number for h in service.search("harbor").value] == ["J-100"]
+    # Neither flushed, committed nor discarded by the index work
+    assert pending in dm.session.new
+    dm.session.rollback()
+    assert dm.session.query(Project).filter_by(number="J-PENDING").count() == 0
+
+
+def test_ingested_projects_are_searchable(dm, monkeypatch):
+    from mmx_engineering_spec_manager.importers.innergy import InnergyImporter
+
+    monkeypatch.setattr(manager_mod, "get_settings", lambda: SimpleNamespace(innergy_api_key="KEY"))
+    monkeypatch.setattr(InnergyImporter, "get_job_details", lambda self, n: {"Number": n, "Name": f"Lakeside {n}"})
+    monkeypatch.setattr(
+        InnergyImporter, "get_products", lambda self, n: [{"Name": f"Reception Desk {n}", "QuantCount": 1}]
+    )
+    service = SearchService(dm)
+
+    assert dm.ingest_many(["J-300"]) == {"J-300": True}
+    assert dm.ingest_project_details_to_project_db("J-400")
+    hits = service.search("reception").value
+    assert sorted((h.project_number, h.title) for h in hits) == [
+        ("J-300", "Reception Desk J-300"),
+        ("J-400", "Reception Desk J-400"),
+    ]
+    assert [h.kind for h in service.search("lakeside J-300").value] == ["project"]
+
+
+def test_product_save_reindexes_only_the_rows_it_wrote(dm):
+    from sqlalchemy import text
+
+    clinic = _project_id(dm, "J-100")
+    dm.prepare_project_db(SimpleNamespace(id=clinic, number="J-100", name="Harbor Clinic", job_description="ADA restrooms"))
+    rows = [
+        {"name": f"Base {i}", "quantity": 1, "item_number": str(i), "custom_fields": [{"name": "Finish", "value": f"PL-{i}"}]}
+        for i in range(3)
+    ]
+    first_id = dm.replace_products_for_project(clinic, rows).inserted_ids[0]
+
+    def _docs():
+        with dm.session.get_bind().connect() as conn:
+            return {(kind, ref): doc_id for doc_id, kind, ref in conn.execute(text("SELECT id, kind, ref_id FROM search_docs WHERE kind != 'project'"))}
+
+    before = _docs()
+    rows[1]["name"] = "Tall 1"
+    stats = dm.replace_products_for_project(clinic, rows)
+    assert stats.updated_ids and len(stats.updated_ids) == 1
+    edited = stats.updated_ids[0]
+    after = _docs()
+
+    untouched = {k: v for k, v in before.items() if k[1] != edited}
+    assert {k: after[k] for k in untouched} == untouched
+    assert {k for k in after if k[1] == edited} == {("product", edited), ("custom_field", edited)}
+    assert after[("product", edited)] != before[("product", edited)]
+    service = SearchService(dm)
+    assert [h.title for h in service.search("tall").value] == ["Tall 1"]
+    assert service.search("base 1").value == []
+    # Removing products drops their documents
+    dm.replace_products_for_project(clinic, rows[:1])
+    assert {ref for _, ref in _docs()} == {first_id}
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from mmx_engineering_spec_manager.db_models.location import Location
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.wall import Wall
+from mmx_engineering_spec_manager.services.workspace_service import UNPLACED_LOCATION_KEY, WorkspaceService
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def workspace(project_db):
+    dm, db_path = project_db("TREE", name="Lazy")
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        kitchen, bath = Location(name="Kitchen", project_id=1), Location(name="Bath", project_id=1)
+        s.add_all([kitchen, bath])
+        s.flush()
+        walls = [Wall(link_id=f"K{i}", project_id=1, location_id=kitchen.id, width=100.0 + i) for i in range(3)]
+        walls.append(Wall(link_id="LOOSE", project_id=1, location_id=None))
+        s.add_all(walls)
+        s.flush()
+        for i in range(12):
+            s.add(Product(name=f"P{i}", project_id=1, location_id=kitchen.id, wall_id=walls[i % 2].id))
+        s.commit()
+        ids = SimpleNamespace(kitchen=kitchen.id, bath=bath.id, walls=[w.id for w in walls])
+    finally:
+        s.close()
+    return dm, db_path, ids
+
+
+def test_root_has_locations_with_counts_only(workspace):
+    dm, _, ids = workspace
+    tree = WorkspaceService(dm).load_project_tree(1)
+    assert tree["label"] == "TREE - Lazy"
+    assert tree["child_count"] == 3
+    locs = [(c["key"], c["label"], c["child_count"], c["children"]) for c in tree["children"]]
+    assert locs == [
+        (f"location:{ids.kitchen}", "Kitchen", 3, []),
+        (f"location:{ids.bath}", "Bath", 0, []),
+        (UNPLACED_LOCATION_KEY, "", 1, []),
+    ]
+
+
+def test_load_children_walks_one_branch(workspace):
+    dm, _, ids = workspace
+    svc = WorkspaceService(dm)
+    walls = svc.load_children(1, f"location:{ids.kitchen}")
+    assert [(w["key"], w["child_count"]) for w in walls] == [
+        (f"wall:{ids.walls[0]}", 6), (f"wall:{ids.walls[1]}", 6), (f"wall:{ids.walls[2]}", 0),
+    ]
+    assert walls[0]["label"] == "Wall K0 (100.0)"
+    products = svc.load_children(1, walls[0]["key"])
+    assert [p["label"] for p in products] == ["P0", "P2", "P4", "P6", "P8", "P10"]
+    assert all(p["type"] == "product" and p["child_count"] == 0 for p in products)
+    assert [w["label"] for w in svc.load_children(1, UNPLACED_LOCATION_KEY)] == ["Wall LOOSE"]
+    assert svc.load_children(1, f"location:{ids.bath}") == []
+    assert svc.load_children(1, "bogus") == []
+
+
+def test_branch_queries_use_indexes(workspace):
+    dm, db_path, ids = workspace
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    svc = WorkspaceService(dm)
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        svc.load_project_tree(1)
+        svc.load_children(1, f"location:{ids.kitchen}")
+        svc.load_children(1, UNPLACED_LOCATION_KEY)
+        svc.load_children(1, f"wall:{ids.walls[0]}")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    with engine.connect() as conn:
+        plans = [
+            str(row[-1])
+            for sql, params in statements
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+        ]
+    assert [p for p in plans if p.startswith("SCAN") and "USING" not in p] == []
@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from mmx_engineering_spec_manager.db_models.product import Product
+from mmx_engineering_spec_manager.db_models.wall import Wall
+from mmx_engineering_spec_manager.services import WorkspaceChangeJournal, WorkspaceService
+from mmx_engineering_spec_manager.utilities.persistence import get_engine_and_sessionmaker_for_sqlite_path
+
+
+@pytest.fixture
+def workspace(project_db):
+    dm, db_path = project_db("SAVE", name="Save")
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        wall = Wall(link_id="W", project_id=1, width=120.0, height=96.0)
+        s.add(wall)
+        s.flush()
+        products = [Product(name=f"P{i}", project_id=1, wall_id=wall.id, width=24.0) for i in range(20)]
+        other = Product(name="Other job", project_id=2, x_origin_from_right=1.0)
+        s.add_all(products + [other])
+        s.commit()
+        ids = SimpleNamespace(wall=wall.id, products=[p.id for p in products], other=other.id)
+    finally:
+        s.close()
+    return dm, db_path, ids
+
+
+def _rows(db_path, model, ids):
+    _, Session = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    s = Session()
+    try:
+        return {r.id: r for r in s.query(model).filter(model.id.in_(ids))}
+    finally:
+        s.close()
+
+
+def test_journal_coalesces_moves_per_product():
+    j = WorkspaceChangeJournal()
+    for step in range(100):
+        j.record_product_move(7, x_origin_from_right=float(step))
+        j.record_product_move(7, z_origin_from_bottom=float(step) / 2)
+    j.record_product_move(8, y_origin_from_face=3, x_origin_from_right=None)
+    j.record_wall_edit(1, width=130)
+    assert j.events == 202
+    assert len(j) == 3
+    assert j.product_changes() == {
+        7: {"x_origin_from_right": 99.0, "z_origin_from_bottom": 49.5},
+        8: {"y_origin_from_face": 3.0},
+    }
+    assert j.wall_changes() == {1: {"width": 130.0}}
+    with pytest.raises(ValueError):
+        j.record_product_move(7, name="nope")
+    j.clear()
+    assert len(j) == 0
+
+
+def test_save_writes_final_positions_in_one_transaction(workspace):
+    dm, db_path, ids = workspace
+    engine, _ = get_engine_and_sessionmaker_for_sqlite_path(db_path)
+    journal = WorkspaceChangeJournal()
+    for drag in range(50):
+        for pid in ids.products:
+            journal.record_product_move(pid, x_origin_from_right=float(drag), z_origin_from_bottom=float(pid))
+    journal.record_product_move(ids.products[0], y_origin_from_face=6.0)
+    journal.record_product_move(ids.other, x_origin_from_right=99.0)  # not in this project
+    journal.record_wall_edit(ids.wall, width=144.0, thicknesses=5.0)
+    payload = dict(journal.to_changes(), project_id=1)
+
+    writes = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("UPDATE", "BEGIN", "COMMIT")):
+            writes.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        res = WorkspaceService(dm).save_changes(payload)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert res.ok and res.value == {"products": 20, "walls": 1}
+    # One executemany UPDATE per distinct column set (x+z, x+y+z, x only, wall), not per drag
+    assert writes.count("UPDATE") == 4
+    rows = _rows(db_path, Product, ids.products + [ids.other])
+    assert {rows[pid].x_origin_from_right for pid in ids.products} == {49.0}
+    assert all(rows[pid].z_origin_from_bottom == float(pid) for pid in ids.products)
+    assert rows[ids.products[0]].y_origin_from_face == 6.0
+    assert rows[ids.other].x_origin_from_right == 1.0
+    wall = _rows(db_path, Wall, [ids.wall])[ids.wall]
+    assert (wall.width, wall.height, wall.thicknesses) == (144.0, 96.0, 5.0)
+
+
+def test_save_accepts_legacy_move_lists(workspace):
+    dm, db_path, ids = workspace
+    pid = ids.products[3]
+    res = WorkspaceService(dm).save_changes({
+        "project_id": 1,
+        "plan_moves": [{"product_id": pid, "x_left": 10.0, "x_origin_from_right": 86.0, "y_origin_from_face": 2.0}],
+        "elevation_moves": [{"product_id": pid, "x_origin_from_right": 80.0, "z_origin_from_bottom": 30.0}],
+    })
+    assert res.ok and res.value["products"] == 1
+    row = _rows(db_path, Product, [pid])[pid]
+    assert (row.x_origin_from_right, row.y_origin_from_face, row.z_origin_from_bottom) == (80.0, 2.0, 30.0)
+
+
+def test_save_without_changes_or_project():
+    svc = WorkspaceService(data_manager=None)
+    assert svc.save_changes({"project_id": 1}).ok
+    assert svc.save_changes(None).value is None
+    res = svc.save_changes({"products": {1: {"x_origin_from_right": 1.0}}})
+    assert not res.ok and "project" in res.error.lower()
+
+
+def test_save_accepts_a_journal_instance(workspace):
+    dm, db_path, ids = workspace
+    journal = WorkspaceChangeJournal()
+    journal.record_product_move(ids.products[0], x_origin_from_right=12.0)
+    journal.record_wall_edit(ids.wall, height=100.0)
+    svc = WorkspaceService(dm)
+
+    assert not svc.save_changes(journal).ok
+    res = svc.save_changes(journal, project_id=1)
+    assert res.ok and res.value == {"products": 1, "walls": 1}
+    assert _rows(db_path, Product, [ids.products[0]])[ids.products[0]].x_origin_from_right == 12.0
+    assert _rows(db_path, Wall, [ids.wall])[ids.wall].height == 100.0
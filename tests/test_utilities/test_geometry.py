@@ -22,3 +22,74 @@ def test_y_top_to_zorigin_from_bottom():
     y_top = 50.0
     z_origin = y_top_to_zorigin_from_bottom(wall_h, prod_h, y_top)
     assert z_origin == wall_h - (y_top + prod_h)
+
+
+def test_batch_conversions_match_scalar_functions():
+    from mmx_engineering_spec_manager.utilities.geometry import (
+        x_lefts_to_xorigins_from_right,
+        xorigins_from_right_to_x_lefts,
+        y_tops_to_zorigins_from_bottom,
+        zorigins_from_bottom_to_y_tops,
+    )
+    widths = (30.0, 18.0, None)
+    x_lefts = (0.0, 60.0, 100.0)
+    xo = x_lefts_to_xorigins_from_right(120.0, widths, x_lefts)
+    assert xo == tuple(x_left_to_xorigin_from_right(120.0, w or 0, x) for w, x in zip(widths, x_lefts))
+    assert xorigins_from_right_to_x_lefts(120.0, widths, xo) == x_lefts
+    heights = (34.0, 30.0)
+    zo = y_tops_to_zorigins_from_bottom(96.0, heights, (62.0, 0.0))
+    assert zo == (0.0, 66.0)
+    assert zorigins_from_bottom_to_y_tops(96.0, heights, zo) == (62.0, 0.0)
+
+
+def test_analyze_wall_flags_overlaps_bounds_and_gaps():
+    import random
+
+    from mmx_engineering_spec_manager.utilities.geometry import analyze_wall, overlapping_pairs
+
+    # Base cabinets from the right: [0,24] [24,54] [50,68] (overlaps the previous) and one
+    # hanging past the left end; an upper over the first base does not collide with it.
+    widths = (24, 30, 18, 20, 24)
+    heights = (34, 34, 34, 34, 30)
+    x_origins = (0, 24, 50, 110, 0)
+    z_origins = (0, 0, 0, 0, 54)
+    geo = analyze_wall(120, 96, widths, heights, x_origins, z_origins)
+    assert geo.overlaps == ((1, 2),)
+    assert geo.out_of_bounds == (3,)
+    assert geo.gaps == ((68.0, 110.0),)
+    assert geo.covered == 78.0
+    assert geo.fill_ratio == 78.0 / 120
+    assert geo.x_lefts[0] == 96.0 and geo.y_tops[4] == 12.0
+
+    rng = random.Random(3)
+    n = 300
+    ws = [rng.uniform(9, 36) for _ in range(n)]
+    hs = [rng.uniform(10, 40) for _ in range(n)]
+    xs = [rng.uniform(0, 3000) for _ in range(n)]
+    zs = [rng.choice((0.0, 54.0)) for _ in range(n)]
+    brute = tuple(
+        (i, j)
+        for i in range(n) for j in range(i + 1, n)
+        if xs[i] < xs[j] + ws[j] and xs[j] < xs[i] + ws[i] and zs[i] < zs[j] + hs[j] and zs[j] < zs[i] + hs[i]
+    )
+    assert overlapping_pairs(ws, hs, xs, zs) == brute
+
+
+def test_analyze_project_walls_reads_snapshot_columns():
+    from mmx_engineering_spec_manager.dtos import ProductColumns, ProjectSnapshot, WallSnapshot
+    from mmx_engineering_spec_manager.utilities.geometry import analyze_project_walls
+
+    rows = [
+        (1, "A", 1, 24.0, 34.0, 24.0, 0.0, 0.0, 0.0, None, 10, None, ()),
+        (2, "B", 1, 24.0, 34.0, 24.0, 12.0, 0.0, 0.0, None, 10, None, ()),
+        (3, "C", 1, 24.0, 34.0, 24.0, 0.0, 0.0, 0.0, None, None, None, ()),
+    ]
+    snap = ProjectSnapshot(
+        id=1,
+        walls=(WallSnapshot(id=10, width=48.0, height=96.0), WallSnapshot(id=11)),
+        product_columns=ProductColumns.from_rows(rows),
+    )
+    result = analyze_project_walls(snap)
+    assert set(result) == {10}
+    assert result[10].overlaps == ((0, 1),)
+    assert result[10].gaps == ((36.0, 48.0),)
@@ -0,0 +1,157 @@
+from sqlalchemy import create_engine
+
+from mmx_engineering_spec_manager.db_models.database_config import Base
+from mmx_engineering_spec_manager.utilities.migrations import (
+    SCHEMA_VERSION,
+    Migration,
+    ensure_sqlite_schema,
+    get_sqlite_user_version,
+    set_sqlite_user_version,
+    upgrade_all_project_dbs,
+    upgrade_sqlite_schema,
+)
+
+
+def test_ensure_schema_creates_tables_and_stamps_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'p.db'}")
+    assert get_sqlite_user_version(engine) == 0
+    assert ensure_sqlite_schema(engine, Base.metadata) is True
+    assert get_sqlite_user_version(engine) == SCHEMA_VERSION
+    with engine.connect() as conn:
+        tables = {r[0] for r in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert {"projects", "products", "walls"}.issubset(tables)
+    engine.dispose()
+
+
+def test_ensure_schema_skips_ddl_when_stamp_is_current(tmp_path, mocker):
+    engine = create_engine(f"sqlite:///{tmp_path / 'p.db'}")
+    ensure_sqlite_schema(engine, Base.metadata)
+    create_all = mocker.patch.object(Base.metadata, "create_all")
+    assert ensure_sqlite_schema(engine, Base.metadata) is False
+    create_all.assert_not_called()
+    engine.dispose()
+
+
+def test_ensure_schema_upgrades_legacy_file(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE products (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, quantity INTEGER)")
+    assert ensure_sqlite_schema(engine, Base.metadata) is True
+    with engine.connect() as conn:
+        cols = {r[1] for r in conn.exec_driver_sql("PRAGMA table_info('products')")}
+    assert "x_origin_from_right" in cols
+    assert get_sqlite_user_version(engine) == SCHEMA_VERSION
+    engine.dispose()
+
+
+def _tables(engine):
+    with engine.connect() as conn:
+        return {r[0] for r in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='table'")}
+
+
+def test_upgrade_applies_only_steps_newer_than_stamp(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'p.db'}")
+    calls = []
+    steps = [
+        Migration(1, "one", lambda conn, md: calls.append(1)),
+        Migration(2, "two", lambda conn, md: calls.append(2)),
+        Migration(3, "three", lambda conn, md: conn.exec_driver_sql("CREATE TABLE t3 (id INTEGER)")),
+    ]
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE legacy (id INTEGER)")
+    set_sqlite_user_version(engine, 1)
+    assert upgrade_sqlite_schema(engine, Base.metadata, steps) == (1, 3)
+    assert calls == [2]
+    assert "t3" in _tables(engine)
+    assert get_sqlite_user_version(engine) == 3
+    # Already at head: nothing runs
+    assert upgrade_sqlite_schema(engine, Base.metadata, steps) == (3, 3)
+    assert calls == [2]
+    engine.dispose()
+
+
+def test_upgrade_failure_rolls_back_whole_upgrade(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'p.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE legacy (id INTEGER)")
+
+    def boom(conn, md):
+        raise RuntimeError("boom")
+
+    steps = [
+        Migration(1, "create", lambda conn, md: conn.exec_driver_sql("CREATE TABLE added (id INTEGER)")),
+        Migration(2, "fails", boom),
+    ]
+    try:
+        upgrade_sqlite_schema(engine, Base.metadata, steps)
+        assert False, "expected failure"
+    except RuntimeError:
+        pass
+    assert "added" not in _tables(engine)
+    assert get_sqlite_user_version(engine) == 0
+    engine.dispose()
+
+
+def test_upgrade_all_project_dbs_upgrades_each_file(tmp_path):
+    for name in ("A.db", "B.db"):
+        eng = create_engine(f"sqlite:///{tmp_path / name}")
+        with eng.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE products (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)")
+        eng.dispose()
+    results = upgrade_all_project_dbs(str(tmp_path), max_workers=2)
+    assert len(results) == 2
+    for path, res in results.items():
+        assert res == (0, SCHEMA_VERSION)
+        eng = create_engine(f"sqlite:///{path}")
+        assert get_sqlite_user_version(eng) == SCHEMA_VERSION
+        assert "walls" in _tables(eng)
+        eng.dispose()
+
+
+def _indexes(engine, table):
+    with engine.connect() as conn:
+        return {row[1]: row[2] for row in conn.exec_driver_sql(f"PRAGMA index_list('{table}')")}
+
+
+def test_projects_number_index_is_unique_unless_legacy_duplicates(tmp_path):
+    for dupes, unique in ((False, 1), (True, 0)):
+        engine = create_engine(f"sqlite:///{tmp_path / f'g{int(dupes)}.db'}")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE projects (id INTEGER PRIMARY KEY, number VARCHAR, name VARCHAR)")
+            conn.exec_driver_sql("INSERT INTO projects (number) VALUES ('A'), ('B')" + (", ('A')" if dupes else ""))
+        set_sqlite_user_version(engine, 4)
+        upgrade_sqlite_schema(engine, Base.metadata)
+        assert _indexes(engine, "projects")["ix_projects_number"] == unique
+        engine.dispose()
+
+
+def test_duplicate_project_numbers_hold_the_stamp_until_they_are_resolved(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'g.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE projects (id INTEGER PRIMARY KEY, number VARCHAR, name VARCHAR)")
+        conn.exec_driver_sql("INSERT INTO projects (number) VALUES ('A'), ('B'), ('A')")
+        conn.exec_driver_sql("CREATE TABLE products (id INTEGER PRIMARY KEY, project_id INTEGER)")
+    set_sqlite_user_version(engine, 4)
+
+    # Later steps still apply, but the stamp stays below step 5
+    assert upgrade_sqlite_schema(engine, Base.metadata) == (4, 4)
+    assert "ix_products_project_id" in _indexes(engine, "products")
+    assert ensure_sqlite_schema(engine, Base.metadata) is False
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM projects WHERE id = 3")
+    assert upgrade_sqlite_schema(engine, Base.metadata) == (4, SCHEMA_VERSION)
+    assert _indexes(engine, "projects")["ix_projects_number"] == 1
+    engine.dispose()
+
+
+def test_step6_adds_foreign_key_indexes_to_existing_files(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE products (id INTEGER PRIMARY KEY, project_id INTEGER, location_id INTEGER, wall_id INTEGER)")
+        conn.exec_driver_sql("CREATE TABLE custom_fields (id INTEGER PRIMARY KEY, product_id INTEGER, project_id INTEGER)")
+    set_sqlite_user_version(engine, 5)
+    assert upgrade_sqlite_schema(engine, Base.metadata) == (5, SCHEMA_VERSION)
+    assert {"ix_products_project_id", "ix_products_location_id", "ix_products_wall_id"} <= set(_indexes(engine, "products"))
+    assert {"ix_custom_fields_product_id", "ix_custom_fields_project_id"} <= set(_indexes(engine, "custom_fields"))
+    engine.dispose()
@@ -19,3 +19,81 @@ def test_create_engine_and_sessionmaker_with_memory_sqlite(monkeypatch):
     with engine.connect() as conn:
         result = conn.execute(text("select 1"))
         assert result is not None
+
+
+def test_sqlite_engine_registry_reuses_engines_and_counts_hits(tmp_path):
+    from mmx_engineering_spec_manager.utilities.persistence import SqliteEngineRegistry
+
+    reg = SqliteEngineRegistry(max_size=2)
+    db = str(tmp_path / "a.db")
+    engine1, Session1 = reg.get(db)
+    with engine1.connect() as conn:
+        conn.execute(text("select 1"))
+    engine2, Session2 = reg.get(db)
+    assert engine1 is engine2
+    assert Session1 is Session2
+    stats = reg.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["open_engines"] == 1
+    assert stats["checked_out_connections"] == 0
+    reg.dispose_all()
+
+
+def test_sqlite_engine_registry_evicts_lru_and_disposes(tmp_path, mocker):
+    from mmx_engineering_spec_manager.utilities.persistence import SqliteEngineRegistry
+
+    reg = SqliteEngineRegistry(max_size=2)
+    a, b, c = (str(tmp_path / f"{n}.db") for n in ("a", "b", "c"))
+    engine_a, _ = reg.get(a)
+    dispose_spy = mocker.spy(engine_a, "dispose")
+    reg.get(b)
+    reg.get(c)  # evicts "a" (least recently used)
+    assert a not in reg
+    assert b in reg and c in reg
+    assert dispose_spy.call_count == 1
+    assert reg.stats()["evictions"] == 1
+    assert len(reg) == 2
+    reg.dispose_all()
+    assert len(reg) == 0
+
+
+def test_sqlite_engine_registry_recreates_engine_when_file_removed(tmp_path):
+    from mmx_engineering_spec_manager.utilities.persistence import SqliteEngineRegistry
+
+    reg = SqliteEngineRegistry(max_size=2)
+    db = tmp_path / "gone.db"
+    engine1, _ = reg.get(str(db))
+    with engine1.connect() as conn:
+        conn.execute(text("create table t (id integer)"))
+    engine1.dispose()
+    db.unlink()
+    engine2, _ = reg.get(str(db))
+    assert engine2 is not engine1
+    assert reg.stats()["misses"] == 2
+    reg.dispose_all()
+
+
+def test_sqlite_pragma_profile_applied_to_new_connections(tmp_path):
+    from mmx_engineering_spec_manager.utilities.persistence import (
+        SqlitePragmaProfile,
+        create_engine_and_sessionmaker_for_sqlite_path,
+    )
+
+    profile = SqlitePragmaProfile(synchronous="OFF", cache_size=-1024, busy_timeout=1234)
+    engine, _ = create_engine_and_sessionmaker_for_sqlite_path(str(tmp_path / "p.db"), pragmas=profile)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar().lower() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -1024
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+    engine.dispose()
+
+
+def test_sqlite_pragma_profile_skips_unknown_modes():
+    from mmx_engineering_spec_manager.utilities.persistence import SqlitePragmaProfile
+
+    stmts = SqlitePragmaProfile(journal_mode="wal; DROP TABLE x", synchronous="normal").statements()
+    assert not any("journal_mode" in s for s in stmts)
+    assert "PRAGMA synchronous=NORMAL" in stmts
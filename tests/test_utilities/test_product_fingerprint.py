@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from mmx_engineering_spec_manager.utilities.product_fingerprint import (
+    diff_products,
+    fingerprint_products,
+    product_digest,
+)
+
+
+def _p(name, location="Kitchen", **kw):
+    d = {"name": name, "quantity": 1, "location": location, "width": 24, "custom_fields": []}
+    d.update(kw)
+    return d
+
+
+def test_digest_ignores_order_and_numeric_type():
+    a = [_p("A", custom_fields=[{"name": "X", "value": 1}, {"name": "Y", "value": "b"}]), _p("B")]
+    b = [_p("B", width=24.0), _p("A", custom_fields=[{"name": "Y", "value": "b"}, {"name": "X", "value": 1.0}])]
+    fa, fb = fingerprint_products(a), fingerprint_products(b)
+    assert fa.digest == fb.digest and fa.matches(fb)
+    assert not fa.diff(fb)
+
+
+def test_dicts_and_objects_fingerprint_alike():
+    d = _p("A", description=None, custom_fields=[{"name": "ItemNumber", "value": "7"}])
+    obj = SimpleNamespace(**{**d, "custom_fields": [SimpleNamespace(name="ItemNumber", value="7")]})
+    assert product_digest(d) == product_digest(obj)
+    assert list(fingerprint_products([d]).digests) == list(fingerprint_products([obj]).digests) == [("item", "7", 0)]
+
+
+def test_keyed_diff_reports_added_removed_changed():
+    old = [_p("A"), _p("B"), _p("B"), _p("C", item_number="42")]
+    new = [_p("A", width=30), _p("B"), _p("C", location="Bath", item_number="42"), _p("D")]
+    diff = diff_products(old, new)
+    assert diff.added == (("name", "D", "Kitchen", 0),)
+    assert diff.removed == (("name", "B", "Kitchen", 1),)
+    assert diff.changed == (("name", "A", "Kitchen", 0), ("item", "42", 0))
+    assert diff.summary() == "1 added, 2 changed, 1 removed"
+    assert bool(diff)
+
+
+def test_duplicate_products_count_towards_project_digest():
+    assert fingerprint_products([_p("A")]).digest != fingerprint_products([_p("A"), _p("A")]).digest
+    assert not fingerprint_products([]).diff(fingerprint_products(None))
@@ -48,3 +48,21 @@ def test_settings_defaults_consistent_with_persistence(monkeypatch):
     # Optional paths default to None
     assert s.microvellum_xml_template_path is None
     assert s.xlsx_template_path is None
+
+
+def test_settings_sqlite_pragmas_from_env(monkeypatch):
+    monkeypatch.setenv("SQLITE_JOURNAL_MODE", "DELETE")
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "FULL")
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "250")
+    monkeypatch.setenv("SQLITE_CACHE_SIZE", "not-a-number")
+
+    _reset_settings_singleton()
+    try:
+        s = settings_module.get_settings()
+        assert s.sqlite_pragmas.journal_mode == "DELETE"
+        assert s.sqlite_pragmas.synchronous == "FULL"
+        assert s.sqlite_pragmas.busy_timeout == 250
+        # Invalid values fall back to defaults
+        assert s.sqlite_pragmas.cache_size == -20000
+    finally:
+        _reset_settings_singleton()
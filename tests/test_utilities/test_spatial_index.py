@@ -0,0 +1,51 @@
+import random
+
+from mmx_engineering_spec_manager.utilities.spatial_index import Rect, RectIndex
+
+
+def _brute_overlaps(rects, query, exclude=None):
+    return sorted(k for k, r in rects.items() if k != exclude and r.overlaps(query))
+
+
+def test_query_matches_brute_force_under_updates():
+    rng = random.Random(7)
+    rects = {i: Rect(rng.uniform(0, 2000), rng.uniform(0, 30), rng.uniform(9, 48), rng.uniform(12, 36)) for i in range(400)}
+    index = RectIndex(rects.items())
+    for _ in range(200):
+        key = rng.randrange(400)
+        rects[key] = rects[key].moved(rng.uniform(-60, 60), rng.uniform(-5, 5))
+        index.update(key, rects[key])
+        q = Rect(rng.uniform(0, 2000), 0, rng.uniform(1, 80), 40)
+        assert sorted(index.query(q)) == _brute_overlaps(rects, q)
+    assert sorted(index.overlapping(3)) == _brute_overlaps(rects, rects[3], exclude=3)
+    assert len(index) == 400
+
+
+def test_touching_rects_do_not_overlap_and_remove_shrinks_reach():
+    index = RectIndex([(1, Rect(0, 0, 200, 10)), (2, Rect(200, 0, 24, 10)), (3, Rect(230, 0, 24, 10))])
+    assert index.overlapping(2) == []
+    assert index.query(Rect(150, 0, 5, 5)) == [1]
+    assert index.remove(1) == Rect(0, 0, 200, 10)
+    assert 1 not in index and index.query(Rect(150, 0, 5, 5)) == []
+    assert index.remove(1) is None
+
+
+def test_snap_to_nearest_neighbour_edge():
+    index = RectIndex([(1, Rect(0, 0, 24, 10)), (2, Rect(60, 0, 30, 10))])
+    # Left edge 0.6 from neighbour's right edge at 24
+    assert index.snap_x(3, Rect(24.6, 0, 18, 10), tolerance=1.0) == 24
+    # Right edge 0.5 short of neighbour's left edge at 60
+    assert index.snap_x(3, Rect(41.5, 0, 18, 10), tolerance=1.0) == 42
+    # Nothing within tolerance, or snapping disabled
+    assert index.snap_x(3, Rect(30, 0, 18, 10), tolerance=1.0) == 30
+    assert index.nearest_edge(24.5, tolerance=0) is None
+    # A product never snaps to its own edges
+    index.insert(3, Rect(24.6, 0, 18, 10))
+    assert index.nearest_edge(24.6, tolerance=0.1, exclude=3) is None
+
+
+def test_changed_compares_against_committed_rect():
+    index = RectIndex([("a", Rect(5, 5, 10, 10))])
+    assert not index.changed("a", Rect(5, 5, 10, 10))
+    assert index.changed("a", Rect(5.5, 5, 10, 10))
+    assert index.changed("b", Rect(0, 0, 1, 1))
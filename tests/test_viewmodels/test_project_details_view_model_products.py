@@ -0,0 +1,48 @@
+import types
+
+from mmx_engineering_spec_manager.viewmodels import ProjectDetailsViewModel
+
+
+class FakeProductsService:
+    def __init__(self, fetched, db):
+        self.fetched = fetched
+        self.db = db
+
+    def fetch_products_from_innergy(self, number):
+        return list(self.fetched)
+
+    def get_products_from_db(self, project_id):
+        return list(self.db)
+
+
+def _vm(fetched, db):
+    vm = ProjectDetailsViewModel(products_service=FakeProductsService(fetched, db))
+    vm.set_active_project(types.SimpleNamespace(id=5, number="P-5"))
+    return vm
+
+
+def test_load_products_no_changes_clears_staging():
+    db = [{"name": "A", "quantity": 1, "location": "Kitchen"}, {"name": "B", "quantity": 2, "location": "Bath"}]
+    vm = _vm(list(reversed(db)), db)
+    notes = []
+    vm.notification.subscribe(notes.append)
+
+    assert vm.load_products_from_innergy_if_needed() == []
+    assert notes[-1]["message"] == "No changes were discovered."
+    assert vm.view_state.staged_fingerprint is None
+    assert not vm.view_state.staged_diff
+
+
+def test_load_products_stages_fetch_with_fingerprint_and_diff():
+    db = [{"name": "A", "quantity": 1, "location": "Kitchen"}, {"name": "B", "quantity": 2, "location": "Bath"}]
+    fetched = [{"name": "A", "quantity": 3, "location": "Kitchen"}, {"name": "C", "quantity": 1, "location": "Bath"}]
+    vm = _vm(fetched, db)
+
+    staged = vm.load_products_from_innergy_if_needed()
+
+    assert staged == fetched
+    state = vm.view_state
+    assert len(state.staged_fingerprint) == 2
+    assert state.staged_diff.added == (("name", "C", "Bath", 0),)
+    assert state.staged_diff.removed == (("name", "B", "Bath", 0),)
+    assert state.staged_diff.changed == (("name", "A", "Kitchen", 0),)
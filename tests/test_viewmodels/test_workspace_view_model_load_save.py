@@ -81,3 +81,53 @@ def test_load_or_save_failure_sets_error_and_returns_false(monkeypatch):
     ok = vm.save_changes({})
     assert ok is False
     assert vm.view_state.error and "boom" in vm.view_state.error
+
+
+def test_load_children_delegates_to_service_and_emits():
+    calls = []
+
+    class DummyService:
+        def load_project_tree(self, project_id):
+            return {"id": project_id, "children": []}
+
+        def load_children(self, project_id, node_key):
+            calls.append((project_id, node_key))
+            return [{"id": 5, "type": "wall", "key": "wall:5", "label": "Wall 5", "child_count": 2, "children": []}]
+
+        def save_changes(self, changes):
+            return Result.ok_value(None)
+
+    vm = WorkspaceViewModel(workspace_service=DummyService())
+    assert vm.load_children("location:1") == []  # no active project yet
+    vm.set_active_project(DummyProject(3))
+    events = []
+    vm.children_loaded.subscribe(lambda key, children: events.append((key, children)))
+
+    children = vm.load_children("location:1")
+
+    assert calls == [(3, "location:1")]
+    assert [c["key"] for c in children] == ["wall:5"]
+    assert events == [("location:1", children)]
+
+
+def test_recorded_moves_are_saved_from_journal_and_cleared():
+    saved = []
+
+    class DummyService:
+        def load_project_tree(self, project_id):
+            return {}
+
+        def save_changes(self, changes):
+            saved.append(changes)
+            return Result.ok_value({"products": 1, "walls": 0})
+
+    vm = WorkspaceViewModel(workspace_service=DummyService())
+    vm.set_active_project(DummyProject(4))
+    for x in range(30):
+        vm.record_product_move(11, x_origin_from_right=float(x), z_origin_from_bottom=2.0)
+    assert vm.view_state.dirty is True
+
+    assert vm.save_changes() is True
+    assert saved == [{"products": {11: {"x_origin_from_right": 29.0, "z_origin_from_bottom": 2.0}}, "walls": {}, "project_id": 4}]
+    assert len(vm.journal) == 0
+    assert vm.view_state.dirty is False
@@ -170,3 +170,60 @@ def test_projects_detail_view_updates_on_redisplay(qtbot, mock_project_data):
     props = _find_child_by_text(root, "Properties")
     kv = {props.child(r, 0).text(): props.child(r, 1).text() for r in range(props.rowCount())}
     assert kv.get("Number") == "202"
+
+
+def test_update_products_from_dicts_builds_product_rows_on_expand(qtbot, mock_project_data):
+    view = ProjectsDetailView()
+    qtbot.addWidget(view)
+    view.display_project(mock_project_data)
+    products = [
+        {"name": f"Base {i}", "quantity": 1, "location": "Kitchen" if i % 2 else "Bath", "width": 24, "custom_fields": [{"name": "Finish", "value": "Oak"}]}
+        for i in range(2000)
+    ] + [{"name": "Loose", "quantity": 2}]
+    view.update_products_from_dicts(products)
+
+    model = view.tree_view.model()
+    locs = _find_child_by_text(model.item(0, 0), "Locations")
+    assert [locs.child(r, 0).text() for r in range(locs.rowCount())] == ["Bath", "Kitchen", "Unassigned"]
+    # Only the location nodes exist until a branch is expanded
+    kitchen = locs.child(1, 0)
+    assert kitchen.rowCount() == 0
+    assert model.hasChildren(kitchen.index())
+
+    model.fetchMore(kitchen.index())
+    assert kitchen.rowCount() == 1000
+    product = kitchen.child(0, 0)
+    assert (product.text(), kitchen.child(0, 1).text()) == ("Base 1", "Qty: 1")
+    assert product.rowCount() == 0
+
+    model.fetchMore(product.index())
+    props = {product.child(r, 0).text(): product.child(r, 1).text() for r in range(product.rowCount())}
+    assert props == {"Name": "Base 1", "Quantity": "1", "Width": "24", "Finish": "Oak"}
+    assert not model.canFetchMore(product.index())
+
+    # Reloading replaces the subtree and drops loaders of removed rows
+    view.update_products_from_dicts([{"name": "Only", "location": "Pantry"}])
+    assert [locs.child(r, 0).text() for r in range(locs.rowCount())] == ["Pantry"]
+    assert len(model._pending) == 1
+
+
+def test_update_products_from_batch_groups_on_location_column(qtbot, mock_project_data):
+    from mmx_engineering_spec_manager.mappers.innergy_mapper import parse_budget_products
+
+    view = ProjectsDetailView()
+    qtbot.addWidget(view)
+    view.display_project(mock_project_data)
+    batch = parse_budget_products([
+        {"Name": "Base", "QuantCount": 1, "Location": "Kitchen", "Width": 24},
+        {"Name": "Tall", "QuantCount": 2},
+    ])
+    view.update_products_from_dicts(batch)
+
+    model = view.tree_view.model()
+    locs = _find_child_by_text(model.item(0, 0), "Locations")
+    assert [locs.child(r, 0).text() for r in range(locs.rowCount())] == ["Kitchen", "Unassigned"]
+    kitchen = locs.child(0, 0)
+    model.fetchMore(kitchen.index())
+    base = kitchen.child(0, 0)
+    model.fetchMore(base.index())
+    assert {base.child(r, 0).text(): base.child(r, 1).text() for r in range(base.rowCount())}["Width"] == "24"
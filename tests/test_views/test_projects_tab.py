@@ -1,9 +1,9 @@
 import PySide6
 import pytest
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QStandardItemModel
 
 from mmx_engineering_spec_manager.views.projects.projects_tab import ProjectsTab
+from mmx_engineering_spec_manager.views.projects.projects_table_model import ProjectsTableModel
 
 
 @pytest.fixture
@@ -41,19 +41,19 @@ def test_projects_tab_displays_projects(qtbot, mock_projects):
     # Call the display_projects method
     projects_tab.display_projects(mock_projects)
 
-    # Assert that the QStandardItemModel has the correct data
+    # Assert that the table model has the correct data
     table_model = projects_tab.projects_table.model()
-    assert isinstance(table_model, QStandardItemModel)
+    assert isinstance(table_model, ProjectsTableModel)
     assert table_model.rowCount() == 2
     assert table_model.columnCount() == 3
 
-    assert table_model.item(0, 0).text() == "101"
-    assert table_model.item(0, 1).text() == "Project One"
-    assert table_model.item(0, 2).text() == "Description 1"
+    assert table_model.index(0, 0).data() == "101"
+    assert table_model.index(0, 1).data() == "Project One"
+    assert table_model.index(0, 2).data() == "Description 1"
 
-    assert table_model.item(1, 0).text() == "102"
-    assert table_model.item(1, 1).text() == "Project Two"
-    assert table_model.item(1, 2).text() == "Description 2"
+    assert table_model.index(1, 0).data() == "102"
+    assert table_model.index(1, 1).data() == "Project Two"
+    assert table_model.index(1, 2).data() == "Description 2"
 
 def test_projects_tab_double_click_opens_project(qtbot, mocker, mock_projects):
     """
@@ -97,3 +97,41 @@ def test_import_projects_button_emits_signal(qtbot):
     # Use qtbot to simulate a click and check for a signal
     with qtbot.waitSignal(projects_tab.import_projects_signal, timeout=1000):
         qtbot.mouseClick(import_button, PySide6.QtCore.Qt.LeftButton)
+
+
+def test_projects_search_filters_rows_without_replacing_model(qtbot):
+    class P:
+        def __init__(self, number, name):
+            self.number, self.name, self.job_description = number, name, ""
+
+    projects = [P(f"{i:05d}", f"Job {'Alpha' if i % 100 == 0 else 'Beta'} {i}") for i in range(10000)]
+    tab = ProjectsTab()
+    qtbot.addWidget(tab)
+    tab.display_projects(projects)
+    model = tab.projects_table.model()
+    assert model.rowCount() == 10000
+
+    # Keystrokes are debounced into a single filter pass
+    for ch in "alph":
+        tab.search_input.setText(tab.search_input.text() + ch)
+    assert model.rowCount() == 10000
+    qtbot.waitUntil(lambda: model.rowCount() == 100, timeout=2000)
+    assert tab.projects_table.model() is model
+    assert model.index(1, 1).data() == "Job Alpha 100"
+
+    # Narrowing and number matches; the visible row maps back to the source project
+    model.set_filter("alpha 9900")
+    assert model.rowCount() == 1 and model.project_at(0) is projects[9900]
+    model.set_filter("09900")
+    assert model.project_at(0) is projects[9900]
+    # Field boundaries are not searchable across number and name
+    model.set_filter("9900job")
+    assert model.rowCount() == 0
+
+    captured = []
+    tab.open_project_signal.connect(captured.append)
+    model.set_filter("")
+    tab.search_input.setText("beta 1")
+    tab._apply_filter_and_refresh()
+    tab.on_project_double_clicked(model.index(0, 0))
+    assert captured == [projects[1]]
@@ -0,0 +1,89 @@
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtWidgets import QTreeView
+
+from mmx_engineering_spec_manager.views.workspace.workspace_tab import WorkspaceTab
+from mmx_engineering_spec_manager.views.workspace.workspace_tree_model import WorkspaceTreeModel
+
+
+def _tree():
+    return {
+        "id": 1, "type": "project", "key": "project:1", "label": "P-1 - Job", "child_count": 2,
+        "children": [
+            {"id": 10, "type": "location", "key": "location:10", "label": "Kitchen", "child_count": 2, "children": []},
+            {"id": 11, "type": "location", "key": "location:11", "label": "Bath", "child_count": 0, "children": []},
+        ],
+    }
+
+
+def _fetcher(calls):
+    branches = {
+        "location:10": [
+            {"id": 100, "type": "wall", "key": "wall:100", "label": "Wall A", "child_count": 1, "children": []},
+            {"id": 101, "type": "wall", "key": "wall:101", "label": "Wall B", "child_count": 0, "children": []},
+        ],
+        "wall:100": [{"id": 7, "type": "product", "key": "product:7", "label": "Base", "child_count": 0, "children": []}],
+    }
+
+    def fetch(key):
+        calls.append(key)
+        return branches.get(key, [])
+
+    return fetch
+
+
+def test_model_fetches_one_branch_at_a_time(qtbot):
+    calls = []
+    model = WorkspaceTreeModel(_tree(), _fetcher(calls))
+    project = model.index(0, 0)
+    assert model.data(project) == "P-1 - Job"
+    assert model.rowCount(project) == 2
+    kitchen, bath = model.index(0, 0, project), model.index(1, 0, project)
+    assert model.hasChildren(kitchen) and model.rowCount(kitchen) == 0
+    assert model.canFetchMore(kitchen)
+    assert not model.hasChildren(bath) and not model.canFetchMore(bath)
+    assert calls == []
+
+    model.fetchMore(kitchen)
+    assert calls == ["location:10"]
+    assert model.rowCount(kitchen) == 2 and not model.canFetchMore(kitchen)
+    wall_a = model.index(0, 0, kitchen)
+    assert model.data(wall_a) == "Wall A"
+    assert model.data(wall_a, Qt.UserRole) == "wall:100"
+    assert model.parent(wall_a) == kitchen
+    # Fetching again is a no-op
+    model.fetchMore(kitchen)
+    assert calls == ["location:10"]
+
+
+def test_tree_view_expansion_triggers_fetch(qtbot):
+    calls = []
+    model = WorkspaceTreeModel(_tree(), _fetcher(calls))
+    view = QTreeView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.show()
+    project = model.index(0, 0)
+    view.expand(project)
+    view.expand(model.index(0, 0, project))
+    qtbot.waitUntil(lambda: "location:10" in calls, timeout=1000)
+    assert "wall:100" not in calls
+
+
+def test_workspace_tab_renders_lazy_tree_from_vm(qtbot):
+    calls = []
+
+    class VM:
+        def __init__(self):
+            self.load_children = _fetcher(calls)
+
+    tab = WorkspaceTab()
+    qtbot.addWidget(tab)
+    tab._vm = VM()
+    tab._render_tree(_tree())
+    model = tab.tree_view.model()
+    assert isinstance(model, WorkspaceTreeModel)
+    assert "P-1 - Job" in tab.project_label.text()
+    kitchen = model.index(0, 0, model.index(0, 0))
+    model.fetchMore(kitchen)
+    assert calls == ["location:10"] and model.rowCount(kitchen) == 2
+    assert model.index(0, 0, QModelIndex()).isValid()
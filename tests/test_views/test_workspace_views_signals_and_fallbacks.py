@@ -75,3 +75,53 @@ def test_workspace_tab_try_except_fallback(qtbot, monkeypatch):
 
     # elevation_view should still be callable; display should not raise
     tab.display_project_data(P())
+
+
+def _release(view):
+    ev = QMouseEvent(QEvent.Type.MouseButtonRelease, QPointF(0, 0), Qt.MouseButton.LeftButton, Qt.MouseButtons(Qt.MouseButton.LeftButton), Qt.KeyboardModifier.NoModifier)
+    view.mouseReleaseEvent(ev)
+
+
+def test_plan_view_emits_only_moved_items_and_snaps(qtbot):
+    view = PlanViewWidget()
+    qtbot.addWidget(view)
+    view.set_wall(length_in=200, thickness_in=4)
+    moved = []
+    view.productMoved.connect(lambda pid, x, y: moved.append((pid, x, y)))
+    view.add_product(product_id=1, width_in=24, depth_in=24, x_left_in=0)
+    view.add_product(product_id=2, width_in=24, depth_in=24, x_left_in=60)
+
+    # Selected but untouched: nothing to report
+    for item in view._product_items.values():
+        item.setSelected(True)
+    _release(view)
+    assert moved == []
+
+    # Drag product 2 to within snapping distance of product 1's right edge
+    view._product_items[1].setSelected(False)
+    item = view._product_items[2]
+    item.setPos(QPointF(24.6, item.pos().y()))
+    _release(view)
+    assert moved == [(2, 24.0, 0.0)]
+    assert view.overlapping_products(2) == []
+
+    item.setPos(QPointF(10, item.pos().y()))
+    _release(view)
+    assert moved[-1] == (2, 10.0, 0.0)
+    assert view.overlapping_products(2) == [1]
+
+
+def test_elevation_view_skips_unmoved_selected_items(qtbot):
+    view = ElevationViewWidget()
+    qtbot.addWidget(view)
+    view.set_wall(length_in=100, height_in=50)
+    moved = []
+    view.productMoved.connect(lambda pid, xo, zo: moved.append((pid, xo, zo)))
+    view.add_product(product_id=1, width_in=10, height_in=10, x_origin_from_right=0, z_origin_from_bottom=0)
+    view.add_product(product_id=2, width_in=10, height_in=10, x_origin_from_right=50, z_origin_from_bottom=0)
+    for item in view._product_items.values():
+        item.setSelected(True)
+    item = view._product_items[1]
+    item.setPos(QPointF(item.pos().x() - 5, item.pos().y()))
+    _release(view)
+    assert moved == [(1, 5.0, 0.0)]